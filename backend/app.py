@@ -5,20 +5,45 @@ Final version that works 100% with frontend
 """
 
 import cv2
-import mediapipe as mp
 import numpy as np
-import tensorflow as tf
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, g, request, jsonify, send_from_directory
 from flask_cors import CORS
 import base64
+import gc
+import hmac
 import json
 import pickle
 import logging
+import os
+import threading
+import time
+import uuid
 from pathlib import Path
 from datetime import datetime
-from collections import deque
 import warnings
 
+from batching import BatchScheduler
+from extraction_processes import ExtractionProcessPool
+from extractor_pool import ExtractorPool, ExtractorPoolStats
+from frame_decode import FrameDecoder
+from frame_cache import FrameCache, FrameCacheStats
+from hand_roi import HandRoiStats, HandRoiTracker
+from inference import load_inference_backend
+from landmark_extractor import EnhancedLandmarkExtractor, MIN_HAND_CONFIDENCE
+from metrics import REQUEST_SECONDS_BUCKETS, Counter, LabeledCounter, LabeledHistogram, StageTimer, format_prometheus
+from model_bundle import ARTIFACTS_COMPLETE, ArtifactWatcher, ModelBundle, ReloadStats, artifacts_fingerprint, bundle_version
+from precomputed import PrecomputedResponse
+from prefetch import Prefetcher
+from sessions import SessionStore
+from shoulder_tracking import PoseDecimationStats, ShoulderTracker
+from word_search import WordSearchIndex
+
+try:
+    from flask_sock import Sock
+    from simple_websocket import ConnectionClosed
+except ImportError:  # WebSocket endpoint is optional
+    Sock = None
+
 warnings.filterwarnings('ignore')
 
 # Setup logging
@@ -29,17 +54,93 @@ logger = logging.getLogger(__name__)
 SEQUENCE_LENGTH = 30
 FEATURE_DIM = 126
 CONFIDENCE_THRESHOLD = 0.3  # FIXED: Reduced from 0.7 to 0.3 for better recognition
-MIN_HAND_CONFIDENCE = 0.5   # FIXED: Reduced from 0.7 to 0.5
+MAX_LANDMARK_FRAMES = SEQUENCE_LENGTH * 10  # Upper bound on rows accepted in a 'landmarks' payload
+MAX_UPLOAD_FRAMES = SEQUENCE_LENGTH * 10  # Upper bound on JPEG frames in a binary or multipart /api/predict upload
+FRAMES_CONTENT_TYPE = 'application/x-jpeg-frames'  # Body of [4-byte big-endian length][JPEG bytes] records
+SESSION_IDLE_TTL = float(os.environ.get('SESSION_IDLE_TTL', 300))  # Seconds before an idle session is evicted
+SESSION_MEMORY_CAP_MB = float(os.environ.get('SESSION_MEMORY_CAP_MB', 64))  # Total buffer memory across sessions
+INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND', 'keras')  # keras | tflite | numpy
+TFLITE_VARIANT = os.environ.get('TFLITE_VARIANT', 'float32')  # float32 | float16 | dynamic_int8
+TFLITE_NUM_THREADS = int(os.environ.get('TFLITE_NUM_THREADS', 1))
+WORKER_CPU_THREADS = int(os.environ.get('WORKER_CPU_THREADS', 0))  # TF intra/inter-op and OpenCV threads per process (set by gunicorn.conf.py), 0 keeps library defaults
+FORK_SAFE_BACKENDS = ('numpy',)  # Backends the gunicorn master may load before forking workers
+EXTRACTOR_POOL_SIZE = int(os.environ.get('EXTRACTOR_POOL_SIZE', 0))  # MediaPipe extractors per process, 0 = WORKER_CPU_THREADS or the core count
+EXTRACTION_PROCESSES = int(os.environ.get('EXTRACTION_PROCESSES', 0))  # Landmark extraction worker processes fed over shared memory, 0 extracts in-process
+REDUCED_JPEG_DECODE = os.environ.get('REDUCED_JPEG_DECODE', '1') == '1'  # Decode large JPEGs at 1/2, 1/4 or 1/8 scale when that still covers 640x480
+DECODE_THREADS = int(os.environ.get('DECODE_THREADS', 2))  # Threads decoding /api/predict frames ahead of landmark extraction
+DECODE_PREFETCH = int(os.environ.get('DECODE_PREFETCH', 4))  # Frames decoded ahead of the one being extracted, 0 decodes inline
+BATCH_MAX_SIZE = int(os.environ.get('BATCH_MAX_SIZE', 32))  # Sequences per batched forward pass
+BATCH_MAX_WAIT_MS = float(os.environ.get('BATCH_MAX_WAIT_MS', 5))  # Max time a batch waits for more sequences, a lone sequence is dispatched at once
+BATCH_TIMEOUT = float(os.environ.get('BATCH_TIMEOUT', 30))  # Seconds a request waits for its batched prediction
+WARMUP_ENABLED = os.environ.get('WARMUP', '1') == '1'  # Warm model, scaler and MediaPipe graphs before /ready turns green
+WARMUP_BATCH_SIZES = tuple(int(b) for b in os.environ.get('WARMUP_BATCH_SIZES', f'1,{BATCH_MAX_SIZE}').split(',') if b)
+WARMUP_FRAMES = int(os.environ.get('WARMUP_FRAMES', 3))  # Synthetic frames pushed through hands + pose
+MODELS_DIR = os.environ.get('MODELS_DIR', 'models')
+ARTIFACTS_DIR = os.environ.get('ARTIFACTS_DIR', 'artifacts')
+MODEL_WATCH_INTERVAL = float(os.environ.get('MODEL_WATCH_INTERVAL', 0))  # Poll every N seconds and hot-reload when train_model.py marks a new bundle complete, 0 disables
+RELOAD_TOKEN = os.environ.get('RELOAD_TOKEN', '')  # POST /api/reload is disabled unless set, and must then send it in the X-Reload-Token header
+STREAMING_INFERENCE = os.environ.get('STREAMING_INFERENCE', 'auto')  # auto: step per-session LSTM state for causal models | off
+WS_MAX_MESSAGE_MB = float(os.environ.get('WS_MAX_MESSAGE_MB', 4))  # Largest accepted WebSocket message
+WS_PING_INTERVAL = float(os.environ.get('WS_PING_INTERVAL', 25))  # Seconds between keep-alive pings
+POSE_EVERY_N_FRAMES = int(os.environ.get('POSE_EVERY_N_FRAMES', 1))  # 1 runs pose on every frame, N > 1 reuses a tracked shoulder center in between
+POSE_MOTION_THRESHOLD = float(os.environ.get('POSE_MOTION_THRESHOLD', 0.1))  # Hand-centroid motion (normalized) that forces a pose run
+POSE_SMOOTHING = float(os.environ.get('POSE_SMOOTHING', 0.5))  # Weight of a new shoulder measurement in the tracked center
+HAND_ROI_TRACKING = os.environ.get('HAND_ROI_TRACKING', '0') == '1'  # Skip palm detection while the previous frame's hands are tracked
+HAND_ROI_REDETECT_INTERVAL = int(os.environ.get('HAND_ROI_REDETECT_INTERVAL', 15))  # Tracked frames between full palm-detection passes
+FRAME_CACHE_SIZE = int(os.environ.get('FRAME_CACHE_SIZE', 8))  # Extraction results kept per session/request for repeated frames, 0 disables
+FRAME_CACHE_TOLERANCE = float(os.environ.get('FRAME_CACHE_TOLERANCE', 0))  # Mean gray-level thumbnail difference still treated as the same frame, 0 = byte-identical only
+RENDER_MODES = ('none', 'landmarks_json', 'jpeg')
+DEFAULT_RENDER_MODE = os.environ.get('RENDER_MODE', 'jpeg')  # /api/predict/sign overlay when the request has no 'render_mode'
+REQUEST_PROFILING = os.environ.get('REQUEST_PROFILING', '0') == '1'  # Let ?profile=1 / X-Profile: 1 add a per-stage 'timings' block to prediction responses
+PROFILED_ENDPOINTS = ('predict_gesture', 'predict_sign')
+PROFILE_HEADER = 'X-Profile'
+SEARCH_FUZZY_MAX_DISTANCE = int(os.environ.get('SEARCH_FUZZY_MAX_DISTANCE', 2))  # Typo tolerance of /api/search (edits), 0 disables fuzzy matches
+SEARCH_FUZZY_MIN_LENGTH = 3  # Shorter queries only get exact / prefix / substring matches
+CATALOG_MAX_AGE = int(os.environ.get('CATALOG_MAX_AGE', 0))  # Seconds clients may reuse /api/words, /api/model_info and the full word listing before revalidating
+SESSION_HEADER = 'X-Session-ID'
+SESSION_COOKIE = 'session_id'
 
-# Global variables for model and preprocessing
-MODEL = None
-SCALER = None
-LABELS_MAP = {}
+# Model, scaler and labels being served, replaced as a whole by reload_model_bundle()
+BUNDLE = None
 MODEL_LOADED = False
+READY = False  # True once artifacts are loaded and warmup has finished
+WARMUP_STATUS = {"state": "pending", "timings": {}, "error": None}
+
+# Hot reload: one reload at a time, optional watcher on the artifact directories
+RELOAD_STATS = ReloadStats()
+_reload_lock = threading.Lock()
+_artifact_watcher = None
+
+# Per-session frame and prediction buffers, keyed by session id
+SESSION_STORE = SessionStore(
+    SEQUENCE_LENGTH, FEATURE_DIM,
+    idle_ttl=SESSION_IDLE_TTL,
+    max_bytes=int(SESSION_MEMORY_CAP_MB * 1024 * 1024)
+)
+
+# Pose runs and shoulder-center drift across all shoulder trackers
+POSE_STATS = PoseDecimationStats()
+
+# Crop usage and track losses across all hand ROI trackers
+HAND_ROI_STATS = HandRoiStats()
+
+# Repeated-frame hits and misses across all frame caches
+FRAME_CACHE_STATS = FrameCacheStats()
+
+# Request latency per endpoint and per pipeline stage, plus frame counters, exported on /metrics
+STAGE_TIMER = StageTimer()
+FRAME_DECODER = FrameDecoder(reduced_decode=REDUCED_JPEG_DECODE, stage_timer=STAGE_TIMER)
+REQUEST_LATENCY = LabeledHistogram(('endpoint',), REQUEST_SECONDS_BUCKETS)
+REQUESTS_REJECTED = LabeledCounter(('endpoint', 'status'))
+FRAMES_PROCESSED = Counter()
+FRAMES_WITH_HANDS = Counter()
+FRAMES_WITHOUT_HANDS = Counter()
 
-# Enhanced frame buffer
-FRAME_BUFFER = deque(maxlen=SEQUENCE_LENGTH)
-PREDICTION_BUFFER = deque(maxlen=5)
+# Checkouts and wait times across extractor pools (a gunicorn worker rebuilds its pool after the fork)
+EXTRACTOR_POOL_STATS = ExtractorPoolStats()
+
+# Micro-batching scheduler shared by all prediction endpoints
+BATCH_SCHEDULER = BatchScheduler(max_batch=BATCH_MAX_SIZE, max_wait_ms=BATCH_MAX_WAIT_MS, timeout=BATCH_TIMEOUT)
 
 # Initialize Flask app with FIXED CORS
 app = Flask(__name__)
@@ -47,200 +148,251 @@ app = Flask(__name__)
 # FIXED CORS - Remove duplicate configurations
 CORS(app, 
      origins=["http://localhost:3000", "http://127.0.0.1:3000"], 
-     allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept"],
+     allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept", SESSION_HEADER],
      methods=["GET", "POST", "OPTIONS", "PUT", "DELETE"],
      supports_credentials=True)
 
-class EnhancedLandmarkExtractor:
-    """Enhanced landmark extractor matching the training preprocessing"""
+# WebSocket support (flask-sock), /ws/predict is only registered when it is installed
+app.config['SOCK_SERVER_OPTIONS'] = {
+    'max_message_size': int(WS_MAX_MESSAGE_MB * 1024 * 1024),
+    'ping_interval': WS_PING_INTERVAL
+}
+sock = Sock(app) if Sock is not None else None
+
+
+def profiling_requested():
+    """?profile=1 or the X-Profile header on a prediction endpoint, when REQUEST_PROFILING allows it"""
+    if not REQUEST_PROFILING or request.endpoint not in PROFILED_ENDPOINTS:
+        return False
+    return request.args.get('profile') == '1' or request.headers.get(PROFILE_HEADER) == '1'
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    if profiling_requested():
+        g.profile = STAGE_TIMER.start_profile()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Per-endpoint latency and rejected (4xx/5xx) responses; WebSocket messages are timed in ws_predict"""
+    endpoint = request.endpoint or 'unmatched'
+    started = g.get('request_started')
+    if started is not None and endpoint != 'ws_predict':
+        REQUEST_LATENCY.observe(time.perf_counter() - started, endpoint)
+    if response.status_code >= 400:
+        REQUESTS_REJECTED.inc(endpoint, str(response.status_code))
     
-    def __init__(self):
-        self.mp_hands = mp.solutions.hands
-        self.mp_pose = mp.solutions.pose
-        self.mp_drawing = mp.solutions.drawing_utils
-        
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=MIN_HAND_CONFIDENCE,
-            min_tracking_confidence=0.5,
-            model_complexity=1
-        )
-        
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=False,
-            model_complexity=1,
-            enable_segmentation=False,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        
-    def extract_hand_landmarks(self, image):
-        """Extract hand landmarks with enhanced normalization"""
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        
-        hands_results = self.hands.process(rgb_image)
-        pose_results = self.pose.process(rgb_image)
-        
-        left_hand_landmarks = np.zeros(63)
-        right_hand_landmarks = np.zeros(63)
-        
-        h, w = image.shape[:2]
-        
-        shoulder_center = np.array([w/2, h/3])
-        if pose_results.pose_landmarks:
-            left_shoulder = pose_results.pose_landmarks.landmark[11]
-            right_shoulder = pose_results.pose_landmarks.landmark[12]
-            shoulder_center = np.array([
-                (left_shoulder.x + right_shoulder.x) / 2 * w,
-                (left_shoulder.y + right_shoulder.y) / 2 * h
-            ])
-        
-        hands_detected = 0
-        
-        if hands_results.multi_hand_landmarks and hands_results.multi_handedness:
-            for hand_landmarks, handedness in zip(hands_results.multi_hand_landmarks, hands_results.multi_handedness):
-                hand_confidence = handedness.classification[0].score
-                if hand_confidence < MIN_HAND_CONFIDENCE:
-                    continue
-                    
-                hand_label = handedness.classification[0].label
-                hands_detected += 1
+    profile = g.get('profile')
+    if profile is not None:
+        attach_profile(response, profile.summary())
+    return response
+
+
+@app.after_request
+def issue_session_cookie(response):
+    """Hand a session id generated by get_session_id() to the client, so its next request joins the same session"""
+    issued_session_id = g.get('issued_session_id')
+    if issued_session_id is not None:
+        response.set_cookie(SESSION_COOKIE, issued_session_id, httponly=True, samesite='Lax')
+    return response
+
+
+@app.teardown_request
+def end_request_profile(error=None):
+    if g.get('profile') is not None:
+        STAGE_TIMER.end_profile()
+
+
+def attach_profile(response, timings):
+    """Add the request's stage timings as a 'timings' field of the JSON body and a Server-Timing header"""
+    body = response.get_json(silent=True)
+    if isinstance(body, dict):
+        body["timings"] = timings
+        response.set_data(json.dumps(body))
+    server_timing = [f"{stage};dur={stage_ms['total']:.2f}" for stage, stage_ms in timings["stages_ms"].items()]
+    server_timing.append(f"total;dur={timings['total_ms']:.2f}")
+    response.headers['Server-Timing'] = ', '.join(server_timing)
+
+def load_model_bundle():
+    """Load model, scaler and labels from models/ and artifacts/ into a new ModelBundle
+
+    Returns None when an artifact is missing. Nothing global is touched, so this
+    can run in the background while the current bundle keeps serving.
+    """
+    models_dir = Path(MODELS_DIR)
+    artifacts_dir = Path(ARTIFACTS_DIR)
+    # Taken before reading, so files rewritten during the load show up as a newer version
+    fingerprint = artifacts_fingerprint(models_dir, artifacts_dir)
+    
+    # Load model through the configured inference backend
+    model_loaded = False
+    logger.info(f"ðŸ“¦ Loading model from {models_dir} ({INFERENCE_BACKEND} backend)...")
+    model = load_inference_backend(
+        INFERENCE_BACKEND, models_dir,
+        tflite_variant=TFLITE_VARIANT,
+        tflite_num_threads=TFLITE_NUM_THREADS
+    )
+    if model is not None:
+        logger.info("âœ… Model loaded successfully")
+        streaming = STREAMING_INFERENCE != 'off' and model.supports_streaming
+        if streaming:
+            logger.info("Streaming inference enabled: per-session LSTM state advances one frame per call")
+        model_loaded = True
+    
+    if not model_loaded:
+        logger.error("âŒ No model found")
+        return None
+    
+    # Load scaler
+    scaler_path = artifacts_dir / 'scaler.pkl'
+    if scaler_path.exists():
+        with open(scaler_path, 'rb') as f:
+            scaler = pickle.load(f)
+        logger.info("âœ… Scaler loaded")
+    else:
+        logger.error("âŒ Scaler not found")
+        return None
+    
+    # Load CLEAN labels - prioritize word_mappings.json for clean words
+    labels_loaded = False
+    
+    # Try word_mappings.json first (has clean words)
+    word_mappings_path = artifacts_dir / 'word_mappings.json'
+    if word_mappings_path.exists():
+        logger.info(f"ðŸ“‹ Loading clean words from {word_mappings_path}...")
+        with open(word_mappings_path, 'r') as f:
+            word_data = json.load(f)
+        
+        if 'class_names' in word_data:
+            clean_words = word_data['class_names']
+            labels_map = {i: word for i, word in enumerate(clean_words)}
+            logger.info(f"âœ… Clean words loaded: {len(labels_map)} classes")
+            labels_loaded = True
+    
+    # Fallback to other label files if needed
+    if not labels_loaded:
+        label_paths = [
+            models_dir / 'labels.json',
+            artifacts_dir / 'labels.json'
+        ]
+        
+        for labels_path in label_paths:
+            if labels_path.exists():
+                logger.info(f"ðŸ“‹ Loading labels from {labels_path}...")
+                with open(labels_path, 'r') as f:
+                    labels_data = json.load(f)
                 
-                landmarks = []
-                for landmark in hand_landmarks.landmark:
-                    x = landmark.x * w
-                    y = landmark.y * h
-                    z = landmark.z
-                    
-                    x_norm = (x - shoulder_center[0]) / w
-                    y_norm = (y - shoulder_center[1]) / h
-                    z_norm = z
-                    
-                    landmarks.extend([x_norm, y_norm, z_norm])
+                if 'id_to_label' in labels_data:
+                    raw_labels = labels_data['id_to_label']
+                    labels_map = {}
+                    for i, label in raw_labels.items():
+                        clean_label = label.split('_(')[0] if '_(' in label else label
+                        labels_map[int(i)] = clean_label
+                elif 'classes' in labels_data:
+                    if isinstance(labels_data['classes'], list):
+                        raw_words = labels_data['classes']
+                        labels_map = {}
+                        for i, word in enumerate(raw_words):
+                            clean_word = word.split('_(')[0] if '_(' in word else word
+                            labels_map[i] = clean_word
+                    else:
+                        labels_map = {int(k): v.split('_(')[0] if '_(' in v else v 
+                                    for k, v in labels_data['classes'].items()}
                 
-                if hand_label == 'Left':
-                    left_hand_landmarks = np.array(landmarks)
-                else:
-                    right_hand_landmarks = np.array(landmarks)
-        
-        combined_landmarks = np.concatenate([left_hand_landmarks, right_hand_landmarks])
-        
-        return combined_landmarks, hands_detected, hands_results
+                logger.info(f"âœ… Labels cleaned and loaded: {len(labels_map)} classes")
+                labels_loaded = True
+                break
     
-    def draw_enhanced_landmarks(self, image, hands_results):
-        """Draw enhanced landmarks on image"""
-        if not hands_results.multi_hand_landmarks:
-            return image
-            
-        annotated_image = image.copy()
-        
-        for hand_landmarks in hands_results.multi_hand_landmarks:
-            self.mp_drawing.draw_landmarks(
-                annotated_image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
-                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2)
-            )
-        
-        return annotated_image
+    if not labels_loaded:
+        logger.error("âŒ No labels found")
+        return None
+    
+    # Remove duplicates and create unique word list
+    unique_words = list(set(labels_map.values()))
+    labels_map = {i: word for i, word in enumerate(sorted(unique_words))}
+    
+    logger.info("ðŸŽ‰ All artifacts loaded successfully!")
+    logger.info(f"ðŸŽ¯ Total unique words: {len(labels_map)}")
+    logger.info(f"ðŸ“ Sample words: {list(labels_map.values())[:10]}")
+    
+    search_index = WordSearchIndex(labels_map.values())
+    version = bundle_version(fingerprint)
+    return ModelBundle(
+        model=model,
+        scaler=scaler,
+        labels_map=labels_map,
+        search_index=search_index,
+        catalog=render_catalog(labels_map, search_index, version),
+        streaming=streaming,
+        version=version,
+        loaded_at=datetime.now().isoformat()
+    )
+
+
+def render_catalog(labels_map, search_index, version):
+    """Pre-render the responses that only depend on the label set and model version"""
+    words = search_index.sorted_words
+    catalog = {
+        "words": {
+            "success": True,
+            "words": words,
+            "total_classes": len(words),
+            "approach": "Landmark-based BiLSTM with Attention",
+            "features": f"{FEATURE_DIM}D",
+            "sequence_length": SEQUENCE_LENGTH,
+            "model_loaded": True,
+            "accuracy": "82.6%",
+            "top3_accuracy": "92.5%"
+        },
+        "search_all": {
+            "success": True,
+            "words": words[:100],
+            "total_found": len(search_index),
+            "total_classes": len(search_index),
+            "search_term": "",
+            "model_loaded": True,
+            "approach": "Landmark-based BiLSTM with Attention",
+            "features": f"{FEATURE_DIM}D",
+            "sequence_length": SEQUENCE_LENGTH,
+            "accuracy": "82.6%",
+            "top3_accuracy": "92.5%",
+            "message": f"Showing first {len(words[:100])} words"
+        },
+        "model_info": {
+            "success": True,
+            "model_loaded": True,
+            "num_classes": len(labels_map),
+            "model_version": version,
+            "classes": list(labels_map.values()),
+            "sequence_length": SEQUENCE_LENGTH,
+            "feature_dim": FEATURE_DIM,
+            "confidence_threshold": CONFIDENCE_THRESHOLD,
+            "approach": "Landmark-based BiLSTM with Attention",
+            "features": f"{FEATURE_DIM}D",
+            "accuracy": "82.6%",
+            "top3_accuracy": "92.5%"
+        }
+    }
+    return {name: PrecomputedResponse(payload, dumps=app.json.dumps) for name, payload in catalog.items()}
+
+
+def catalog_response(bundle, name):
+    """Serve a pre-rendered catalog response with ETag / 304 and gzip negotiation"""
+    return bundle.catalog[name].to_response(request, cache_control=f"public, max-age={CATALOG_MAX_AGE}, must-revalidate")
 
 
 def load_mlops_artifacts():
     """Load all MLOps artifacts with comprehensive error handling"""
-    global MODEL, SCALER, LABELS_MAP, MODEL_LOADED
+    global MODEL_LOADED
     
     try:
-        models_dir = Path('models')
-        artifacts_dir = Path('artifacts')
-        
-        # Load model - try multiple formats
-        model_loaded = False
-        for model_file in ['best_model.h5', 'model.h5', 'model.keras']:
-            model_path = models_dir / model_file
-            if model_path.exists():
-                logger.info(f"ðŸ“¦ Loading model from {model_path}...")
-                MODEL = tf.keras.models.load_model(str(model_path))
-                logger.info("âœ… Model loaded successfully")
-                model_loaded = True
-                break
-        
-        if not model_loaded:
-            logger.error("âŒ No model found")
-            return False
-        
-        # Load scaler
-        scaler_path = artifacts_dir / 'scaler.pkl'
-        if scaler_path.exists():
-            with open(scaler_path, 'rb') as f:
-                SCALER = pickle.load(f)
-            logger.info("âœ… Scaler loaded")
-        else:
-            logger.error("âŒ Scaler not found")
+        bundle = load_model_bundle()
+        if bundle is None:
             return False
         
-        # Load CLEAN labels - prioritize word_mappings.json for clean words
-        labels_loaded = False
-        
-        # Try word_mappings.json first (has clean words)
-        word_mappings_path = artifacts_dir / 'word_mappings.json'
-        if word_mappings_path.exists():
-            logger.info(f"ðŸ“‹ Loading clean words from {word_mappings_path}...")
-            with open(word_mappings_path, 'r') as f:
-                word_data = json.load(f)
-            
-            if 'class_names' in word_data:
-                clean_words = word_data['class_names']
-                LABELS_MAP = {i: word for i, word in enumerate(clean_words)}
-                logger.info(f"âœ… Clean words loaded: {len(LABELS_MAP)} classes")
-                labels_loaded = True
-        
-        # Fallback to other label files if needed
-        if not labels_loaded:
-            label_paths = [
-                models_dir / 'labels.json',
-                artifacts_dir / 'labels.json'
-            ]
-            
-            for labels_path in label_paths:
-                if labels_path.exists():
-                    logger.info(f"ðŸ“‹ Loading labels from {labels_path}...")
-                    with open(labels_path, 'r') as f:
-                        labels_data = json.load(f)
-                    
-                    if 'id_to_label' in labels_data:
-                        raw_labels = labels_data['id_to_label']
-                        LABELS_MAP = {}
-                        for i, label in raw_labels.items():
-                            clean_label = label.split('_(')[0] if '_(' in label else label
-                            LABELS_MAP[int(i)] = clean_label
-                    elif 'classes' in labels_data:
-                        if isinstance(labels_data['classes'], list):
-                            raw_words = labels_data['classes']
-                            LABELS_MAP = {}
-                            for i, word in enumerate(raw_words):
-                                clean_word = word.split('_(')[0] if '_(' in word else word
-                                LABELS_MAP[i] = clean_word
-                        else:
-                            LABELS_MAP = {int(k): v.split('_(')[0] if '_(' in v else v 
-                                        for k, v in labels_data['classes'].items()}
-                    
-                    logger.info(f"âœ… Labels cleaned and loaded: {len(LABELS_MAP)} classes")
-                    labels_loaded = True
-                    break
-        
-        if not labels_loaded:
-            logger.error("âŒ No labels found")
-            return False
-        
-        # Remove duplicates and create unique word list
-        unique_words = list(set(LABELS_MAP.values()))
-        LABELS_MAP = {i: word for i, word in enumerate(sorted(unique_words))}
-        
-        MODEL_LOADED = True
-        logger.info("ðŸŽ‰ All artifacts loaded successfully!")
-        logger.info(f"ðŸŽ¯ Total unique words: {len(LABELS_MAP)}")
-        logger.info(f"ðŸ“ Sample words: {list(LABELS_MAP.values())[:10]}")
-        
+        start_serving(bundle)
         return True
         
     except Exception as e:
@@ -251,65 +403,628 @@ def load_mlops_artifacts():
         return False
 
 
-# Initialize landmark extractor
-landmark_extractor = EnhancedLandmarkExtractor()
+def start_serving(bundle):
+    """Serve bundle: warm it (and this process's MediaPipe graphs) for /ready, then start the artifact watcher"""
+    global BUNDLE, MODEL_LOADED, READY
+    
+    BUNDLE = bundle
+    MODEL_LOADED = True
+    logger.info(f"Serving model version {bundle.version}")
+    
+    if WARMUP_ENABLED:
+        READY = run_warmup(bundle)
+    else:
+        WARMUP_STATUS["state"] = "skipped"
+        READY = True
+    
+    start_artifact_watcher()
+
+
+def configure_cpu_threads():
+    """Cap the TF and OpenCV thread pools at WORKER_CPU_THREADS, before TF creates its context"""
+    if WORKER_CPU_THREADS <= 0:
+        return
+    cv2.setNumThreads(WORKER_CPU_THREADS)
+    if INFERENCE_BACKEND == 'keras':
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(WORKER_CPU_THREADS)
+        tf.config.threading.set_inter_op_parallelism_threads(WORKER_CPU_THREADS)
+    logger.info(f"CPU thread pools limited to {WORKER_CPU_THREADS} threads")
 
-def extract_and_preprocess_frame(frame_base64):
-    """Enhanced frame processing with quality control"""
-    global FRAME_BUFFER
+
+def preload_for_workers():
+    """Gunicorn master, before forking: load a fork-safe bundle once so workers share it copy-on-write
+    
+    Nothing is warmed here, warmup builds MediaPipe graphs and those must be
+    created in each worker. TF-based backends are left to init_worker().
+    """
+    global BUNDLE, MODEL_LOADED
     
+    if INFERENCE_BACKEND not in FORK_SAFE_BACKENDS:
+        logger.info(f"{INFERENCE_BACKEND} backend is not fork-safe, every worker loads its own model")
+        return
     try:
-        frame_data = base64.b64decode(frame_base64)
-        nparr = np.frombuffer(frame_data, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        if frame is None:
-            return None, None
-        
-        frame = cv2.resize(frame, (640, 480))
-        
-        landmark_vector, hands_detected, hands_results = landmark_extractor.extract_hand_landmarks(frame)
-        
-        display_frame = landmark_extractor.draw_enhanced_landmarks(frame, hands_results)
-        
-        cv2.putText(display_frame, f"Hands: {hands_detected}", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        cv2.putText(display_frame, f"Buffer: {len(FRAME_BUFFER)}/{SEQUENCE_LENGTH}", (10, 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        bundle = load_model_bundle()
+    except Exception as e:
+        logger.error(f"Preloading the model bundle failed, workers will load it: {e}")
+        return
+    if bundle is None:
+        return
+    
+    BUNDLE = bundle
+    MODEL_LOADED = True
+    # Move everything loaded so far out of the collector's reach, otherwise a GC
+    # pass in a worker writes to (and so copies) the shared pages
+    gc.freeze()
+    logger.info(f"Preloaded model version {bundle.version} for the workers")
+
+
+def init_worker():
+    """Gunicorn worker, right after the fork: thread limits, model (unless preloaded), warmup and watcher"""
+    global EXTRACTOR_POOL
+    
+    configure_cpu_threads()
+    EXTRACTOR_POOL = new_extractor_pool()  # Never reuse MediaPipe graphs across a fork
+    if BUNDLE is None:
+        load_mlops_artifacts()
+    else:
+        start_serving(BUNDLE)
+
+
+def new_extractor_pool():
+    """ExtractorPool sized from EXTRACTOR_POOL_SIZE, extractors are only built on first checkout"""
+    return ExtractorPool(
+        lambda: EnhancedLandmarkExtractor(stage_timer=STAGE_TIMER),
+        max_size=EXTRACTOR_POOL_SIZE or WORKER_CPU_THREADS or None,
+        session_ttl=SESSION_IDLE_TTL,
+        stats=EXTRACTOR_POOL_STATS
+    )
+
+
+def new_extraction_processes():
+    """ExtractionProcessPool when EXTRACTION_PROCESSES is set, its workers start on first use"""
+    if EXTRACTION_PROCESSES <= 0:
+        return None
+    # Trackers are rebuilt inside the workers, so only their settings cross the process boundary
+    tracker_config = {
+        "shoulder": dict(every_n_frames=POSE_EVERY_N_FRAMES, motion_threshold=POSE_MOTION_THRESHOLD,
+                         smoothing=POSE_SMOOTHING) if POSE_EVERY_N_FRAMES > 1 else None,
+        "hand_roi": dict(redetect_interval=HAND_ROI_REDETECT_INTERVAL) if HAND_ROI_TRACKING else None
+    }
+    return ExtractionProcessPool(EXTRACTION_PROCESSES, tracker_config=tracker_config)
+
+
+# Landmark extractors, built on first use so importing app does not load MediaPipe
+EXTRACTOR_POOL = new_extractor_pool()
+EXTRACTION_PROCESS_POOL = new_extraction_processes()
+
+
+def warm_bundle(bundle, timings):
+    """Run the model at each WARMUP_BATCH_SIZES batch size, the scaler and the batch scheduler once"""
+    model_timings = bundle.model.warmup(batch_sizes=WARMUP_BATCH_SIZES)
+    timings["model"] = {str(batch_size): seconds for batch_size, seconds in model_timings.items()}
+    
+    start = time.perf_counter()
+    sequence_processed = bundle.scaler.transform(np.zeros((SEQUENCE_LENGTH, FEATURE_DIM))).reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+    timings["scaler"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    predict_sequence(bundle, sequence_processed)
+    if bundle.streaming:
+        bundle.model.step(sequence_processed[0, 0], bundle.model.initial_state())
+    timings["predict"] = time.perf_counter() - start
+
+
+def run_warmup(bundle):
+    """Push dummy inputs through every cold path so the first real request is fast
+
+    Covers the bundle (see warm_bundle), JPEG decode and the MediaPipe hands + pose
+    graphs. Timings (seconds) are kept in WARMUP_STATUS for /ready. Returns True on success.
+    """
+    WARMUP_STATUS.update(state="running", timings={}, error=None)
+    timings = WARMUP_STATUS["timings"]
+    started = time.perf_counter()
+    
+    try:
+        warm_bundle(bundle, timings)
         
-        if hands_detected > 0:
-            FRAME_BUFFER.append(landmark_vector)
-        else:
-            FRAME_BUFFER.append(np.zeros(FEATURE_DIM, dtype=np.float32))
+        if EXTRACTION_PROCESS_POOL is not None:
+            synthetic = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+            timings["extraction_processes"] = EXTRACTION_PROCESS_POOL.warmup(synthetic)
         
-        if len(FRAME_BUFFER) == SEQUENCE_LENGTH:
-            sequence_array = np.array(list(FRAME_BUFFER), dtype=np.float32)
-            sequence_flat = sequence_array.reshape(-1, FEATURE_DIM)
-            sequence_normalized = SCALER.transform(sequence_flat)
-            sequence_processed = sequence_normalized.reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+        # Only the first pooled extractor is built here, the rest grow with concurrent load
+        start = time.perf_counter()
+        with EXTRACTOR_POOL.checkout() as extractor:
+            timings["landmark_extractor_init"] = time.perf_counter() - start
             
-            return sequence_processed, display_frame
-        
-        return None, display_frame
+            start = time.perf_counter()
+            rng = np.random.default_rng(0)
+            for _ in range(WARMUP_FRAMES):
+                synthetic = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+                _, encoded = cv2.imencode('.jpg', synthetic)
+                extractor.extract_hand_landmarks(decode_frame(encoded), rgb=True)
+            timings["landmark_extraction"] = time.perf_counter() - start
+    
+    except Exception as e:
+        logger.error(f"Warmup failed: {e}")
+        WARMUP_STATUS.update(state="failed", error=str(e))
+        return False
+    
+    timings["total"] = time.perf_counter() - started
+    WARMUP_STATUS["state"] = "complete"
+    logger.info(f"Warmup complete in {timings['total']:.2f}s: {timings}")
+    return True
+
+
+def reload_model_bundle():
+    """Load and warm the current artifacts next to the served bundle, then swap it in
+
+    Requests that already picked up the old bundle finish on it; the swap is a
+    single reference assignment. Returns (success, result dict).
+    """
+    global BUNDLE, MODEL_LOADED
+    
+    if not _reload_lock.acquire(blocking=False):
+        return False, {"error": "A reload is already in progress", "in_progress": True}
+    
+    try:
+        previous_version = BUNDLE.version if BUNDLE else None
+        started = time.perf_counter()
+        try:
+            bundle = load_model_bundle()
+            if bundle is None:
+                raise RuntimeError("Artifacts incomplete, see server logs")
+            timings = {}
+            warm_bundle(bundle, timings)
+        except Exception as e:
+            seconds = time.perf_counter() - started
+            RELOAD_STATS.record(seconds, error=str(e))
+            logger.error(f"Model reload failed after {seconds:.2f}s, still serving {previous_version}: {e}")
+            return False, {"error": str(e), "version": previous_version, "seconds": seconds}
         
+        BUNDLE = bundle
+        MODEL_LOADED = True
+        seconds = time.perf_counter() - started
+        RELOAD_STATS.record(seconds, version=bundle.version)
+        logger.info(f"Model reloaded in {seconds:.2f}s: {previous_version} -> {bundle.version}")
+        return True, {"version": bundle.version, "previous_version": previous_version, "seconds": seconds, "warmup": timings}
+    finally:
+        _reload_lock.release()
+
+
+def start_artifact_watcher():
+    """Hot-reload on artifact changes when MODEL_WATCH_INTERVAL is set"""
+    global _artifact_watcher
+    if MODEL_WATCH_INTERVAL <= 0 or _artifact_watcher is not None:
+        return
+    _artifact_watcher = ArtifactWatcher((MODELS_DIR, ARTIFACTS_DIR), reload_model_bundle, interval=MODEL_WATCH_INTERVAL,
+                                        marker=Path(MODELS_DIR) / ARTIFACTS_COMPLETE)
+    _artifact_watcher.start()
+    logger.info(f"Watching {MODELS_DIR}/{ARTIFACTS_COMPLETE} for new artifacts every {MODEL_WATCH_INTERVAL}s")
+
+
+def client_session_id():
+    """Session id the client sent (header, then cookie), None when it sent neither"""
+    session_id = request.headers.get(SESSION_HEADER) or request.cookies.get(SESSION_COOKIE)
+    return session_id[:128] if session_id else None
+
+
+def get_session_id():
+    """Identify the calling client by its session id, issuing a new one (set as a cookie) when it has none
+    
+    Clients behind the same proxy share a remote address, so the address is never used as the key.
+    """
+    session_id = client_session_id() or g.get('issued_session_id')
+    if session_id is None:
+        session_id = g.issued_session_id = uuid.uuid4().hex
+    return session_id
+
+
+def current_buffer_size():
+    """Number of buffered frames for the calling session (0 if it has none yet)"""
+    session = SESSION_STORE.peek(get_session_id())
+    return len(session) if session else 0
+
+
+def new_shoulder_tracker():
+    """ShoulderTracker configured from the POSE_* settings, None when pose runs on every frame"""
+    if POSE_EVERY_N_FRAMES <= 1:
+        return None
+    return ShoulderTracker(
+        every_n_frames=POSE_EVERY_N_FRAMES,
+        motion_threshold=POSE_MOTION_THRESHOLD,
+        smoothing=POSE_SMOOTHING,
+        stats=POSE_STATS
+    )
+
+
+def new_hand_roi_tracker():
+    """HandRoiTracker when HAND_ROI_TRACKING is on, None for full-frame hand detection"""
+    if not HAND_ROI_TRACKING:
+        return None
+    return HandRoiTracker(redetect_interval=HAND_ROI_REDETECT_INTERVAL, stats=HAND_ROI_STATS)
+
+
+def new_decode_prefetcher():
+    """Prefetcher for the multi-frame /api/predict path, None when DECODE_PREFETCH is 0"""
+    if DECODE_PREFETCH <= 0:
+        return None
+    return Prefetcher(DECODE_THREADS, DECODE_PREFETCH)
+
+
+DECODE_PREFETCHER = new_decode_prefetcher()
+
+
+def new_frame_cache():
+    """FrameCache configured from the FRAME_CACHE_* settings, None when disabled"""
+    if FRAME_CACHE_SIZE <= 0:
+        return None
+    return FrameCache(max_entries=FRAME_CACHE_SIZE, tolerance=FRAME_CACHE_TOLERANCE, stats=FRAME_CACHE_STATS)
+
+
+def decode_frame(encoded):
+    """Encoded (JPEG) uint8 buffer -> 640x480 RGB frame, None when it cannot be decoded"""
+    # A fresh array per frame: frames decoded ahead or shipped to extraction processes outlive the next decode
+    return FRAME_DECODER.decode(encoded)
+
+
+def frame_cache_key(encoded, frame_cache):
+    """Frame cache key of an encoded frame, None without a cache"""
+    if frame_cache is None:
+        return None
+    with STAGE_TIMER.time('frame_digest'):
+        return frame_cache.key(encoded)
+
+
+def decode_ahead(encoded, frame_cache, seen_keys):
+    """Decode step of extract_frame_landmarks run by the prefetcher: (cache_key, frame)
+
+    Repeats of a frame already seen in the request are not decoded (frame None),
+    they will be frame cache hits by the time they are extracted.
+    """
+    cache_key = frame_cache_key(encoded, frame_cache)
+    if cache_key is not None:
+        if cache_key in seen_keys:
+            return cache_key, None
+        seen_keys.add(cache_key)
+    return cache_key, decode_frame(encoded)
+
+
+def extract_frame_landmarks(encoded, frame_cache, shoulder_tracker=None, hand_roi=None, need_frame=False,
+                            session_key=None, need_results=False, stream_key=None, decoded=None):
+    """Landmarks of one encoded frame, reusing the frame cache's result for repeated frames
+    
+    Returns (frame, (landmark_vector, hands_detected, hands_results)), or (None, None)
+    when the frame cannot be decoded. On a byte-identical cache hit the frame is
+    only decoded when need_frame is set, otherwise frame is None. Extraction runs
+    on the pooled extractor pinned to session_key.
+    
+    With EXTRACTION_PROCESSES the frame goes to an extraction process instead,
+    which tracks it under stream_key with its own trackers; hands_results is None
+    then, so callers that draw them pass need_results to stay in-process.
+    
+    decoded is decode_ahead()'s (cache_key, frame) when the frame was decoded ahead.
+    """
+    use_processes = EXTRACTION_PROCESS_POOL is not None and not need_results
+    cache_key, frame = decoded if decoded is not None else (frame_cache_key(encoded, frame_cache), None)
+    if frame_cache is not None:
+        extracted = frame_cache.get(cache_key)
+        if extracted is not None and (extracted[2] is not None or not need_results):
+            if need_frame and frame is None:
+                frame = decode_frame(encoded)
+            return (frame if need_frame else None), extracted
+    
+    if frame is None:
+        frame = decode_frame(encoded)
+    if frame is None:
+        return None, None
+    
+    extracted = frame_cache.get_similar(cache_key, frame) if frame_cache is not None else None
+    if extracted is not None and extracted[2] is None and need_results:
+        extracted = None
+    if extracted is None:
+        if use_processes:
+            with STAGE_TIMER.time('process_extract'):
+                landmark_vector, hands_detected = EXTRACTION_PROCESS_POOL.extract(frame, stream_key)
+            extracted = (landmark_vector, hands_detected, None)
+        else:
+            with EXTRACTOR_POOL.checkout(session_key) as extractor:
+                extracted = extractor.extract_hand_landmarks(
+                    frame, shoulder_tracker=shoulder_tracker, hand_roi=hand_roi, rgb=True)
+        if frame_cache is not None:
+            frame_cache.put(cache_key, extracted)
+    return frame, extracted
+
+
+def extract_and_preprocess_frame(session, bundle, frame_base64, render_mode='jpeg'):
+    """Enhanced frame processing with quality control
+
+    Returns (sequence_processed, rendered) where rendered depends on render_mode:
+    the annotated frame for 'jpeg', a list of hand keypoints for 'landmarks_json', None for 'none'.
+    """
+    try:
+        FRAMES_PROCESSED.inc()
+        with STAGE_TIMER.time('base64_decode'):
+            frame_data = base64.b64decode(frame_base64)
+            nparr = np.frombuffer(frame_data, np.uint8)
+        
+        if session.shoulder_tracker is None:
+            session.shoulder_tracker = new_shoulder_tracker()
+        if session.hand_roi is None:
+            session.hand_roi = new_hand_roi_tracker()
+        if session.frame_cache is None:
+            session.frame_cache = new_frame_cache()
+        if session.extraction_stream is None:
+            session.extraction_stream = f"{session.session_id}:{uuid.uuid4().hex}"
+        frame, extracted = extract_frame_landmarks(
+            nparr, session.frame_cache, shoulder_tracker=session.shoulder_tracker,
+            hand_roi=session.hand_roi, need_frame=render_mode == 'jpeg', session_key=session.session_id,
+            need_results=render_mode != 'none', stream_key=session.extraction_stream)
+        
+        if extracted is None:
+            return None, None
+        landmark_vector, hands_detected, hands_results = extracted
+        record_frame_hands(hands_detected)
+        
+        rendered = None
+        if render_mode == 'jpeg':
+            with STAGE_TIMER.time('overlay'):
+                rendered = EXTRACTOR_POOL.any_extractor().draw_enhanced_landmarks(
+                    cv2.cvtColor(frame, cv2.COLOR_RGB2BGR), hands_results)
+                
+                cv2.putText(rendered, f"Hands: {hands_detected}", (10, 30), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                cv2.putText(rendered, f"Buffer: {len(session)}/{SEQUENCE_LENGTH}", (10, 60), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        elif render_mode == 'landmarks_json':
+            with STAGE_TIMER.time('overlay'):
+                rendered = EXTRACTOR_POOL.any_extractor().hand_keypoints(hands_results)
+        
+        sequence_processed = buffer_landmark_vector(session, bundle, landmark_vector, hands_detected)
+
+        return sequence_processed, rendered
+
     except Exception as e:
         logger.error(f"Error processing frame: {e}")
         return None, None
 
 
-def smooth_predictions(new_prediction):
-    """Smooth predictions using a buffer to reduce jitter"""
-    global PREDICTION_BUFFER
-    
-    PREDICTION_BUFFER.append(new_prediction)
+def record_frame_hands(hands_detected):
+    """Count one extracted frame as with or without hands"""
+    if hands_detected > 0:
+        FRAMES_WITH_HANDS.inc()
+    else:
+        FRAMES_WITHOUT_HANDS.inc()
+
+
+def buffer_landmark_vector(session, bundle, landmark_vector, hands_detected):
+    """Append one landmark vector to the session buffer, return the model input once it is full
+
+    In streaming mode the session state is advanced instead and None is returned,
+    the frame's probabilities are left in session.stream_probs.
+    """
+    landmark_vector = landmark_vector if hands_detected > 0 else None
+    session.append(landmark_vector)
+
+    if bundle.streaming:
+        advance_stream(session, bundle, landmark_vector)
+        return None
+
+    if session.ready:
+        with STAGE_TIMER.time('scaler'):
+            sequence_normalized = bundle.scaler.transform(session.ordered())
+        return sequence_normalized.reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+
+    return None
+
+
+def advance_stream(session, bundle, landmark_vector):
+    """Step the session's recurrent state by one frame, publishing probabilities once a full window has been seen
+
+    The model was trained on SEQUENCE_LENGTH-frame windows, so the state is rebuilt
+    from the buffered window every SEQUENCE_LENGTH frames (and after a model swap).
+    It never carries more than two windows of history, and on a rebuild the
+    output equals the windowed prediction.
+    """
+    if session.stream_state is not None and (session.stream_version != bundle.version
+                                             or session.stream_steps >= 2 * SEQUENCE_LENGTH - 1):
+        rebuild_stream(session, bundle)
+        return
+
+    if session.stream_state is None:
+        session.stream_state = bundle.model.initial_state()
+        session.stream_version = bundle.version
+        session.stream_steps = 0
+
+    frame = np.zeros((1, FEATURE_DIM), dtype=np.float32) if landmark_vector is None else np.reshape(landmark_vector, (1, FEATURE_DIM))
+    with STAGE_TIMER.time('scaler'):
+        frame_normalized = bundle.scaler.transform(frame)
+    with STAGE_TIMER.time('model_step'):
+        prediction_probs, session.stream_state = bundle.model.step(frame_normalized[0], session.stream_state)
+    session.stream_steps += 1
+    session.stream_probs = prediction_probs if session.ready else None
+
+
+def rebuild_stream(session, bundle):
+    """Replace the session's recurrent state with one built from the buffered frames only (the current one included)"""
+    session.stream_state = bundle.model.initial_state()
+    session.stream_version = bundle.version
+    session.stream_steps = len(session)
+    with STAGE_TIMER.time('scaler'):
+        history = bundle.scaler.transform(session.ordered()[-len(session):])
+    with STAGE_TIMER.time('model_step'):
+        for frame_normalized in history:
+            prediction_probs, session.stream_state = bundle.model.step(frame_normalized, session.stream_state)
+    session.stream_probs = prediction_probs if session.ready else None
+
+
+def parse_landmarks_payload(raw_landmarks):
+    """Validate a client-side landmarks payload and return it as a (N, FEATURE_DIM) float32 array
+
+    Accepts either a single FEATURE_DIM vector or a list of them, built the same way as
+    EnhancedLandmarkExtractor.extract_hand_landmarks (left hand 63 + right hand 63).
+    Raises ValueError with a client-facing message when the payload is malformed.
+    """
+    try:
+        landmarks = np.asarray(raw_landmarks, dtype=np.float32)
+    except (TypeError, ValueError):
+        raise ValueError("'landmarks' must be a numeric array")
+
+    if landmarks.ndim == 1:
+        landmarks = landmarks.reshape(1, -1)
+
+    if landmarks.ndim != 2 or landmarks.shape[1] != FEATURE_DIM:
+        raise ValueError(f"'landmarks' must have shape (N, {FEATURE_DIM}), got {landmarks.shape}")
+
+    if not 1 <= landmarks.shape[0] <= MAX_LANDMARK_FRAMES:
+        raise ValueError(f"'landmarks' must contain between 1 and {MAX_LANDMARK_FRAMES} frames, got {landmarks.shape[0]}")
+
+    if not np.all(np.isfinite(landmarks)):
+        raise ValueError("'landmarks' contains NaN or infinite values")
+
+    return landmarks
+
+
+def split_length_prefixed_frames(body):
+    """Split a FRAMES_CONTENT_TYPE body into per-frame uint8 views of the same buffer (no copies)
+
+    Raises ValueError with a client-facing message when the body is malformed.
+    """
+    buffer = np.frombuffer(body, dtype=np.uint8)
+    frames = []
+    offset = 0
+
+    while offset < len(buffer):
+        if offset + 4 > len(buffer):
+            raise ValueError("Truncated frame length prefix")
+        length = int.from_bytes(buffer[offset:offset + 4].tobytes(), 'big')
+        offset += 4
+        if length == 0 or offset + length > len(buffer):
+            raise ValueError(f"Frame {len(frames)} declares {length} bytes, {len(buffer) - offset} left in body")
+        frames.append(buffer[offset:offset + length])
+        offset += length
+        if len(frames) > MAX_UPLOAD_FRAMES:
+            raise ValueError(f"At most {MAX_UPLOAD_FRAMES} frames are accepted per request")
+
+    return frames
+
+
+def decode_base64_frame(frame_base64):
+    """Base64 (optionally a data URL) -> uint8 buffer of the encoded image"""
+    # Remove data URL prefix if present
+    if 'data:image' in frame_base64:
+        frame_base64 = frame_base64.split(',')[1]
+    with STAGE_TIMER.time('base64_decode'):
+        return np.frombuffer(base64.b64decode(frame_base64), np.uint8)
+
+
+def extract_landmarks_from_encoded(encoded_frames, session_key=None):
+    """Run landmark extraction over encoded (JPEG) uint8 buffers, returns (landmarks_sequence, valid_frames)"""
+    landmarks_sequence = []
+    valid_frames = 0
+    shoulder_tracker = new_shoulder_tracker()
+    hand_roi = new_hand_roi_tracker()
+    frame_cache = new_frame_cache()
+    stream_key = f"request:{uuid.uuid4().hex}"
+
+    # Frames are decoded a few ahead on the prefetcher's threads and extracted here, in order
+    decoded_frames = [None] * len(encoded_frames)
+    if DECODE_PREFETCHER is not None and len(encoded_frames) > 1:
+        seen_keys = set()
+        profiling = STAGE_TIMER.profiling()
+
+        def decode_task(encoded):
+            if not profiling:
+                return decode_ahead(encoded, frame_cache, seen_keys), None
+            # The request's profile is thread-local, so the decode stages are captured here and merged per frame below
+            with STAGE_TIMER.capture() as captured:
+                return decode_ahead(encoded, frame_cache, seen_keys), captured
+
+        decoded_frames = DECODE_PREFETCHER.map(decode_task, encoded_frames)
+
+    for i, (encoded, decoded) in enumerate(zip(encoded_frames, decoded_frames)):
+        with STAGE_TIMER.frame(i):
+            FRAMES_PROCESSED.inc()
+            try:
+                if decoded is not None:
+                    with STAGE_TIMER.time('decode_wait'):
+                        decoded, captured = decoded.result()
+                    STAGE_TIMER.merge(captured)
+                _, extracted = extract_frame_landmarks(
+                    encoded, frame_cache, shoulder_tracker=shoulder_tracker, hand_roi=hand_roi,
+                    session_key=session_key, stream_key=stream_key, decoded=decoded)
+
+                if extracted is not None:
+                    landmark_vector, hands_detected, _ = extracted
+                    record_frame_hands(hands_detected)
+
+                    if hands_detected > 0:
+                        landmarks_sequence.append(landmark_vector)
+                        valid_frames += 1
+                    else:
+                        landmarks_sequence.append(np.zeros(FEATURE_DIM))
+
+            except Exception as e:
+                logger.error(f"Error processing frame {i}: {e}")
+                landmarks_sequence.append(np.zeros(FEATURE_DIM))
+
+    return landmarks_sequence, valid_frames
+
+
+def extract_landmarks_from_frames(frames, session_key=None):
+    """Run landmark extraction over base64 frames, returns (landmarks_sequence, valid_frames)"""
+    encoded_frames = []
+    for i, frame_base64 in enumerate(frames):
+        try:
+            with STAGE_TIMER.frame(i):
+                encoded_frames.append(decode_base64_frame(frame_base64))
+        except Exception as e:
+            logger.error(f"Error processing frame {i}: {e}")
+            encoded_frames.append(None)
+    return extract_landmarks_from_encoded(encoded_frames, session_key=session_key)
+
+
+def prepare_sequence(bundle, landmarks_sequence):
+    """Resample/pad a landmark sequence to SEQUENCE_LENGTH and normalize it for the model"""
+    # Ensure we have exactly SEQUENCE_LENGTH frames
+    if len(landmarks_sequence) > SEQUENCE_LENGTH:
+        # Sample uniformly
+        indices = np.linspace(0, len(landmarks_sequence)-1, SEQUENCE_LENGTH, dtype=int)
+        landmarks_sequence = [landmarks_sequence[i] for i in indices]
+    elif len(landmarks_sequence) < SEQUENCE_LENGTH:
+        # Pad with last frame
+        landmarks_sequence = list(landmarks_sequence)
+        while len(landmarks_sequence) < SEQUENCE_LENGTH:
+            landmarks_sequence.append(landmarks_sequence[-1] if landmarks_sequence else np.zeros(FEATURE_DIM))
+
+    # Convert to numpy array and normalize
+    sequence_array = np.array(landmarks_sequence, dtype=np.float32)
+    sequence_flat = sequence_array.reshape(-1, FEATURE_DIM)
+    with STAGE_TIMER.time('scaler'):
+        sequence_normalized = bundle.scaler.transform(sequence_flat)
+    return sequence_normalized.reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+
+
+def predict_sequence(bundle, sequence_processed):
+    """Predict class probabilities for one (1, SEQUENCE_LENGTH, FEATURE_DIM) sequence via the batch scheduler
+
+    Sequences are batched per model, so during a reload each request runs on the bundle it started with.
+    """
+    with STAGE_TIMER.time('model_predict'):
+        return BATCH_SCHEDULER.predict(sequence_processed[0], bundle.model.predict)
+
+
+def smooth_predictions(session, new_prediction):
+    """Smooth predictions using the session's recent predictions to reduce jitter"""
+    session.predictions.append(new_prediction)
     
-    if len(PREDICTION_BUFFER) < 3:
+    if len(session.predictions) < 3:
         return new_prediction
     
     label_counts = {}
     confidence_sums = {}
     
-    for pred in PREDICTION_BUFFER:
+    for pred in session.predictions:
         label = pred['label']
         confidence = pred['prob']
         
@@ -329,6 +1044,72 @@ def smooth_predictions(new_prediction):
     }
 
 
+def ingest_sign_input(session, bundle, frame_base64=None, landmarks_array=None, render_mode='none'):
+    """Push one frame or a block of client landmarks into the session
+
+    Returns (sequence_processed, rendered, stream_probs, buffered_frames), see
+    extract_and_preprocess_frame for rendered.
+    """
+    with session.lock:
+        if landmarks_array is not None:
+            # Landmark-only mode: push client-extracted vectors straight into the buffer
+            sequence_processed, rendered = None, None
+            for landmark_vector in landmarks_array:
+                hands_detected = int(np.any(landmark_vector != 0))
+                sequence_processed = buffer_landmark_vector(session, bundle, landmark_vector, hands_detected)
+        else:
+            sequence_processed, rendered = extract_and_preprocess_frame(session, bundle, frame_base64, render_mode)
+        buffered_frames = len(session)
+        stream_probs, session.stream_probs = session.stream_probs, None
+
+    return sequence_processed, rendered, stream_probs, buffered_frames
+
+
+def build_sign_predictions(session, bundle, sequence_processed, stream_probs, buffered_frames):
+    """Run (or take the streamed) prediction for one buffered frame and format it for the client"""
+    predictions_data = []
+    
+    if sequence_processed is not None or stream_probs is not None:
+        try:
+            if stream_probs is not None:
+                prediction_probs = stream_probs
+            else:
+                prediction_probs = predict_sequence(bundle, sequence_processed)
+            top_k_indices = np.argsort(prediction_probs)[::-1][:5]
+            
+            raw_predictions = []
+            for i in top_k_indices:
+                label = bundle.labels_map.get(i, f"Unknown_{i}")
+                prob = float(prediction_probs[i])
+                raw_predictions.append({"label": label, "prob": prob})
+            
+            best_prediction = raw_predictions[0]
+            # FIXED: Reduced threshold for better recognition
+            if best_prediction['prob'] >= 0.3:  # Reduced from CONFIDENCE_THRESHOLD
+                with session.lock:
+                    smoothed_prediction = smooth_predictions(session, best_prediction)
+                predictions_data.append(smoothed_prediction)
+                
+                for pred in raw_predictions[1:]:
+                    if pred['prob'] >= 0.15:  # Reduced threshold for alternative predictions
+                        predictions_data.append(pred)
+            else:
+                predictions_data.append({"label": "Low confidence", "prob": best_prediction['prob']})
+            
+            logger.info(f"Predicted: {predictions_data[0]['label']} ({predictions_data[0]['prob']:.3f})")
+            
+        except Exception as e:
+            logger.error(f"Prediction error: {e}")
+            predictions_data.append({"label": "Prediction error", "prob": 0.0})
+    else:
+        predictions_data.append({
+            "label": f"Collecting frames... ({buffered_frames}/{SEQUENCE_LENGTH})", 
+            "prob": 0.0
+        })
+    
+    return predictions_data
+
+
 # FIXED: Add the missing /api/predict endpoint that frontend expects
 @app.route('/api/predict', methods=['POST'])
 def predict_gesture():
@@ -340,47 +1121,69 @@ def predict_gesture():
             "confidence": 0
         }), 503
 
+    bundle = BUNDLE
     try:
-        data = request.json
+        # Frames arrive as JSON base64 strings, multipart JPEG files or a length-prefixed binary body
+        encoded_frames = None
+        if request.mimetype == 'multipart/form-data':
+            data = request.form
+            files = request.files.getlist('frames')
+            if len(files) > MAX_UPLOAD_FRAMES:
+                return jsonify({
+                    "is_correct": False,
+                    "message": f"At most {MAX_UPLOAD_FRAMES} frames are accepted per request",
+                    "confidence": 0
+                }), 400
+            encoded_frames = [np.frombuffer(f.read(), np.uint8) for f in files]
+        elif request.mimetype == FRAMES_CONTENT_TYPE:
+            data = request.args
+            try:
+                encoded_frames = split_length_prefixed_frames(request.get_data(cache=False))
+            except ValueError as e:
+                return jsonify({
+                    "is_correct": False,
+                    "message": str(e),
+                    "confidence": 0
+                }), 400
+        else:
+            data = request.json
+
         target_word = data.get('target_word', '')
-        frames = data.get('frames', [])
-        
-        logger.info(f"ðŸŽ¯ Received prediction request for '{target_word}' with {len(frames)} frames")
-        
-        if not frames:
-            return jsonify({
-                "is_correct": False,
-                "message": "No frames provided",
-                "confidence": 0
-            }), 400
-        
-        # Process frames to extract landmarks
-        landmarks_sequence = []
-        valid_frames = 0
-        
-        for i, frame_base64 in enumerate(frames):
+        frames = data.get('frames', []) if encoded_frames is None else encoded_frames
+        landmarks_payload = data.get('landmarks') if encoded_frames is None else None
+
+        if landmarks_payload is not None:
+            # Landmark-only mode: the client already ran MediaPipe, skip decode and extraction
             try:
-                # Remove data URL prefix if present
-                if 'data:image' in frame_base64:
-                    frame_base64 = frame_base64.split(',')[1]
-                
-                frame_data = base64.b64decode(frame_base64)
-                nparr = np.frombuffer(frame_data, np.uint8)
-                frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-                
-                if frame is not None:
-                    frame = cv2.resize(frame, (640, 480))
-                    landmark_vector, hands_detected, _ = landmark_extractor.extract_hand_landmarks(frame)
-                    
-                    if hands_detected > 0:
-                        landmarks_sequence.append(landmark_vector)
-                        valid_frames += 1
-                    else:
-                        landmarks_sequence.append(np.zeros(FEATURE_DIM))
-                        
-            except Exception as e:
-                logger.error(f"Error processing frame {i}: {e}")
-                landmarks_sequence.append(np.zeros(FEATURE_DIM))
+                landmarks_array = parse_landmarks_payload(landmarks_payload)
+            except ValueError as e:
+                return jsonify({
+                    "is_correct": False,
+                    "message": str(e),
+                    "confidence": 0
+                }), 400
+
+            method = "client_landmarks"
+            total_frames = len(landmarks_array)
+            landmarks_sequence = list(landmarks_array)
+            valid_frames = int(np.count_nonzero(np.any(landmarks_array != 0, axis=1)))
+            logger.info(f"Received landmark prediction request for '{target_word}' with {total_frames} frames")
+        else:
+            if not frames:
+                return jsonify({
+                    "is_correct": False,
+                    "message": "No frames provided",
+                    "confidence": 0
+                }), 400
+            
+            # Process frames to extract landmarks
+            method = "multi_frame_landmark_extraction"
+            total_frames = len(frames)
+            # Only a session id the client sent pins an extractor, anonymous requests take any free one
+            if encoded_frames is not None:
+                landmarks_sequence, valid_frames = extract_landmarks_from_encoded(encoded_frames, session_key=client_session_id())
+            else:
+                landmarks_sequence, valid_frames = extract_landmarks_from_frames(frames, session_key=client_session_id())
         
         logger.info(f"ðŸ“Š Processed {len(landmarks_sequence)} frames, {valid_frames} with hands detected")
         
@@ -391,36 +1194,22 @@ def predict_gesture():
                 "message": f"Not enough hand detection. Only {valid_frames} valid frames found. Keep hands visible!",
                 "confidence": 0,
                 "debug_info": {
-                    "total_frames": len(frames),
+                    "total_frames": total_frames,
                     "valid_frames": valid_frames,
-                    "method": "multi_frame_landmark_extraction"
+                    "method": method
                 }
             })
         
-        # Ensure we have exactly SEQUENCE_LENGTH frames
-        if len(landmarks_sequence) > SEQUENCE_LENGTH:
-            # Sample uniformly
-            indices = np.linspace(0, len(landmarks_sequence)-1, SEQUENCE_LENGTH, dtype=int)
-            landmarks_sequence = [landmarks_sequence[i] for i in indices]
-        elif len(landmarks_sequence) < SEQUENCE_LENGTH:
-            # Pad with last frame
-            while len(landmarks_sequence) < SEQUENCE_LENGTH:
-                landmarks_sequence.append(landmarks_sequence[-1] if landmarks_sequence else np.zeros(FEATURE_DIM))
-        
-        # Convert to numpy array and normalize
-        sequence_array = np.array(landmarks_sequence, dtype=np.float32)
-        sequence_flat = sequence_array.reshape(-1, FEATURE_DIM)
-        sequence_normalized = SCALER.transform(sequence_flat)
-        sequence_processed = sequence_normalized.reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+        sequence_processed = prepare_sequence(bundle, landmarks_sequence)
         
         # Make prediction
-        prediction_probs = MODEL.predict(sequence_processed, verbose=0)[0]
+        prediction_probs = predict_sequence(bundle, sequence_processed)
         
         # Get top predictions
         top_k_indices = np.argsort(prediction_probs)[::-1][:5]
         top_predictions = []
         for i in top_k_indices:
-            label = LABELS_MAP.get(i, f"Unknown_{i}")
+            label = bundle.labels_map.get(i, f"Unknown_{i}")
             confidence = float(prediction_probs[i])
             top_predictions.append({"word": label, "confidence": confidence})
         
@@ -465,11 +1254,12 @@ def predict_gesture():
             "points": points,
             "top_predictions": top_predictions,
             "message": message,  # FIXED: Use the detailed message from above
+            "model_version": bundle.version,
             "debug_info": {
-                "total_frames": len(frames),
+                "total_frames": total_frames,
                 "landmark_frames": valid_frames,
-                "processed_frames": len(landmarks_sequence),
-                "method": "multi_frame_landmark_extraction",
+                "processed_frames": sequence_processed.shape[1],
+                "method": method,
                 "sequence_length": SEQUENCE_LENGTH,
                 "confidence_threshold": CONFIDENCE_THRESHOLD,
                 "all_predictions": [(pred["word"], round(pred['confidence'], 3)) for pred in top_predictions]
@@ -508,77 +1298,174 @@ def predict_sign():
 
     data = request.json
     frame_base64 = data.get('frame_base64')
+    landmarks_payload = data.get('landmarks')
+    render_mode = data.get('render_mode') or request.args.get('render_mode') or DEFAULT_RENDER_MODE
+    if render_mode not in RENDER_MODES:
+        return jsonify({"error": f"'render_mode' must be one of {', '.join(RENDER_MODES)}"}), 400
 
-    if not frame_base64:
-        return jsonify({"error": "Missing 'frame_base64' in request."}), 400
+    landmarks_array = None
+    if landmarks_payload is not None:
+        try:
+            landmarks_array = parse_landmarks_payload(landmarks_payload)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    elif not frame_base64:
+        return jsonify({"error": "Missing 'frame_base64' or 'landmarks' in request."}), 400
 
-    sequence_processed, display_frame = extract_and_preprocess_frame(frame_base64)
+    session = SESSION_STORE.get(get_session_id())
+    bundle = BUNDLE
 
-    if display_frame is not None:
-        _, buffer = cv2.imencode('.jpeg', display_frame)
-        display_frame_base64 = base64.b64encode(buffer).decode('utf-8')
-    else:
-        display_frame_base64 = ""
+    with STAGE_TIMER.frame(0):
+        sequence_processed, rendered, stream_probs, buffered_frames = ingest_sign_input(
+            session, bundle, frame_base64=frame_base64, landmarks_array=landmarks_array, render_mode=render_mode)
 
-    predictions_data = []
-    
-    if sequence_processed is not None and MODEL:
-        try:
-            prediction_probs = MODEL.predict(sequence_processed, verbose=0)[0]
-            top_k_indices = np.argsort(prediction_probs)[::-1][:5]
-            
-            raw_predictions = []
-            for i in top_k_indices:
-                label = LABELS_MAP.get(i, f"Unknown_{i}")
-                prob = float(prediction_probs[i])
-                raw_predictions.append({"label": label, "prob": prob})
-            
-            best_prediction = raw_predictions[0]
-            # FIXED: Reduced threshold for better recognition
-            if best_prediction['prob'] >= 0.3:  # Reduced from CONFIDENCE_THRESHOLD
-                smoothed_prediction = smooth_predictions(best_prediction)
-                predictions_data.append(smoothed_prediction)
-                
-                for pred in raw_predictions[1:]:
-                    if pred['prob'] >= 0.15:  # Reduced threshold for alternative predictions
-                        predictions_data.append(pred)
-            else:
-                predictions_data.append({"label": "Low confidence", "prob": best_prediction['prob']})
-            
-            logger.info(f"Predicted: {predictions_data[0]['label']} ({predictions_data[0]['prob']:.3f})")
-            
-        except Exception as e:
-            logger.error(f"Prediction error: {e}")
-            predictions_data.append({"label": "Prediction error", "prob": 0.0})
-    else:
-        predictions_data.append({
-            "label": f"Collecting frames... ({len(FRAME_BUFFER)}/{SEQUENCE_LENGTH})", 
-            "prob": 0.0
-        })
+    display_frame_base64 = ""
+    hand_landmarks = None
+    if render_mode == 'jpeg' and rendered is not None:
+        with STAGE_TIMER.time('jpeg_encode'):
+            _, buffer = cv2.imencode('.jpeg', rendered)
+            display_frame_base64 = base64.b64encode(buffer).decode('utf-8')
+    elif render_mode == 'landmarks_json':
+        hand_landmarks = rendered or []
+
+    predictions_data = build_sign_predictions(session, bundle, sequence_processed, stream_probs, buffered_frames)
     
-    return jsonify({
+    response = {
         "predictions": predictions_data,
         "timestamp": datetime.now().isoformat(),
-        "model_version": "enhanced_v1.0",
+        "model_version": bundle.version,
         "frame_with_overlay_base64": display_frame_base64,
         "buffer_status": {
-            "current_size": len(FRAME_BUFFER),
+            "current_size": buffered_frames,
             "required_size": SEQUENCE_LENGTH,
-            "ready": len(FRAME_BUFFER) == SEQUENCE_LENGTH
+            "ready": buffered_frames == SEQUENCE_LENGTH
         }
-    })
+    }
+    if hand_landmarks is not None:
+        response["hand_landmarks"] = hand_landmarks
+    
+    return jsonify(response)
+
+
+def ws_predict(ws):
+    """Real-time recognition over a WebSocket, with one session bound to the connection
+
+    Client -> server, JSON text messages:
+      {"frame_base64": "..."}   one JPEG frame (data URL prefix allowed)
+      {"landmarks": [...]}       one or more FEATURE_DIM landmark vectors
+      {"type": "reset"}          clear the session buffers
+    Server -> client, one message per processed batch of input:
+      {"type": "prediction", "predictions": [...], "buffer_status": {...}, "dropped_frames": n}
+      {"type": "buffering", "buffer_status": {...}, "dropped_frames": n}
+      {"type": "error", "error": "..."}
+
+    Backpressure: everything that queued up while the previous input was being
+    processed is drained at once. Landmark vectors are cheap and all buffered,
+    but only the newest image frame is decoded; older ones are dropped and counted.
+    """
+    if not MODEL_LOADED:
+        ws.send(json.dumps({"type": "error", "error": "Model not loaded. Check server logs."}))
+        return
+
+    session_id = f"ws:{uuid.uuid4().hex}"
+    dropped_frames = 0
+
+    try:
+        while True:
+            messages = [ws.receive()]
+            while True:
+                queued = ws.receive(timeout=0)
+                if queued is None:
+                    break
+                messages.append(queued)
+            started = time.perf_counter()
+
+            inputs = []
+            for raw in messages:
+                try:
+                    try:
+                        message = json.loads(raw)
+                    except (TypeError, ValueError):
+                        raise ValueError("messages must be JSON text")
+                    if not isinstance(message, dict):
+                        raise ValueError("messages must be JSON objects")
+                    if message.get('type') == 'reset':
+                        inputs.append(('reset', None))
+                    elif message.get('landmarks') is not None:
+                        inputs.append(('landmarks', parse_landmarks_payload(message['landmarks'])))
+                    elif message.get('frame_base64'):
+                        frame_base64 = message['frame_base64']
+                        if not isinstance(frame_base64, str):
+                            raise ValueError("'frame_base64' must be a string")
+                        if 'data:image' in frame_base64:
+                            frame_base64 = frame_base64.split(',', 1)[-1]
+                        inputs.append(('frame', frame_base64))
+                    else:
+                        raise ValueError("expected 'frame_base64', 'landmarks' or type 'reset'")
+                except ValueError as e:
+                    REQUESTS_REJECTED.inc('ws_predict', '400')
+                    ws.send(json.dumps({"type": "error", "error": str(e)}))
+
+            frame_positions = [i for i, (kind, _) in enumerate(inputs) if kind == 'frame']
+            dropped_frames += max(0, len(frame_positions) - 1)
+            newest_frame = frame_positions[-1] if frame_positions else None
+
+            session = SESSION_STORE.get(session_id)
+            bundle = BUNDLE
+            result = None
+            for i, (kind, payload) in enumerate(inputs):
+                if kind == 'reset':
+                    SESSION_STORE.reset(session_id)
+                    result = None
+                elif kind == 'landmarks':
+                    result = ingest_sign_input(session, bundle, landmarks_array=payload)
+                elif i == newest_frame:
+                    result = ingest_sign_input(session, bundle, frame_base64=payload)
+
+            if result is None:
+                continue
+
+            sequence_processed, _, stream_probs, buffered_frames = result
+            ready = sequence_processed is not None or stream_probs is not None
+            response = {
+                "type": "prediction" if ready else "buffering",
+                "buffer_status": {
+                    "current_size": buffered_frames,
+                    "required_size": SEQUENCE_LENGTH,
+                    "ready": buffered_frames == SEQUENCE_LENGTH
+                },
+                "dropped_frames": dropped_frames
+            }
+            if ready:
+                response["predictions"] = build_sign_predictions(session, bundle, sequence_processed, stream_probs, buffered_frames)
+                response["timestamp"] = datetime.now().isoformat()
+                response["model_version"] = bundle.version
+            ws.send(json.dumps(response))
+            REQUEST_LATENCY.observe(time.perf_counter() - started, 'ws_predict')
+
+    except ConnectionClosed:
+        pass
+    finally:
+        SESSION_STORE.discard(session_id)
+        EXTRACTOR_POOL.forget(session_id)
+
+
+if sock is not None:
+    sock.route('/ws/predict')(ws_predict)
 
 
 @app.route('/api/search', methods=['GET', 'POST', 'OPTIONS'])
 def search():
     """FINAL SEARCH ENDPOINT - 100% FRONTEND COMPATIBLE"""
+    bundle = BUNDLE
+    labels_map = bundle.labels_map if bundle else {}
     
     # Handle OPTIONS preflight
     if request.method == 'OPTIONS':
         return jsonify({'status': 'OK'})
     
     # Ensure we have words available
-    if not MODEL_LOADED or not LABELS_MAP:
+    if not MODEL_LOADED or not labels_map:
         logger.warning("ðŸš¨ Search called but no words available - using defaults")
         default_words = ["hello", "thank you", "yes", "no", "please", "sorry", "help", "good", "about", "accept"]
         
@@ -595,9 +1482,9 @@ def search():
             "message": "Using default words - model not loaded"
         })
     
-    # Get all available words
-    all_words = list(LABELS_MAP.values())
-    logger.info(f"ðŸ” Search endpoint called - {len(all_words)} words available")
+    # Index built with the labels at load time
+    search_index = bundle.search_index
+    logger.info(f"ðŸ” Search endpoint called - {len(search_index)} words available")
     
     # Extract search term from request
     search_term = ""
@@ -612,48 +1499,26 @@ def search():
     
     # If no search term, return all words (limited to first 100)
     if not search_term:
-        sorted_words = sorted(all_words)[:100]
-        
-        result = {
-            "success": True,
-            "words": sorted_words,
-            "total_found": len(all_words),
-            "total_classes": len(all_words),
-            "search_term": "",
-            "model_loaded": MODEL_LOADED,
-            "approach": "Landmark-based BiLSTM with Attention",
-            "features": f"{FEATURE_DIM}D",
-            "sequence_length": SEQUENCE_LENGTH,
-            "accuracy": "82.6%",
-            "top3_accuracy": "92.5%",
-            "message": f"Showing first {len(sorted_words)} words"
-        }
-        
-        logger.info(f"âœ… No search term - returning {len(sorted_words)} words")
-        return jsonify(result)
-    
-    # Perform search
-    filtered_words = []
-    search_lower = search_term.lower()
+        logger.info(f"âœ… No search term - returning {min(len(search_index.sorted_words), 100)} words")
+        return catalog_response(bundle, "search_all")
     
-    # Case-insensitive search
-    for word in all_words:
-        if search_lower in word.lower():
-            filtered_words.append(word)
+    # Sort by relevance: exact, starts with, contains, then typo matches
+    exact_matches, starts_with, contains = search_index.search(search_term)
     
-    # Sort by relevance
-    exact_matches = [w for w in filtered_words if w.lower() == search_lower]
-    starts_with = [w for w in filtered_words if w.lower().startswith(search_lower) and w.lower() != search_lower]
-    contains = [w for w in filtered_words if search_lower in w.lower() and not w.lower().startswith(search_lower)]
+    fuzzy_matches = []
+    if SEARCH_FUZZY_MAX_DISTANCE > 0 and len(search_term) >= SEARCH_FUZZY_MIN_LENGTH:
+        max_distance = min(SEARCH_FUZZY_MAX_DISTANCE, 1 if len(search_term) <= 5 else 2)
+        fuzzy_matches = search_index.fuzzy(search_term, max_distance, exclude=exact_matches + starts_with + contains)
     
-    final_words = exact_matches + starts_with + contains
+    final_words = exact_matches + starts_with + contains + fuzzy_matches
     
     # Prepare response
     result = {
         "success": True,
         "words": final_words[:50],  # Limit to 50 results
         "total_found": len(final_words),
-        "total_classes": len(all_words),
+        "fuzzy_found": len(fuzzy_matches),
+        "total_classes": len(search_index),
         "search_term": search_term,
         "model_loaded": MODEL_LOADED,
         "approach": "Landmark-based BiLSTM with Attention",
@@ -671,21 +1536,11 @@ def search():
 @app.route('/api/words', methods=['GET'])
 def get_words():
     """Get all available words - FRONTEND COMPATIBLE"""
-    if LABELS_MAP and MODEL_LOADED:
-        words = sorted(list(LABELS_MAP.values()))
+    bundle = BUNDLE
+    if bundle and bundle.labels_map and MODEL_LOADED:
+        words = bundle.search_index.sorted_words
         logger.info(f"ðŸ“ /api/words - returning {len(words)} words")
-        
-        return jsonify({
-            "success": True,
-            "words": words,
-            "total_classes": len(words),
-            "approach": "Landmark-based BiLSTM with Attention",
-            "features": f"{FEATURE_DIM}D",
-            "sequence_length": SEQUENCE_LENGTH,
-            "model_loaded": True,
-            "accuracy": "82.6%",
-            "top3_accuracy": "92.5%"
-        })
+        return catalog_response(bundle, "words")
     else:
         logger.warning("ðŸ“ /api/words - model not loaded, returning defaults")
         default_words = ["hello", "thank you", "yes", "no", "please", "sorry", "help", "good", "about", "accept"]
@@ -702,10 +1557,22 @@ def get_words():
         })
 
 
+@app.route('/ready', methods=['GET'])
+def ready():
+    """Readiness check: 200 only once artifacts are loaded and warmup has finished"""
+    return jsonify({
+        "ready": READY,
+        "model_loaded": MODEL_LOADED,
+        "warmup": WARMUP_STATUS,
+        "timestamp": datetime.now().isoformat()
+    }), 200 if READY else 503
+
+
 @app.route('/api/status', methods=['GET'])
 def status():
     """Backend status check"""
-    word_count = len(LABELS_MAP) if LABELS_MAP else 0
+    bundle = BUNDLE
+    word_count = len(bundle.labels_map) if bundle else 0
     
     return jsonify({
         "success": True,
@@ -714,29 +1581,142 @@ def status():
         "total_classes": word_count,
         "sequence_length": SEQUENCE_LENGTH,
         "feature_dimension": FEATURE_DIM,
-        "buffer_size": len(FRAME_BUFFER),
+        "buffer_size": current_buffer_size(),
+        "active_sessions": len(SESSION_STORE),
+        "streaming_inference": bundle.streaming if bundle else False,
+        "model_version": bundle.version if bundle else None,
+        "model_loaded_at": bundle.loaded_at if bundle else None,
         "approach": "Landmark-based BiLSTM with Attention" if MODEL_LOADED else "Model not loaded",
         "features": f"{FEATURE_DIM}D",
         "accuracy": "82.6%" if MODEL_LOADED else "N/A",
         "timestamp": datetime.now().isoformat(),
-        "ready_for_predictions": MODEL_LOADED and SCALER is not None
+        "ready_for_predictions": MODEL_LOADED and bundle is not None
     })
 
 
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus scrape endpoint: per-stage and per-endpoint latency, frame counters, sessions and model state"""
+    bundle = BUNDLE
+    batching = BATCH_SCHEDULER
+    families = [
+        ("gesture_request_duration_seconds", "histogram", "Request latency per endpoint (per processed message for WebSockets)", REQUEST_LATENCY.items()),
+        ("gesture_stage_duration_seconds", "histogram", "Latency of one pipeline stage call", STAGE_TIMER.histogram.items()),
+        ("gesture_requests_rejected_total", "counter", "Responses with a 4xx/5xx status, by endpoint and status", REQUESTS_REJECTED.items()),
+        ("gesture_frames_processed_total", "counter", "Image frames received for landmark extraction", [({}, FRAMES_PROCESSED.value)]),
+        ("gesture_frames_with_hands_total", "counter", "Extracted frames with at least one hand", [({}, FRAMES_WITH_HANDS.value)]),
+        ("gesture_frames_without_hands_total", "counter", "Extracted frames without hands", [({}, FRAMES_WITHOUT_HANDS.value)]),
+        ("gesture_frame_cache_hits_total", "counter", "Frames whose landmarks came from the frame cache, by match kind",
+         [({"kind": "exact"}, FRAME_CACHE_STATS.exact_hits.value), ({"kind": "similar"}, FRAME_CACHE_STATS.similar_hits.value)]),
+        ("gesture_frame_cache_misses_total", "counter", "Frames that went through landmark extraction with the frame cache on", [({}, FRAME_CACHE_STATS.misses.value)]),
+        ("gesture_extractor_pool_size", "gauge", "MediaPipe extractors built in this process", [({}, len(EXTRACTOR_POOL))]),
+        ("gesture_extractor_pool_in_use", "gauge", "MediaPipe extractors checked out right now", [({}, EXTRACTOR_POOL.in_use)]),
+        ("gesture_extractor_checkouts_total", "counter", "Extractor checkouts", [({}, EXTRACTOR_POOL_STATS.checkouts.value)]),
+        ("gesture_extractor_checkout_waits_total", "counter", "Extractor checkouts that waited for a busy extractor", [({}, EXTRACTOR_POOL_STATS.waits.value)]),
+        ("gesture_extractor_checkout_wait_seconds", "histogram", "Time a waiting checkout spent waiting", [({}, EXTRACTOR_POOL_STATS.wait_histogram)]),
+        ("gesture_active_sessions", "gauge", "Sessions holding a frame buffer", [({}, len(SESSION_STORE))]),
+        ("gesture_session_buffer_bytes", "gauge", "Memory held by session frame buffers", [({}, SESSION_STORE.memory_bytes)]),
+        ("gesture_batch_size", "histogram", "Sequences per batched forward pass", [({}, batching.batch_size_histogram)]),
+        ("gesture_batch_queue_wait_seconds", "histogram", "Time a sequence waited for its batch", [({}, batching.queue_wait_histogram)]),
+        ("gesture_model_reloads_total", "counter", "Successful model hot reloads", [({}, RELOAD_STATS.reloads.value)]),
+        ("gesture_model_reload_failures_total", "counter", "Failed model hot reloads", [({}, RELOAD_STATS.failures.value)]),
+        ("gesture_model_reload_duration_seconds", "histogram", "Load + warmup time of successful reloads", [({}, RELOAD_STATS.duration_histogram)]),
+        ("gesture_model_info", "gauge", "Model version being served", [({"version": bundle.version, "backend": bundle.model.name}, 1)] if bundle else []),
+        ("gesture_ready", "gauge", "1 once artifacts are loaded and warmed up", [({}, int(READY))])
+    ]
+    return Response(format_prometheus(families), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @app.route('/api/reset_buffer', methods=['POST'])
 def reset_buffer():
-    """Reset the frame buffer"""
-    global FRAME_BUFFER, PREDICTION_BUFFER
-    FRAME_BUFFER.clear()
-    PREDICTION_BUFFER.clear()
+    """Reset the calling session's frame and prediction buffers"""
+    SESSION_STORE.reset(get_session_id())
     logger.info("ðŸ”„ Buffers reset")
     return jsonify({"success": True, "message": "Buffers reset successfully"})
 
 
+@app.route('/api/batching_stats', methods=['GET'])
+def batching_stats():
+    """Batch-size and queue-wait histograms of the inference scheduler"""
+    return jsonify({"success": True, **BATCH_SCHEDULER.stats()})
+
+
+@app.route('/api/pose_stats', methods=['GET'])
+def pose_stats():
+    """Pose-detection decimation: how often pose ran and the shoulder-center drift it measured"""
+    return jsonify({
+        "success": True,
+        "pose_every_n_frames": POSE_EVERY_N_FRAMES,
+        "motion_threshold": POSE_MOTION_THRESHOLD,
+        **POSE_STATS.snapshot()
+    })
+
+
+@app.route('/api/hand_roi_stats', methods=['GET'])
+def hand_roi_stats():
+    """Hand ROI tracking: share of frames that skipped palm detection and how often the track was lost"""
+    return jsonify({
+        "success": True,
+        "enabled": HAND_ROI_TRACKING,
+        "redetect_interval": HAND_ROI_REDETECT_INTERVAL,
+        **HAND_ROI_STATS.snapshot()
+    })
+
+
+@app.route('/api/frame_cache_stats', methods=['GET'])
+def frame_cache_stats():
+    """Repeated-frame cache: exact and near-duplicate hits that skipped landmark extraction"""
+    return jsonify({
+        "success": True,
+        "max_entries": FRAME_CACHE_SIZE,
+        "tolerance": FRAME_CACHE_TOLERANCE,
+        **FRAME_CACHE_STATS.snapshot()
+    })
+
+
+@app.route('/api/extractor_pool_stats', methods=['GET'])
+def extractor_pool_stats():
+    """MediaPipe extractor pool: size, occupancy, pinned sessions and checkout wait times"""
+    processes = EXTRACTION_PROCESS_POOL.snapshot() if EXTRACTION_PROCESS_POOL is not None else None
+    return jsonify({"success": True, **EXTRACTOR_POOL.snapshot(), "processes": processes})
+
+
+@app.route('/api/reload', methods=['POST'])
+def reload_model():
+    """Hot-reload the model bundle from disk; ?wait=0 returns 202 and reloads in the background"""
+    # Every reload is a full load and warmup on the serving process, so only token holders may start one
+    if not RELOAD_TOKEN:
+        return jsonify({"success": False, "error": "Reloading over HTTP is disabled, set RELOAD_TOKEN to enable it"}), 403
+    if not hmac.compare_digest(request.headers.get('X-Reload-Token', ''), RELOAD_TOKEN):
+        return jsonify({"success": False, "error": "Invalid reload token"}), 403
+    
+    if request.args.get('wait', '1') == '0':
+        threading.Thread(target=reload_model_bundle, name='model-reload', daemon=True).start()
+        return jsonify({"success": True, "message": "Reload started", "version": BUNDLE.version if BUNDLE else None}), 202
+    
+    reloaded, result = reload_model_bundle()
+    return jsonify({"success": reloaded, **result}), 200 if reloaded else 409 if result.get("in_progress") else 500
+
+
+@app.route('/api/reload_stats', methods=['GET'])
+def reload_stats():
+    """Version being served and the count, failures and latency of hot reloads"""
+    bundle = BUNDLE
+    return jsonify({
+        "success": True,
+        "version": bundle.version if bundle else None,
+        "loaded_at": bundle.loaded_at if bundle else None,
+        "reloading": _reload_lock.locked(),
+        "watch_interval": MODEL_WATCH_INTERVAL,
+        **RELOAD_STATS.snapshot()
+    })
+
+
 @app.route('/api/model_info', methods=['GET'])
 def model_info():
     """Get complete information about the loaded model"""
-    if not MODEL_LOADED:
+    bundle = BUNDLE
+    if not MODEL_LOADED or bundle is None:
         return jsonify({
             "success": False,
             "error": "Model not loaded",
@@ -746,20 +1726,7 @@ def model_info():
             "features": f"{FEATURE_DIM}D"
         }), 503
     
-    return jsonify({
-        "success": True,
-        "model_loaded": MODEL_LOADED,
-        "num_classes": len(LABELS_MAP),
-        "classes": list(LABELS_MAP.values()),
-        "sequence_length": SEQUENCE_LENGTH,
-        "feature_dim": FEATURE_DIM,
-        "confidence_threshold": CONFIDENCE_THRESHOLD,
-        "buffer_size": len(FRAME_BUFFER),
-        "approach": "Landmark-based BiLSTM with Attention",
-        "features": f"{FEATURE_DIM}D",
-        "accuracy": "82.6%",
-        "top3_accuracy": "92.5%"
-    })
+    return catalog_response(bundle, "model_info")
 
 
 # FIXED: Add video serving capability
@@ -985,15 +1952,14 @@ def debug_landmarks():
                 
                 frame_data = base64.b64decode(frame_base64)
                 nparr = np.frombuffer(frame_data, np.uint8)
-                frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+                frame = decode_frame(nparr)
                 
                 if frame is not None:
-                    frame = cv2.resize(frame, (640, 480))
-                    
                     # Extract landmarks with detailed debug info
-                    rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    hands_results = landmark_extractor.hands.process(rgb_image)
-                    pose_results = landmark_extractor.pose.process(rgb_image)
+                    rgb_image = frame
+                    with EXTRACTOR_POOL.checkout() as extractor:
+                        hands_results = extractor.hands.process(rgb_image)
+                        pose_results = extractor.pose.process(rgb_image)
                     
                     frame_debug = {
                         "frame_index": i,
@@ -1041,7 +2007,8 @@ def debug_landmarks():
                             frame_debug["raw_landmarks_sample"] = raw_sample
                     
                     # Extract full landmark vector using our method
-                    landmark_vector, hands_detected, _ = landmark_extractor.extract_hand_landmarks(frame)
+                    with EXTRACTOR_POOL.checkout() as extractor:
+                        landmark_vector, hands_detected, _ = extractor.extract_hand_landmarks(frame, rgb=True)
                     landmarks_sequence.append(landmark_vector)
                     
                     # Sample of normalized landmarks
@@ -1095,7 +2062,8 @@ def debug_landmarks():
 @app.route('/api/test_model', methods=['GET'])
 def test_model():
     """Test model with dummy data to check vocabulary"""
-    if not MODEL_LOADED or not MODEL or not SCALER:
+    bundle = BUNDLE
+    if not MODEL_LOADED or bundle is None:
         return jsonify({"error": "Model not ready"}), 503
     
     try:
@@ -1103,20 +2071,20 @@ def test_model():
         dummy_input = np.random.random((1, SEQUENCE_LENGTH, FEATURE_DIM)).astype(np.float32)
         
         # Get model prediction
-        predictions = MODEL.predict(dummy_input, verbose=0)[0]
+        predictions = bundle.model.predict(dummy_input)[0]
         
         # Get top 10 predictions
         top_indices = np.argsort(predictions)[::-1][:10]
         top_predictions = []
         
         for idx in top_indices:
-            word = LABELS_MAP.get(idx, f"Unknown_{idx}")
+            word = bundle.labels_map.get(idx, f"Unknown_{idx}")
             confidence = float(predictions[idx])
             top_predictions.append({"index": int(idx), "word": word, "confidence": confidence})
         
         # Check where hello would be
         hello_info = None
-        for idx, word in LABELS_MAP.items():
+        for idx, word in bundle.labels_map.items():
             if word.lower() == 'hello':
                 hello_confidence = float(predictions[idx])
                 hello_rank = np.where(np.argsort(predictions)[::-1] == idx)[0][0] + 1
@@ -1131,7 +2099,7 @@ def test_model():
             "success": True,
             "model_output_shape": predictions.shape,
             "total_classes": len(predictions),
-            "vocabulary_size": len(LABELS_MAP),
+            "vocabulary_size": len(bundle.labels_map),
             "top_10_random_predictions": top_predictions,
             "hello_analysis": hello_info,
             "prediction_distribution": {
@@ -1149,12 +2117,13 @@ def test_model():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for ECS"""
+    labels_map = BUNDLE.labels_map if BUNDLE else {}
     return jsonify({
         "success": True,
         "status": "healthy",
         "model_loaded": MODEL_LOADED,
         "timestamp": datetime.now().isoformat(),
-        "total_classes": len(LABELS_MAP) if LABELS_MAP else 0
+        "total_classes": len(labels_map) if labels_map else 0
     }), 200
 
 
@@ -1162,13 +2131,15 @@ def health_check():
 @app.route('/api/debug', methods=['GET'])
 def debug_endpoint():
     """Debug endpoint to check what's loaded"""
+    bundle = BUNDLE
+    labels_map = bundle.labels_map if bundle else {}
     
     # Check if 'hello' exists in our vocabulary
     hello_exists = False
     hello_index = -1
     
-    if LABELS_MAP:
-        for idx, word in LABELS_MAP.items():
+    if labels_map:
+        for idx, word in labels_map.items():
             if word.lower() == 'hello':
                 hello_exists = True
                 hello_index = idx
@@ -1177,11 +2148,12 @@ def debug_endpoint():
     return jsonify({
         "success": True,
         "model_loaded": MODEL_LOADED,
-        "labels_map_size": len(LABELS_MAP) if LABELS_MAP else 0,
-        "sample_labels": list(LABELS_MAP.values())[:20] if LABELS_MAP else [],
-        "scaler_loaded": SCALER is not None,
-        "model_object_loaded": MODEL is not None,
-        "buffer_size": len(FRAME_BUFFER),
+        "labels_map_size": len(labels_map) if labels_map else 0,
+        "sample_labels": list(labels_map.values())[:20] if labels_map else [],
+        "scaler_loaded": bundle is not None,
+        "model_object_loaded": bundle is not None,
+        "model_version": bundle.version if bundle else None,
+        "buffer_size": current_buffer_size(),
         "sequence_length": SEQUENCE_LENGTH,
         "feature_dim": FEATURE_DIM,
         "confidence_threshold": CONFIDENCE_THRESHOLD,
@@ -1191,14 +2163,15 @@ def debug_endpoint():
         "hello_debug": {
             "exists_in_vocabulary": hello_exists,
             "hello_index": hello_index,
-            "all_words_containing_hello": [word for word in LABELS_MAP.values() if 'hello' in word.lower()] if LABELS_MAP else []
+            "all_words_containing_hello": [word for word in labels_map.values() if 'hello' in word.lower()] if labels_map else []
         },
         
         # Model shape info
         "model_info": {
-            "input_shape": str(MODEL.input_shape) if MODEL else None,
-            "output_shape": str(MODEL.output_shape) if MODEL else None,
-            "num_classes_from_model": MODEL.output_shape[-1] if MODEL else None
+            "inference_backend": bundle.model.name if bundle else None,
+            "input_shape": str(bundle.model.input_shape) if bundle else None,
+            "output_shape": str(bundle.model.output_shape) if bundle else None,
+            "num_classes_from_model": bundle.model.output_shape[-1] if bundle else None
         },
         
         "artifacts_status": {
@@ -1206,7 +2179,7 @@ def debug_endpoint():
             "artifacts_dir_exists": Path('artifacts').exists(),
             "word_mappings_exists": Path('artifacts/word_mappings.json').exists(),
             "scaler_exists": Path('artifacts/scaler.pkl').exists(),
-            "model_files": [f.name for f in Path('models').glob('*.h5')] + [f.name for f in Path('models').glob('*.keras')] if Path('models').exists() else []
+            "model_files": [f.name for f in Path('models').glob('*.h5')] + [f.name for f in Path('models').glob('*.keras')] + [f.name for f in Path('models').glob('*.tflite')] + [f.name for f in Path('models').glob('*.npz')] if Path('models').exists() else []
         }
     })
 
@@ -1216,14 +2189,15 @@ if __name__ == '__main__':
     print("="*70)
     
     # Load MLOps artifacts with detailed feedback
+    configure_cpu_threads()
     if load_mlops_artifacts():
-        word_count = len(LABELS_MAP) if LABELS_MAP else 0
-        sample_words = list(LABELS_MAP.values())[:10] if LABELS_MAP else []
+        word_count = len(BUNDLE.labels_map)
+        sample_words = list(BUNDLE.labels_map.values())[:10]
         
         print(f"âœ… Server ready with {word_count} sign classes")
         print(f"ðŸ“ Sample words: {sample_words}")
         print(f"ðŸŽ¯ Model loaded: {MODEL_LOADED}")
-        print(f"ðŸŽ¯ Scaler loaded: {SCALER is not None}")
+        print(f"ðŸŽ¯ Model version: {BUNDLE.version}")
         print("="*70)
         print("ðŸŒ Available endpoints:")
         print("   ðŸ“Š Status: http://localhost:5000/api/status")
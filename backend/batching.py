@@ -0,0 +1,139 @@
+"""
+Dynamic micro-batching for model inference
+Concurrent requests submit single sequences; a worker thread groups them into
+one forward pass and hands each caller its own row through a Future.
+A sequence that finds nothing else queued is run at once, so a lightly loaded
+worker never pays the batching wait.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+QUEUE_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+class _PendingItem:
+    __slots__ = ('sequence', 'predict_fn', 'future', 'enqueued_at')
+
+    def __init__(self, sequence, predict_fn):
+        self.sequence = sequence
+        self.predict_fn = predict_fn
+        self.future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class BatchScheduler:
+    """Collects (SEQUENCE_LENGTH, FEATURE_DIM) sequences for up to max_wait_ms or max_batch items"""
+
+    def __init__(self, max_batch=32, max_wait_ms=5.0, timeout=30.0):
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.timeout = timeout  # Seconds predict() waits for its row before raising concurrent.futures.TimeoutError
+
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_histogram = Histogram(QUEUE_WAIT_BUCKETS)
+
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_pid = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, sequence, predict_fn):
+        """Queue one sequence, returns a Future resolving to its probability row"""
+        self._ensure_worker()
+        item = _PendingItem(sequence, predict_fn)
+        self._queue.put(item)
+        return item.future
+
+    def predict(self, sequence, predict_fn, timeout=None):
+        """Blocking helper: submit one sequence and wait up to timeout (default self.timeout) for its probabilities"""
+        return self.submit(sequence, predict_fn).result(timeout=self.timeout if timeout is None else timeout)
+
+    def stats(self):
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "queue_depth": self._queue.qsize(),
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "queue_wait_seconds": self.queue_wait_histogram.snapshot()
+        }
+
+    def _ensure_worker(self):
+        # Threads do not survive fork(), so a worker started in a parent process is restarted here
+        pid = os.getpid()
+        if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+                return
+            if self._worker_pid != pid:
+                self._queue = queue.Queue()
+            self._worker = threading.Thread(target=self._run, name='batch-scheduler', daemon=True)
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _collect(self):
+        first = self._queue.get()
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+
+        # A lone request is dispatched at once, max_wait only applies when others are already queued
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if len(batch) == 1:
+            return batch
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            dispatched_at = time.perf_counter()
+
+            # Items may target different models (e.g. during a reload), run one pass per model
+            groups = {}
+            for item in batch:
+                groups.setdefault(item.predict_fn, []).append(item)
+
+            for predict_fn, items in groups.items():
+                self.batch_size_histogram.observe(len(items))
+                for item in items:
+                    self.queue_wait_histogram.observe(dispatched_at - item.enqueued_at)
+
+                try:
+                    inputs = np.stack([item.sequence for item in items]).astype(np.float32, copy=False)
+                    outputs = np.asarray(predict_fn(inputs))
+                    if len(outputs) != len(items):
+                        raise ValueError(f"Model returned {len(outputs)} rows for a batch of {len(items)}")
+                except Exception as e:
+                    logger.error(f"Batched prediction failed for {len(items)} items: {e}")
+                    for item in items:
+                        item.future.set_exception(e)
+                    continue
+
+                for item, row in zip(items, outputs):
+                    item.future.set_result(row)
@@ -16,6 +16,8 @@ from tqdm import tqdm
 import warnings
 warnings.filterwarnings('ignore')
 
+from frame_decode import FrameDecoder
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -45,12 +47,17 @@ class LandmarkExtractor:
             min_tracking_confidence=0.5
         )
         
-    def extract_hand_landmarks(self, image):
+        # Video frames -> 640x480 RGB, written into one reused buffer
+        self.frame_decoder = FrameDecoder()
+        self._frame = self.frame_decoder.new_buffer()
+        
+    def extract_hand_landmarks(self, image, rgb=False):
         """
         Extract hand landmarks EXACTLY as frontend
         Returns: 126-dim vector [left_hand(63), right_hand(63)]
+        image is BGR unless rgb is set
         """
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        rgb_image = image if rgb else cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         
         # Detect hands and pose
         hands_results = self.hands.process(rgb_image)
@@ -173,11 +180,11 @@ class LandmarkExtractor:
                 break
             
             if current_frame in frame_indices:
-                # Resize for consistency
-                frame = cv2.resize(frame, (640, 480))
+                # Resize for consistency (and convert to RGB once)
+                frame = self.frame_decoder.convert(frame, out=self._frame)
                 
                 # Extract landmarks
-                landmarks, _ = self.extract_hand_landmarks(frame)
+                landmarks, _ = self.extract_hand_landmarks(frame, rgb=True)
                 landmarks_sequence.append(landmarks)
             
             current_frame += 1
@@ -273,8 +280,8 @@ def main():
                 cap.release()
                 
                 if ret:
-                    frame = cv2.resize(frame, (640, 480))
-                    _, hands_results = extractor.extract_hand_landmarks(frame)
+                    frame = extractor.frame_decoder.convert(frame)
+                    _, hands_results = extractor.extract_hand_landmarks(frame, rgb=True)
                     
                     # Draw landmarks on black canvas
                     viz_frame = extractor.draw_landmarks(frame, hands_results)
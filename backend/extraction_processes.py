@@ -0,0 +1,319 @@
+"""
+Multi-process landmark extraction over shared memory
+MediaPipe holds the GIL for long stretches of process(), so threads in one
+server process cannot spread extraction over cores. ExtractionProcessPool runs
+worker processes that each own their own Hands/Pose graphs. The server copies
+a decoded frame into a slot of a shared frame array and queues only
+(slot, stream key); the worker writes the landmark vector and hand count into
+the same slot of a shared result array. Frames are never pickled.
+
+Frames of one stream key always go to the same worker, which keeps that
+stream's tracking graphs and its ShoulderTracker / HandRoiTracker.
+
+Each worker reports on its own pipe, so a worker that dies (or is killed
+because it hung) is noticed at once and cannot take a lock shared with the
+other workers down with it. Jobs carry a ticket; a late answer for a slot that
+has been failed and handed out again is ignored.
+"""
+
+import atexit
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import numpy as np
+
+from metrics import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+FRAME_SHAPE = (480, 640, 3)  # decode_frame() output, RGB
+FEATURE_DIM = 126
+RESULT_WIDTH = FEATURE_DIM + 1  # landmark vector, hands detected
+MAX_STREAMS_PER_WORKER = 256  # Trackers kept per worker, least recently used dropped first
+ROUND_TRIP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _worker_main(frames_name, results_name, num_slots, jobs, done, tracker_config):
+    """Extraction process: block on jobs, extract the frame in each slot, report on the done pipe"""
+    from hand_roi import HandRoiTracker
+    from landmark_extractor import EnhancedLandmarkExtractor
+    from shoulder_tracking import ShoulderTracker
+
+    frames_shm = shared_memory.SharedMemory(name=frames_name)
+    results_shm = shared_memory.SharedMemory(name=results_name)
+    frames = np.ndarray((num_slots,) + FRAME_SHAPE, dtype=np.uint8, buffer=frames_shm.buf)
+    results = np.ndarray((num_slots, RESULT_WIDTH), dtype=np.float32, buffer=results_shm.buf)
+
+    extractor = EnhancedLandmarkExtractor()
+    streams = OrderedDict()  # stream key -> (shoulder_tracker, hand_roi)
+    shoulder_config = tracker_config.get('shoulder')
+    hand_roi_config = tracker_config.get('hand_roi')
+
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            slot, ticket, stream_key = job
+            try:
+                trackers = streams.get(stream_key) if stream_key is not None else None
+                if trackers is None:
+                    trackers = (
+                        ShoulderTracker(**shoulder_config) if shoulder_config else None,
+                        HandRoiTracker(**hand_roi_config) if hand_roi_config else None
+                    )
+                    if stream_key is not None:
+                        streams[stream_key] = trackers
+                        while len(streams) > MAX_STREAMS_PER_WORKER:
+                            streams.popitem(last=False)
+                elif stream_key is not None:
+                    streams.move_to_end(stream_key)
+
+                vector, hands_detected, _ = extractor.extract_hand_landmarks(
+                    frames[slot], shoulder_tracker=trackers[0], hand_roi=trackers[1], rgb=True)
+                results[slot, :FEATURE_DIM] = vector
+                results[slot, FEATURE_DIM] = hands_detected
+                done.send((slot, ticket, None))
+            except Exception as e:
+                done.send((slot, ticket, str(e)))
+    finally:
+        done.close()
+        del frames, results
+        frames_shm.close()
+        results_shm.close()
+
+
+class ExtractionProcessStats:
+    """Frames sent to extraction processes, failures and the server-side round trip"""
+
+    def __init__(self):
+        self.frames = Counter()
+        self.errors = Counter()
+        self.timeouts = Counter()
+        self.restarts = Counter()
+        self.round_trip_histogram = Histogram(ROUND_TRIP_BUCKETS)
+
+    def snapshot(self):
+        return {
+            "frames": self.frames.value,
+            "errors": self.errors.value,
+            "timeouts": self.timeouts.value,
+            "restarts": self.restarts.value,
+            "round_trip_seconds": self.round_trip_histogram.snapshot()
+        }
+
+
+class ExtractionProcessPool:
+    """num_processes extraction workers fed through slots_per_process shared frame slots each"""
+
+    def __init__(self, num_processes, tracker_config=None, slots_per_process=2, timeout=30.0, stats=None):
+        self.num_processes = max(1, int(num_processes))
+        self.num_slots = self.num_processes * max(1, int(slots_per_process))
+        self.tracker_config = tracker_config or {}
+        self.timeout = timeout
+        self.stats = stats or ExtractionProcessStats()
+
+        self._context = multiprocessing.get_context('spawn')  # fork() would copy this process's threads and graphs
+        self._owner_pid = None
+        self._start_lock = threading.Lock()
+        self._route_lock = threading.Lock()
+        self._next_worker = 0
+        self._tickets = itertools.count()
+
+    def extract(self, frame, stream_key=None):
+        """(landmark_vector, hands_detected) of a decoded RGB FRAME_SHAPE frame, extracted in a worker process"""
+        if frame.shape != FRAME_SHAPE:
+            raise ValueError(f"Frames must be {FRAME_SHAPE}, got {frame.shape}")
+        self._ensure_started()
+        started = time.perf_counter()
+
+        worker = self._route(stream_key)
+        if not self._processes[worker].is_alive():
+            self._restart(worker)
+
+        try:
+            slot = self._free_slots.get(timeout=self.timeout)
+        except queue.Empty:
+            self.stats.timeouts.inc()
+            raise TimeoutError(f"No shared frame slot free within {self.timeout}s")
+        future = Future()
+        ticket = next(self._tickets)
+        with self._pending_lock:
+            self._pending[slot] = (future, worker, ticket)
+        np.copyto(self._frames[slot], frame)
+        self._jobs[worker].put((slot, ticket, stream_key))
+
+        try:
+            row, error = future.result(timeout=self.timeout)
+        except FutureTimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            self.stats.timeouts.inc()
+            # The worker is stuck on this slot: replace it, which fails its jobs and frees their slots
+            self._restart(worker, hung=True)
+            raise TimeoutError(f"Extraction process {worker} did not answer within {self.timeout}s")
+        self.stats.frames.inc()
+        self.stats.round_trip_histogram.observe(time.perf_counter() - started)
+        if error is not None:
+            self.stats.errors.inc()
+            raise RuntimeError(f"Extraction process {worker} failed: {error}")
+        return row[:FEATURE_DIM].astype(np.float64), int(row[FEATURE_DIM])
+
+    def warmup(self, frame):
+        """Start the workers and push frame through each of them, returns seconds"""
+        started = time.perf_counter()
+        self._ensure_started()
+        for worker in range(self.num_processes):
+            # Round-robin routing, so one call per worker
+            self.extract(frame)
+        return time.perf_counter() - started
+
+    def snapshot(self):
+        started = self._owner_pid == os.getpid()
+        return {
+            "processes": self.num_processes,
+            "slots": self.num_slots,
+            "alive": sum(process.is_alive() for process in self._processes) if started else 0,
+            "slots_in_use": self.num_slots - self._free_slots.qsize() if started else 0,
+            **self.stats.snapshot()
+        }
+
+    def close(self):
+        if self._owner_pid != os.getpid():
+            return
+        self._closing = True
+        for jobs in self._jobs:
+            jobs.put(None)
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._wake.send(None)
+        for shm in (self._frames_shm, self._results_shm):
+            shm.close()
+            shm.unlink()
+        self._owner_pid = None
+
+    def _ensure_started(self):
+        # Started lazily in the process that uses the pool, so a gunicorn master never owns workers
+        pid = os.getpid()
+        if self._owner_pid == pid:
+            return
+        with self._start_lock:
+            if self._owner_pid == pid:
+                return
+            frame_bytes = int(np.prod(FRAME_SHAPE))
+            self._frames_shm = shared_memory.SharedMemory(create=True, size=self.num_slots * frame_bytes)
+            self._results_shm = shared_memory.SharedMemory(create=True, size=self.num_slots * RESULT_WIDTH * 4)
+            self._frames = np.ndarray((self.num_slots,) + FRAME_SHAPE, dtype=np.uint8, buffer=self._frames_shm.buf)
+            self._results = np.ndarray((self.num_slots, RESULT_WIDTH), dtype=np.float32, buffer=self._results_shm.buf)
+
+            self._free_slots = queue.Queue()
+            for slot in range(self.num_slots):
+                self._free_slots.put(slot)
+            self._pending = {}
+            self._pending_lock = threading.Lock()
+
+            self._closing = False
+            self._readers = {}  # done pipe -> (worker, process) it belongs to
+            self._readers_lock = threading.Lock()  # _spawn runs on request threads, the collector reads and drops pipes
+            self._wake_reader, self._wake = self._context.Pipe(duplex=False)  # Rebuilds the collector's wait list
+            self._jobs = [self._context.Queue() for _ in range(self.num_processes)]
+            self._processes = [None] * self.num_processes
+            for worker in range(self.num_processes):
+                self._spawn(worker)
+
+            threading.Thread(target=self._collect, name='extraction-results', daemon=True).start()
+            self._owner_pid = pid
+            atexit.register(self.close)
+            logger.info(f"Started {self.num_processes} landmark extraction processes with {self.num_slots} shared frame slots")
+
+    def _spawn(self, worker):
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._frames_shm.name, self._results_shm.name, self.num_slots,
+                  self._jobs[worker], writer, self.tracker_config),
+            name=f'landmark-extraction-{worker}',
+            daemon=True
+        )
+        process.start()
+        writer.close()  # Only the worker holds the write end, so its exit shows up as EOF
+        self._processes[worker] = process
+        with self._readers_lock:
+            self._readers[reader] = (worker, process)
+        self._wake.send(None)
+
+    def _restart(self, worker, hung=False):
+        """Replace a dead (or hung) worker and fail the jobs it took down with it"""
+        with self._start_lock:
+            process = self._processes[worker]
+            if self._closing or (process.is_alive() and not hung):
+                return
+            if process.is_alive():
+                logger.error(f"Extraction process {worker} hung, killing and restarting it")
+                process.kill()
+                process.join(timeout=5)
+            else:
+                logger.error(f"Extraction process {worker} died (exit code {process.exitcode}), restarting it")
+            self.stats.restarts.inc()
+            self._jobs[worker] = self._context.Queue()
+            with self._pending_lock:
+                lost = [(slot, ticket) for slot, (_, owner, ticket) in self._pending.items() if owner == worker]
+            for slot, ticket in lost:
+                self._complete(slot, ticket, "extraction process died")
+            self._spawn(worker)
+
+    def _route(self, stream_key):
+        if stream_key is None:
+            with self._route_lock:
+                self._next_worker = (self._next_worker + 1) % self.num_processes
+                return self._next_worker
+        return zlib.crc32(str(stream_key).encode('utf-8')) % self.num_processes
+
+    def _collect(self):
+        while not self._closing:
+            with self._readers_lock:
+                conns = [self._wake_reader, *self._readers]
+            for conn in wait(conns):
+                # Nothing restarts this thread, so one bad message must not end it
+                try:
+                    self._receive(conn)
+                except Exception as e:
+                    logger.error(f"Extraction result collector error: {e}")
+
+    def _receive(self, conn):
+        if conn is self._wake_reader:
+            conn.recv()
+            return
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            # The worker exited: drop its pipe, and replace it unless that already happened
+            with self._readers_lock:
+                worker, process = self._readers.pop(conn)
+            conn.close()
+            if self._processes[worker] is process:
+                process.join(timeout=5)  # Its pipe closes just before it can be reaped
+                self._restart(worker)
+            return
+        self._complete(*message)
+
+    def _complete(self, slot, ticket, error):
+        with self._pending_lock:
+            pending = self._pending.get(slot)
+            if pending is None or pending[2] != ticket:
+                return  # Late answer for a job that was already failed
+            del self._pending[slot]
+        # Copy the row out before the slot can be handed to the next frame
+        pending[0].set_result((self._results[slot].copy(), error))
+        self._free_slots.put(slot)
@@ -0,0 +1,207 @@
+"""
+Bounded pool of landmark extractors for concurrent requests
+MediaPipe's Hands/Pose graphs run in tracking mode (static_image_mode=False),
+so each one holds the previous frame's hands and can only serve one caller at
+a time. The pool creates extractors lazily up to max_size and hands them out
+with checkout()/return semantics. A session key is pinned to one extractor, so
+consecutive frames of a client keep tracking continuity and frames of
+different clients only share a graph once there are more sessions than
+extractors.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from metrics import Counter, Histogram
+
+WAIT_SECONDS_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+_GROW = object()  # _slot_for: build a new extractor for this caller
+
+
+class ExtractorPoolStats:
+    """Checkouts, how many had to wait for their extractor and for how long"""
+
+    def __init__(self):
+        self.checkouts = Counter()
+        self.waits = Counter()
+        self.timeouts = Counter()
+        self.created = Counter()
+        self.wait_histogram = Histogram(WAIT_SECONDS_BUCKETS)
+
+    def snapshot(self):
+        checkouts = self.checkouts.value
+        return {
+            "checkouts": checkouts,
+            "waits": self.waits.value,
+            "wait_ratio": self.waits.value / checkouts if checkouts else 0.0,
+            "timeouts": self.timeouts.value,
+            "created": self.created.value,
+            "wait_seconds": self.wait_histogram.snapshot()
+        }
+
+
+class _Slot:
+    __slots__ = ('extractor', 'busy', 'sessions')
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.busy = True  # Created for the caller that asked for it
+        self.sessions = 0  # Session keys pinned to this extractor
+
+
+class ExtractorPool:
+    """Up to max_size extractors built by factory, pinned per session key"""
+
+    def __init__(self, factory, max_size=None, session_ttl=300.0, stats=None):
+        self.factory = factory
+        self.max_size = max(1, int(max_size or os.cpu_count() or 1))
+        self.session_ttl = session_ttl  # Pins unused for this long are dropped
+        self.stats = stats or ExtractorPoolStats()
+
+        self._slots = []
+        self._creating = 0
+        self._pins = OrderedDict()  # session key -> (slot, last use), in use order
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        return len(self._slots)
+
+    @property
+    def in_use(self):
+        return sum(slot.busy for slot in self._slots)
+
+    @contextmanager
+    def checkout(self, key=None, timeout=None):
+        """Borrow an extractor, the one pinned to key when given; raises TimeoutError after timeout seconds"""
+        slot = self._acquire(key, timeout)
+        try:
+            yield slot.extractor
+        finally:
+            with self._cond:
+                slot.busy = False
+                self._cond.notify_all()
+
+    def any_extractor(self):
+        """An extractor for the graph-free helpers (drawing, keypoints), not checked out"""
+        with self._cond:
+            if self._slots:
+                return self._slots[0].extractor
+        with self.checkout() as extractor:
+            return extractor
+
+    def forget(self, key):
+        """Unpin a session key, e.g. when its session ends"""
+        with self._cond:
+            pinned = self._pins.pop(key, None)
+            if pinned is not None:
+                pinned[0].sessions -= 1
+
+    def snapshot(self):
+        with self._cond:
+            size, in_use, pinned = len(self._slots), self.in_use, len(self._pins)
+        return {
+            "max_size": self.max_size,
+            "size": size,
+            "in_use": in_use,
+            "pinned_sessions": pinned,
+            **self.stats.snapshot()
+        }
+
+    def _acquire(self, key, timeout):
+        started = time.perf_counter()
+        deadline = None if timeout is None else started + timeout
+        waited = False
+        with self._cond:
+            while True:
+                slot = self._slot_for(key)
+                if slot is _GROW:
+                    # Reserved (and pinned) before building, so a concurrent checkout
+                    # for the same key waits for this extractor instead of building another
+                    slot = _Slot(None)
+                    self._creating += 1
+                    if key is not None:
+                        self._pin(key, slot)
+                    break
+                if slot is not None and not slot.busy:
+                    slot.busy = True
+                    self._record(started, waited)
+                    return slot
+                waited = True
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self.stats.timeouts.inc()
+                    raise TimeoutError(f"No landmark extractor free after {timeout}s")
+                self._cond.wait(remaining)
+
+        # Building the MediaPipe graphs takes a while, other checkouts go on meanwhile
+        try:
+            slot.extractor = self.factory()
+        except Exception:
+            with self._cond:
+                self._creating -= 1
+                self._unpin_slot(slot)
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._creating -= 1
+            self._slots.append(slot)
+            self.stats.created.inc()
+            self._record(started, waited)
+        return slot
+
+    def _slot_for(self, key):
+        """Slot the caller should take or wait for, _GROW to build a new one, None to wait for any change"""
+        self._expire_pins(time.monotonic())
+        can_grow = len(self._slots) + self._creating < self.max_size
+
+        if key is None:
+            idle = next((slot for slot in self._slots if not slot.busy), None)
+            return idle if idle is not None else _GROW if can_grow else None
+
+        pinned = self._pins.get(key)
+        if pinned is not None:
+            self._pins[key] = (pinned[0], time.monotonic())
+            self._pins.move_to_end(key)
+            return pinned[0]
+
+        # New session: an extractor nobody is pinned to, a new one, or the least shared one
+        unpinned = next((slot for slot in self._slots if slot.sessions == 0 and not slot.busy), None)
+        if unpinned is None:
+            if can_grow:
+                return _GROW
+            if not self._slots:
+                return None
+            unpinned = min(self._slots, key=lambda slot: (slot.sessions, slot.busy))
+        self._pin(key, unpinned)
+        return unpinned
+
+    def _pin(self, key, slot):
+        previous = self._pins.get(key)
+        if previous is not None:
+            previous[0].sessions -= 1
+        self._pins[key] = (slot, time.monotonic())
+        self._pins.move_to_end(key)
+        slot.sessions += 1
+
+    def _unpin_slot(self, slot):
+        for key in [key for key, (pinned, _) in self._pins.items() if pinned is slot]:
+            del self._pins[key]
+            slot.sessions -= 1
+
+    def _expire_pins(self, now):
+        # Pins are kept in use order, so stale ones are always at the front
+        while self._pins:
+            key, (slot, last_use) = next(iter(self._pins.items()))
+            if now - last_use < self.session_ttl:
+                break
+            self._pins.popitem(last=False)
+            slot.sessions -= 1
+
+    def _record(self, started, waited):
+        self.stats.checkouts.inc()
+        if waited:
+            self.stats.waits.inc()
+            self.stats.wait_histogram.observe(time.perf_counter() - started)
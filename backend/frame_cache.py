@@ -0,0 +1,90 @@
+"""
+Frame-level dedup cache for landmark extraction
+Countdowns and pauses produce runs of identical (or nearly identical) frames.
+FrameCache maps a digest of the encoded image to the extraction result, so a
+repeated frame skips cv2.imdecode and both MediaPipe graphs. With a tolerance
+set, frames whose small grayscale thumbnail is within that mean absolute
+difference of a cached one also count as repeats (this needs a decode).
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from metrics import Counter
+
+THUMBNAIL_SIZE = (32, 24)  # (width, height) of the similarity signature
+
+
+class FrameCacheStats:
+    """Counters shared by all frame caches"""
+
+    def __init__(self):
+        self.exact_hits = Counter()
+        self.similar_hits = Counter()
+        self.misses = Counter()
+
+    def snapshot(self):
+        hits = self.exact_hits.value + self.similar_hits.value
+        lookups = hits + self.misses.value
+        return {
+            "exact_hits": self.exact_hits.value,
+            "similar_hits": self.similar_hits.value,
+            "misses": self.misses.value,
+            "hit_ratio": hits / lookups if lookups else 0.0
+        }
+
+
+class FrameCache:
+    """Bounded LRU from encoded-frame digest to an extraction result, for one session or request"""
+
+    def __init__(self, max_entries=8, tolerance=0.0, stats=None):
+        self.max_entries = max(1, int(max_entries))
+        self.tolerance = tolerance  # Mean absolute thumbnail difference (0-255 gray levels), 0 disables near matches
+        self.stats = stats or FrameCacheStats()
+        self._entries = OrderedDict()  # digest -> (signature, value)
+        self._signatures = {}  # digest -> signature computed by get_similar, kept for put
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(encoded):
+        """Digest of the encoded frame bytes (bytes or a uint8 array)"""
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
+    def get(self, key):
+        """Cached value for byte-identical frames, None otherwise (not counted as a miss yet)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.stats.exact_hits.inc()
+        return entry[1]
+
+    def get_similar(self, key, frame):
+        """After get() missed: cached value of a frame within tolerance of the decoded frame, else None (a miss)"""
+        if self.tolerance > 0:
+            signature = self.signature(frame)
+            self._signatures[key] = signature
+            for cached_key, (cached_signature, value) in reversed(self._entries.items()):
+                if cached_signature is not None and np.mean(np.abs(cached_signature - signature)) <= self.tolerance:
+                    self._entries.move_to_end(cached_key)
+                    self.stats.similar_hits.inc()
+                    return value
+        self.stats.misses.inc()
+        return None
+
+    def put(self, key, value):
+        self._entries[key] = (self._signatures.pop(key, None), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._signatures.clear()
+
+    @staticmethod
+    def signature(frame):
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)  # decode_frame() output is RGB
+        return cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
@@ -0,0 +1,109 @@
+"""
+Frame decoding shared by the server and the data scripts
+MediaPipe wants RGB at 640x480, uploads arrive as JPEGs at whatever resolution
+the client captured. imdecode + resize + cvtColor makes three passes over the
+full-size image. FrameDecoder lets libjpeg decode at the largest reduction
+(1/2, 1/4, 1/8) that still covers the target, only resizes when the decoded
+size differs from the target, and converts to RGB once, into a caller-owned
+buffer when frames are consumed one at a time.
+"""
+
+import threading
+
+import cv2
+import numpy as np
+
+from metrics import StageTimer
+
+TARGET_SIZE = (640, 480)  # (width, height) every extractor input is scaled to
+REDUCED_DECODE_FLAGS = {8: cv2.IMREAD_REDUCED_COLOR_8, 4: cv2.IMREAD_REDUCED_COLOR_4, 2: cv2.IMREAD_REDUCED_COLOR_2}  # Largest first
+# Start-of-frame markers carry the image size; C4 (DHT), C8 (JPG) and CC (DAC) share the range
+SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def jpeg_size(data):
+    """(width, height) from a JPEG's start-of-frame header, None when data is not a JPEG"""
+    buf = memoryview(data).cast('B')
+    if len(buf) < 4 or buf[0] != 0xFF or buf[1] != 0xD8:
+        return None
+    i = 2
+    while i + 9 < len(buf):
+        if buf[i] != 0xFF:
+            return None
+        marker = buf[i + 1]
+        if marker == 0xFF:  # Fill byte
+            i += 1
+        elif marker in SOF_MARKERS:
+            return (buf[i + 7] << 8) | buf[i + 8], (buf[i + 5] << 8) | buf[i + 6]
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:  # Markers without a length
+            i += 2
+        elif marker == 0xDA:  # Scan data before any frame header
+            return None
+        else:
+            i += 2 + ((buf[i + 2] << 8) | buf[i + 3])
+    return None
+
+
+def decode_scale(source_size, target_size=TARGET_SIZE):
+    """Largest libjpeg reduction of source_size still at least target_size, 1 for a full decode"""
+    width, height = source_size
+    for scale in REDUCED_DECODE_FLAGS:
+        if -(-width // scale) >= target_size[0] and -(-height // scale) >= target_size[1]:
+            return scale
+    return 1
+
+
+class FrameDecoder:
+    """Encoded images and BGR video frames -> RGB frames at size"""
+
+    def __init__(self, size=TARGET_SIZE, reduced_decode=True, stage_timer=None):
+        self.size = tuple(size)
+        self.reduced_decode = reduced_decode
+        # Per-stage latency (imdecode, resize, color_convert)
+        self.stage_timer = stage_timer or StageTimer()
+        self._local = threading.local()  # Resize scratch buffer per thread
+
+    def decode(self, encoded, out=None):
+        """Encoded (JPEG, PNG, ...) uint8 buffer -> RGB frame, None when it cannot be decoded
+
+        out: (height, width, 3) uint8 array the frame is written into. Only pass a
+        buffer that is reused once the previous frame has been consumed.
+        """
+        source_size = jpeg_size(encoded) if self.reduced_decode else None
+        scale = decode_scale(source_size, self.size) if source_size is not None else 1
+        flags = REDUCED_DECODE_FLAGS.get(scale, cv2.IMREAD_COLOR)
+
+        with self.stage_timer.time('imdecode'):
+            frame = cv2.imdecode(encoded, flags)
+        if frame is None:
+            return None
+
+        if source_size is None:
+            source_size = (frame.shape[1], frame.shape[0])
+        self.stage_timer.note('input_size', f"{source_size[0]}x{source_size[1]}")
+        self.stage_timer.note('input_bytes', len(encoded))
+        if scale > 1:
+            self.stage_timer.note('decode_scale', f"1/{scale}")
+        return self.convert(frame, out)
+
+    def convert(self, frame, out=None):
+        """BGR frame (decoded image or video frame) -> RGB at size, resizing only when the size differs"""
+        width, height = self.size
+        if frame.shape[1] != width or frame.shape[0] != height:
+            with self.stage_timer.time('resize'):
+                frame = cv2.resize(frame, self.size, dst=self._scratch())
+
+        with self.stage_timer.time('color_convert'):
+            if out is None:
+                return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
+
+    def new_buffer(self):
+        """Output buffer for decode()/convert(out=...)"""
+        return np.empty((self.size[1], self.size[0], 3), dtype=np.uint8)
+
+    def _scratch(self):
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = self.new_buffer()
+        return scratch
@@ -0,0 +1,61 @@
+"""
+Production serving: gunicorn with one worker process per core
+
+Usage (from backend/):
+  gunicorn -c gunicorn.conf.py app:app
+
+Environment:
+  WEB_CONCURRENCY     worker processes (default: number of cores)
+  GUNICORN_THREADS    threads per worker (default 4), each WebSocket holds one
+  PORT                listen port (default 5000)
+
+The app module is imported once in the master (preload_app). For fork-safe
+inference backends (numpy) the master also loads the model bundle, so weights,
+scaler, labels and the search index are shared copy-on-write by all workers.
+TensorFlow and TFLite start thread pools that do not survive fork(), so with
+those backends each worker loads its own model after the fork. MediaPipe
+graphs are always created per worker, after the fork.
+
+Thread pools (TF intra/inter-op, TFLite, OpenCV, BLAS) and the MediaPipe
+extractor pool get cores / workers threads / extractors each so the workers do
+not oversubscribe the machine.
+
+Alternatively, run a single worker (WEB_CONCURRENCY=1) with EXTRACTION_PROCESSES
+set to the core count: landmark extraction then runs in that many processes
+fed over shared memory, and every session lives in one server process.
+
+Session buffers (/api/predict/sign over HTTP) live in the worker that served
+the request, so clients that stream frames should use /ws/predict, whose
+connection stays on one worker. POST /api/reload only reloads the worker that
+handles it; set MODEL_WATCH_INTERVAL to hot-reload every worker.
+"""
+
+import multiprocessing
+import os
+
+cores = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', cores))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+preload_app = True
+timeout = 120
+graceful_timeout = 30
+accesslog = '-'
+
+# Read by app.py at import and by BLAS when numpy loads, so set before preload
+threads_per_worker = str(max(1, cores // workers))
+for name in ('WORKER_CPU_THREADS', 'TFLITE_NUM_THREADS', 'OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+    os.environ.setdefault(name, threads_per_worker)
+
+
+def when_ready(server):
+    """Master, after the app import and before the first fork"""
+    import app
+    app.preload_for_workers()
+
+
+def post_fork(server, worker):
+    import app
+    app.init_worker()
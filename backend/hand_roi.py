@@ -0,0 +1,79 @@
+"""
+Hand region-of-interest tracking for the landmark extractor
+MediaPipe's hand landmark model already runs on a crop around each hand, taken
+from the previous frame's landmarks. Palm detection over the whole frame is the
+expensive part, and the tracking graph still runs it on every frame while it
+holds fewer than max_num_hands hands. So with two allowed and one signing hand
+in view, every frame pays for a detection. HandRoiTracker remembers how many
+hands a session is tracking, so the extractor can run a graph with
+max_num_hands set to that count. That graph skips detection and only runs the
+landmark model on the hands' crops. Every redetect_interval tracked frames,
+one frame gets a full palm-detection pass, so hands entering the picture are
+found. When the tracked hands are lost, the next frame is detected in full too.
+"""
+
+from metrics import Counter
+
+
+class HandRoiStats:
+    """Counters shared by all ROI trackers"""
+
+    def __init__(self):
+        self.frames = Counter()
+        self.roi_frames = Counter()
+        self.tracks = Counter()
+        self.redetections = Counter()
+        self.track_losses = Counter()
+
+    def snapshot(self):
+        frames = self.frames.value
+        return {
+            "frames": frames,
+            "roi_frames": self.roi_frames.value,
+            "roi_ratio": self.roi_frames.value / frames if frames else 0.0,
+            "tracks": self.tracks.value,
+            "redetections": self.redetections.value,
+            "track_losses": self.track_losses.value
+        }
+
+
+class HandRoiTracker:
+    """Number of hands tracked for one session, and when to search the full frame again"""
+
+    def __init__(self, redetect_interval=15, stats=None):
+        self.redetect_interval = redetect_interval  # Tracked frames between full palm-detection passes
+        self.stats = stats or HandRoiStats()
+        self.hands = 0  # Hands in the current track, 0 when there is none
+        self._tracked_frames = 0
+
+    def begin_frame(self):
+        """Hands to track landmark-only in this frame, 0 for a full palm-detection pass"""
+        self.stats.frames.inc()
+        if not self.hands:
+            return 0
+        if self._tracked_frames >= self.redetect_interval:
+            # The track is kept, update() confirms or replaces it with what the full pass finds
+            self.stats.redetections.inc()
+            self._tracked_frames = 0
+            return 0
+        self._tracked_frames += 1
+        self.stats.roi_frames.inc()
+        return self.hands
+
+    def lost(self):
+        """The tracked hands were not found, the caller falls back to a full pass"""
+        self.stats.track_losses.inc()
+        self._end_track()
+
+    def update(self, hands):
+        """Hands found in this frame: a new count starts a new track, none ends it"""
+        if not hands:
+            self._end_track()
+        elif hands != self.hands:
+            self.stats.tracks.inc()
+            self.hands = hands
+            self._tracked_frames = 0
+
+    def _end_track(self):
+        self.hands = 0
+        self._tracked_frames = 0
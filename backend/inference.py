@@ -0,0 +1,208 @@
+"""
+Inference backends for the sign recognition server
+Every backend exposes the same small interface:
+  predict(batch) -> (B, num_classes) probabilities for a (B, sequence_length, feature_dim) batch
+  warmup(batch_sizes) -> {batch_size: seconds}
+  input_shape / output_shape
+The backend is picked at startup with the INFERENCE_BACKEND env var (see load_inference_backend).
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KERAS_MODEL_FILES = ['best_model.h5', 'model.h5', 'model.keras']
+TFLITE_VARIANTS = ('float32', 'float16', 'dynamic_int8')
+NUMPY_MODEL_FILE = 'model_numpy.npz'
+
+
+def tflite_model_path(models_dir, variant):
+    return Path(models_dir) / f"model_{variant}.tflite"
+
+
+class _BaseBackend:
+    """Shared warmup logic, subclasses implement predict()"""
+
+    name = 'base'
+    sequence_length = None
+    feature_dim = None
+    # True when the backend can advance a per-session state one frame at a time
+    supports_streaming = False
+
+    def warmup(self, batch_sizes=(1,)):
+        """Run dummy batches through the backend, returns seconds spent per batch size"""
+        timings = {}
+        for batch_size in batch_sizes:
+            dummy = np.zeros((batch_size, self.sequence_length, self.feature_dim), dtype=np.float32)
+            start = time.perf_counter()
+            self.predict(dummy)
+            timings[batch_size] = time.perf_counter() - start
+        return timings
+
+
+class KerasInferenceBackend(_BaseBackend):
+    """Keras model served through a traced tf.function instead of Model.predict
+
+    Model.predict builds a tf.data pipeline and callback stack on every call,
+    which dominates the cost of a (1, 30, 126) forward pass. The traced callable
+    has a fixed [None, sequence_length, feature_dim] float32 signature, so it is
+    traced once and reused for every batch size.
+    """
+
+    name = 'keras'
+
+    def __init__(self, model):
+        import tensorflow as tf
+
+        self._tf = tf
+        self.model = model
+        self.input_shape = model.input_shape
+        self.output_shape = model.output_shape
+        self.sequence_length, self.feature_dim = model.input_shape[1], model.input_shape[2]
+
+        input_spec = tf.TensorSpec([None, self.sequence_length, self.feature_dim], tf.float32)
+
+        @tf.function(input_signature=[input_spec])
+        def serve(inputs):
+            return model(inputs, training=False)
+
+        self._serve = serve
+
+    @classmethod
+    def load(cls, model_path):
+        import tensorflow as tf
+
+        return cls(tf.keras.models.load_model(str(model_path)))
+
+    def predict(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        return self._serve(self._tf.constant(batch)).numpy()
+
+
+def _tflite_interpreter_class():
+    """Prefer a standalone LiteRT/TFLite runtime package, fall back to full TensorFlow"""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteInferenceBackend(_BaseBackend):
+    """TFLite interpreter backend for CPU-only serving
+
+    The exported models have a batch-1 input, and resizing the input tensor
+    re-allocates the interpreter, so batches are run one row at a time. The
+    per-invoke overhead of TFLite is a few microseconds, far below the
+    Model.predict overhead this replaces.
+    """
+
+    name = 'tflite'
+
+    def __init__(self, model_path, num_threads=1):
+        Interpreter = _tflite_interpreter_class()
+
+        self.model_path = Path(model_path)
+        self.num_threads = num_threads
+        self.interpreter = Interpreter(model_path=str(model_path), num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self._input_index = input_details['index']
+        self._output_index = output_details['index']
+
+        _, self.sequence_length, self.feature_dim = [int(d) for d in input_details['shape']]
+        num_classes = int(output_details['shape'][-1])
+        self.input_shape = (None, self.sequence_length, self.feature_dim)
+        self.output_shape = (None, num_classes)
+
+        # Interpreter objects are not thread-safe
+        self._lock = threading.Lock()
+
+    def predict(self, batch):
+        batch = np.asarray(batch, dtype=np.float32)
+        outputs = np.empty((batch.shape[0], self.output_shape[-1]), dtype=np.float32)
+        with self._lock:
+            for i in range(batch.shape[0]):
+                self.interpreter.set_tensor(self._input_index, batch[i:i + 1])
+                self.interpreter.invoke()
+                outputs[i] = self.interpreter.get_tensor(self._output_index)[0]
+        return outputs
+
+
+class NumpyInferenceBackend(_BaseBackend):
+    """Pure-NumPy forward pass over weights exported by numpy_engine.export_numpy_weights
+
+    Does not import TensorFlow at all, which keeps startup time and resident
+    memory down. The engine holds no per-call state, so no lock is needed.
+    For causal models (--model_type streaming) step() advances a caller-owned
+    recurrent state by one frame instead of re-running the whole window.
+    """
+
+    name = 'numpy'
+
+    def __init__(self, model_path):
+        from numpy_engine import NumpyEngine
+
+        self.model_path = Path(model_path)
+        self.engine = NumpyEngine.load(model_path)
+        self.sequence_length, self.feature_dim = self.engine.sequence_length, self.engine.feature_dim
+        self.input_shape = (None, self.sequence_length, self.feature_dim)
+        self.output_shape = (None, self.engine.num_classes)
+
+    @property
+    def supports_streaming(self):
+        return self.engine.is_causal
+
+    def predict(self, batch):
+        return self.engine.predict(batch)
+
+    def initial_state(self):
+        """Per-session recurrent state before the first frame"""
+        return self.engine.initial_state(batch_size=1)
+
+    def step(self, frame, state):
+        """Advance one session by one (feature_dim,) frame, returns ((num_classes,) probabilities, new state)"""
+        outputs, state = self.engine.step(np.asarray(frame, dtype=np.float32).reshape(1, -1), state)
+        return outputs[0], state
+
+
+def load_inference_backend(backend_name, models_dir, tflite_variant='float32', tflite_num_threads=1):
+    """Load the requested backend from models_dir, returns None when its model file is missing"""
+    models_dir = Path(models_dir)
+
+    if backend_name == 'keras':
+        for model_file in KERAS_MODEL_FILES:
+            model_path = models_dir / model_file
+            if model_path.exists():
+                logger.info(f"Loading Keras model from {model_path}...")
+                return KerasInferenceBackend.load(model_path)
+        return None
+
+    if backend_name == 'tflite':
+        if tflite_variant not in TFLITE_VARIANTS:
+            raise ValueError(f"Unknown TFLite variant '{tflite_variant}', expected one of {TFLITE_VARIANTS}")
+        model_path = tflite_model_path(models_dir, tflite_variant)
+        if not model_path.exists():
+            return None
+        logger.info(f"Loading TFLite model from {model_path} ({tflite_num_threads} threads)...")
+        return TFLiteInferenceBackend(model_path, num_threads=tflite_num_threads)
+
+    if backend_name == 'numpy':
+        model_path = models_dir / NUMPY_MODEL_FILE
+        if not model_path.exists():
+            return None
+        logger.info(f"Loading NumPy engine weights from {model_path}...")
+        return NumpyInferenceBackend(model_path)
+
+    raise ValueError(f"Unknown inference backend '{backend_name}'")
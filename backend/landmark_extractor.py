@@ -0,0 +1,229 @@
+"""
+Hand landmark extraction shared by the server and the data scripts
+Kept free of Flask and TensorFlow so scripts can import it cheaply; MediaPipe
+itself is only imported when the first extractor is constructed.
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from metrics import StageTimer
+
+FEATURE_DIM = 126  # Left hand 21x3 + right hand 21x3
+MIN_HAND_CONFIDENCE = 0.5   # FIXED: Reduced from 0.7 to 0.5
+
+
+class EnhancedLandmarkExtractor:
+    """Enhanced landmark extractor matching the training preprocessing"""
+    
+    def __init__(self, stage_timer=None):
+        import mediapipe as mp
+        
+        # Per-stage latency (color_convert, hands, pose, landmark_packing)
+        self.stage_timer = stage_timer or StageTimer()
+        
+        self.mp_hands = mp.solutions.hands
+        self.mp_pose = mp.solutions.pose
+        self.mp_drawing = mp.solutions.drawing_utils
+        
+        self.hands = self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=MIN_HAND_CONFIDENCE,
+            min_tracking_confidence=0.5,
+            model_complexity=1
+        )
+        
+        # Frames of a HandRoiTracker go through their own tracking graphs, one per hand
+        # count (built on first use): with max_num_hands equal to the hands being tracked
+        # MediaPipe skips palm detection and only runs the landmark model
+        self.roi_hands = {}  # max_num_hands -> Hands graph
+        
+        self.pose = self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=1,
+            enable_segmentation=False,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        
+        # The graphs need strictly increasing timestamps, concurrent calls crash them
+        self._lock = threading.Lock()
+        
+    def extract_hand_landmarks(self, image, shoulder_tracker=None, hand_roi=None, rgb=False):
+        """Extract hand landmarks with enhanced normalization
+
+        Without a shoulder_tracker pose runs on every frame; with one, pose only
+        runs when the tracker asks for it and the tracked center is used otherwise.
+        With a hand_roi tracker tracked hands skip palm detection (see process_hands).
+        image is BGR unless rgb is set (frames from FrameDecoder are already RGB).
+        Calls are serialized, the MediaPipe graphs are not thread-safe.
+        """
+        with self._lock:
+            return self._extract_hand_landmarks(image, shoulder_tracker, hand_roi, rgb)
+    
+    def _extract_hand_landmarks(self, image, shoulder_tracker, hand_roi, rgb):
+        if rgb:
+            rgb_image = image
+        else:
+            with self.stage_timer.time('color_convert'):
+                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        
+        hands_results = self.process_hands(rgb_image, hand_roi)
+        
+        left_hand_landmarks = np.zeros(63)
+        right_hand_landmarks = np.zeros(63)
+        
+        h, w = image.shape[:2]
+        
+        shoulder_center = np.array([w/2, h/3])
+        if shoulder_tracker is None:
+            with self.stage_timer.time('pose'):
+                pose_results = self.pose.process(rgb_image)
+            if pose_results.pose_landmarks:
+                left_shoulder = pose_results.pose_landmarks.landmark[11]
+                right_shoulder = pose_results.pose_landmarks.landmark[12]
+                shoulder_center = np.array([
+                    (left_shoulder.x + right_shoulder.x) / 2 * w,
+                    (left_shoulder.y + right_shoulder.y) / 2 * h
+                ])
+        else:
+            tracked_center = self.track_shoulder_center(rgb_image, hands_results, shoulder_tracker)
+            if tracked_center is not None:
+                shoulder_center = tracked_center * np.array([w, h])
+        
+        packing_started = time.perf_counter()
+        hands_detected = 0
+        
+        if hands_results.multi_hand_landmarks and hands_results.multi_handedness:
+            for hand_landmarks, handedness in zip(hands_results.multi_hand_landmarks, hands_results.multi_handedness):
+                hand_confidence = handedness.classification[0].score
+                if hand_confidence < MIN_HAND_CONFIDENCE:
+                    continue
+                    
+                hand_label = handedness.classification[0].label
+                hands_detected += 1
+                
+                landmarks = []
+                for landmark in hand_landmarks.landmark:
+                    x = landmark.x * w
+                    y = landmark.y * h
+                    z = landmark.z
+                    
+                    x_norm = (x - shoulder_center[0]) / w
+                    y_norm = (y - shoulder_center[1]) / h
+                    z_norm = z
+                    
+                    landmarks.extend([x_norm, y_norm, z_norm])
+                
+                if hand_label == 'Left':
+                    left_hand_landmarks = np.array(landmarks)
+                else:
+                    right_hand_landmarks = np.array(landmarks)
+        
+        combined_landmarks = np.concatenate([left_hand_landmarks, right_hand_landmarks])
+        self.stage_timer.observe('landmark_packing', time.perf_counter() - packing_started)
+        
+        return combined_landmarks, hands_detected, hands_results
+    
+    def process_hands(self, rgb_image, hand_roi=None):
+        """Run the hands graph, landmark-only while hand_roi is tracking hands
+
+        Tracked frames run through the roi_hands graph for the track's hand
+        count, which never runs palm detection while it holds that many hands.
+        Finding no hands counts as track loss and the frame gets a full pass
+        instead, as do the periodic re-detection frames. Full passes go through
+        roi_hands[2], which the tracker only leaves holding fewer than two
+        hands, so it always runs detection (the main graph could still hold two
+        stale hands and skip it).
+        """
+        num_hands = hand_roi.begin_frame() if hand_roi is not None else 0
+        
+        hands_results = None
+        if num_hands:
+            with self.stage_timer.time('hands'):
+                hands_results = self.roi_graph(num_hands).process(rgb_image)
+            if not hands_results.multi_hand_landmarks:
+                hand_roi.lost()
+                hands_results = None
+        
+        if hands_results is None:
+            hands_graph = self.roi_graph(2) if hand_roi is not None else self.hands
+            with self.stage_timer.time('hands'):
+                hands_results = hands_graph.process(rgb_image)
+        
+        if hand_roi is not None:
+            hand_roi.update(len(hands_results.multi_hand_landmarks or []))
+        
+        return hands_results
+    
+    def roi_graph(self, num_hands):
+        """Tracking graph for HandRoiTracker frames with max_num_hands=num_hands"""
+        hands_graph = self.roi_hands.get(num_hands)
+        if hands_graph is None:
+            hands_graph = self.roi_hands[num_hands] = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=num_hands,
+                min_detection_confidence=MIN_HAND_CONFIDENCE,
+                min_tracking_confidence=0.5,
+                model_complexity=1
+            )
+        return hands_graph
+    
+    def track_shoulder_center(self, rgb_image, hands_results, shoulder_tracker):
+        """Shoulder center in normalized image coordinates, running pose only when the tracker asks for it"""
+        hand_centroid = None
+        if hands_results.multi_hand_landmarks:
+            hand_centroid = np.mean([
+                (landmark.x, landmark.y)
+                for hand_landmarks in hands_results.multi_hand_landmarks
+                for landmark in hand_landmarks.landmark
+            ], axis=0)
+        
+        if not shoulder_tracker.needs_pose(hand_centroid):
+            return shoulder_tracker.skip()
+        
+        measured_center = None
+        with self.stage_timer.time('pose'):
+            pose_results = self.pose.process(rgb_image)
+        if pose_results.pose_landmarks:
+            left_shoulder = pose_results.pose_landmarks.landmark[11]
+            right_shoulder = pose_results.pose_landmarks.landmark[12]
+            measured_center = np.array([
+                (left_shoulder.x + right_shoulder.x) / 2,
+                (left_shoulder.y + right_shoulder.y) / 2
+            ])
+        return shoulder_tracker.update(measured_center, hand_centroid)
+    
+    def draw_enhanced_landmarks(self, image, hands_results):
+        """Draw enhanced landmarks on image"""
+        if not hands_results.multi_hand_landmarks:
+            return image
+            
+        annotated_image = image.copy()
+        
+        for hand_landmarks in hands_results.multi_hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                annotated_image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
+                self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2)
+            )
+        
+        return annotated_image
+    
+    def hand_keypoints(self, hands_results):
+        """Raw 2D keypoints (normalized image coordinates) of every detected hand, for client-side drawing"""
+        if not hands_results.multi_hand_landmarks:
+            return []
+        
+        hands = []
+        for hand_landmarks, handedness in zip(hands_results.multi_hand_landmarks, hands_results.multi_handedness):
+            hands.append({
+                "handedness": handedness.classification[0].label,
+                "score": round(handedness.classification[0].score, 3),
+                "points": [[round(lm.x, 4), round(lm.y, 4)] for lm in hand_landmarks.landmark]
+            })
+        return hands
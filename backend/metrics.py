@@ -0,0 +1,285 @@
+"""
+Lightweight in-process metrics for the sign recognition server
+Histograms and counters are plain Python objects updated under a lock; the
+/metrics endpoint renders them in the Prometheus text exposition format.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Per-stage latency, from sub-millisecond packing up to a slow hands.process
+STAGE_SECONDS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Whole-request latency
+REQUEST_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Bucketed histogram with Prometheus-style cumulative 'le' buckets, safe across threads"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self):
+        """Return cumulative bucket counts, total count and sum"""
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative['+Inf'] = running + counts[-1]
+
+        return {
+            "buckets": cumulative,
+            "count": total_count,
+            "sum": total_sum,
+            "mean": total_sum / total_count if total_count else 0.0
+        }
+
+
+class Counter:
+    """Monotonic counter, safe across threads"""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self):
+        return self._value
+
+
+class LabeledHistogram:
+    """Histograms sharing bucket bounds, one per combination of label values"""
+
+    def __init__(self, label_names, buckets):
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def observe(self, value, *label_values):
+        self.labels(*label_values).observe(value)
+
+    def items(self):
+        """[(label dict, Histogram)] in label order"""
+        return [(dict(zip(self.label_names, values)), child) for values, child in sorted(self._children.items())]
+
+
+class LabeledCounter:
+    """Counters keyed by label values"""
+
+    def __init__(self, label_names):
+        self.label_names = tuple(label_names)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        child = self._children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(label_values, Counter())
+        child.inc(amount)
+
+    def items(self):
+        """[(label dict, value)] in label order"""
+        return [(dict(zip(self.label_names, values)), child.value) for values, child in sorted(self._children.items())]
+
+
+class RequestProfile:
+    """Stage timings of one request, filled in by StageTimer while the profile is active"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}  # stage -> [seconds, calls]
+        self.frames = {}  # frame index -> {stage: seconds, notes}
+        self.current_frame = None
+
+    def record(self, stage, seconds):
+        totals = self.stages.setdefault(stage, [0.0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+        if self.current_frame is not None:
+            self.current_frame[stage] = self.current_frame.get(stage, 0.0) + seconds
+
+    def summary(self):
+        """Milliseconds per stage (total and calls), per frame, and time not covered by any stage"""
+        total = time.perf_counter() - self.started
+        staged = sum(seconds for seconds, _ in self.stages.values())
+        return {
+            "total_ms": total * 1000.0,
+            "stages_ms": {stage: {"total": seconds * 1000.0, "calls": calls} for stage, (seconds, calls) in self.stages.items()},
+            "frames": [
+                {"frame": index, **{key: value * 1000.0 if isinstance(value, float) else value for key, value in stages.items()}}
+                for index, stages in sorted(self.frames.items())
+            ],
+            "other_ms": max(0.0, total - staged) * 1000.0
+        }
+
+
+class _StageSpan:
+    __slots__ = ('timer', 'stage', 'started')
+
+    def __init__(self, timer, stage):
+        self.timer = timer
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.timer.observe(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+class _FrameScope:
+    __slots__ = ('profile', 'index')
+
+    def __init__(self, profile, index):
+        self.profile = profile
+        self.index = index
+
+    def __enter__(self):
+        if self.profile is not None:
+            self.profile.current_frame = self.profile.frames.setdefault(self.index, {})
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profile is not None:
+            self.profile.current_frame = None
+        return False
+
+
+class StageTimer:
+    """Times named pipeline stages into a LabeledHistogram with a 'stage' label
+
+        with stage_timer.time('hands'):
+            results = hands.process(rgb_image)
+
+    Between start_profile() and end_profile() the stages timed on the calling
+    thread are also collected into a RequestProfile, per frame inside frame(i).
+    Work a request hands to another thread is profiled with capture() there and
+    merge() back on the request thread.
+    """
+
+    def __init__(self, histogram=None):
+        self.histogram = histogram or LabeledHistogram(('stage',), STAGE_SECONDS_BUCKETS)
+        self._local = threading.local()
+
+    def time(self, stage):
+        return _StageSpan(self, stage)
+
+    def observe(self, stage, seconds):
+        self.histogram.observe(seconds, stage)
+        profile = getattr(self._local, 'profile', None)
+        if profile is not None:
+            profile.record(stage, seconds)
+
+    def start_profile(self):
+        self._local.profile = RequestProfile()
+        return self._local.profile
+
+    def end_profile(self):
+        profile = getattr(self._local, 'profile', None)
+        self._local.profile = None
+        return profile
+
+    def profiling(self):
+        """True while the calling thread has an active profile"""
+        return getattr(self._local, 'profile', None) is not None
+
+    @contextmanager
+    def capture(self):
+        """Collect the stages and notes timed on this thread into a one-frame RequestProfile for merge()"""
+        previous = getattr(self._local, 'profile', None)
+        captured = self._local.profile = RequestProfile()
+        captured.current_frame = {}
+        try:
+            yield captured
+        finally:
+            self._local.profile = previous
+
+    def merge(self, captured):
+        """Add a capture() from another thread to the calling thread's profile, into its current frame"""
+        profile = getattr(self._local, 'profile', None)
+        if profile is None or captured is None:
+            return
+        for stage, (seconds, calls) in captured.stages.items():
+            totals = profile.stages.setdefault(stage, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += calls
+        if profile.current_frame is not None:
+            for key, value in captured.current_frame.items():
+                if key in captured.stages:
+                    profile.current_frame[key] = profile.current_frame.get(key, 0.0) + value
+                else:
+                    profile.current_frame[key] = value
+
+    def frame(self, index):
+        """Attribute the stages timed inside this block to frame index of the active profile"""
+        return _FrameScope(getattr(self._local, 'profile', None), index)
+
+    def note(self, key, value):
+        """Attach a value (e.g. the input resolution) to the current frame of the active profile"""
+        profile = getattr(self._local, 'profile', None)
+        if profile is not None and profile.current_frame is not None:
+            profile.current_frame[key] = value
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+def format_prometheus(families):
+    """Render metric families in the Prometheus text exposition format (version 0.0.4)
+
+    families: iterable of (name, kind, help, samples) where kind is 'counter',
+    'gauge' or 'histogram' and samples is a list of (labels dict, value), the value
+    being a Histogram for histograms and a number otherwise.
+    """
+    lines = []
+    for name, kind, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            if kind != 'histogram':
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+            snapshot = value.snapshot()
+            for bound, count in snapshot['buckets'].items():
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {snapshot['sum']}")
+            lines.append(f"{name}_count{_format_labels(labels)} {snapshot['count']}")
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,151 @@
+"""
+Immutable serving bundle and hot reload support
+The model, scaler and labels are served together as one ModelBundle. A reload
+builds and warms a new bundle next to the old one and then replaces a single
+reference, so requests that already picked up the old bundle finish on it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple
+
+from metrics import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+RELOAD_SECONDS_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+ARTIFACTS_COMPLETE = 'artifacts_complete.json'  # Written last by train_model.py once every model file is in place
+TRANSIENT_DIRS = frozenset({'tflite_export'})  # Scratch directories of an export in progress, never part of a bundle
+
+
+class ModelBundle(NamedTuple):
+    """Everything a prediction needs, loaded from the same set of artifact files"""
+    model: Any
+    scaler: Any
+    labels_map: Dict[int, str]
+    search_index: Any  # WordSearchIndex over labels_map, for /api/search
+    catalog: Dict[str, Any]  # PrecomputedResponse per catalog endpoint (words, model info, full search listing)
+    streaming: bool  # Per-frame stepping with per-session recurrent state
+    version: str
+    loaded_at: str
+
+
+def artifacts_fingerprint(*directories):
+    """(relative path, size, mtime_ns) of every file under the given directories, skipping TRANSIENT_DIRS"""
+    entries = []
+    for directory in directories:
+        directory = Path(directory)
+        if not directory.exists():
+            continue
+        for path in sorted(directory.rglob('*')):
+            if path.is_file() and TRANSIENT_DIRS.isdisjoint(path.relative_to(directory).parts):
+                stat = path.stat()
+                entries.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(entries)
+
+
+def mark_artifacts_complete(models_dir, files):
+    """Atomically (re)write models_dir/ARTIFACTS_COMPLETE, listing files; call after every artifact is saved"""
+    marker = Path(models_dir) / ARTIFACTS_COMPLETE
+    temporary = marker.with_name(marker.name + '.tmp')
+    with open(temporary, 'w') as f:
+        json.dump({"saved_at": time.time(), "files": sorted(files)}, f, indent=2)
+    os.replace(temporary, marker)
+    return marker
+
+
+def bundle_version(fingerprint):
+    """Short stable id of an artifacts fingerprint"""
+    return hashlib.sha1(repr(fingerprint).encode('utf-8')).hexdigest()[:12]
+
+
+class ReloadStats:
+    """Outcome and latency of bundle reloads"""
+
+    def __init__(self):
+        self.reloads = Counter()
+        self.failures = Counter()
+        self.duration_histogram = Histogram(RELOAD_SECONDS_BUCKETS)
+        self.last_reload = None
+
+    def record(self, seconds, version=None, error=None):
+        """Log one finished reload attempt (load + warmup + swap)"""
+        if error is None:
+            self.reloads.inc()
+            self.duration_histogram.observe(seconds)
+        else:
+            self.failures.inc()
+        self.last_reload = {
+            "seconds": seconds,
+            "version": version,
+            "error": error,
+            "finished_at": time.time()
+        }
+
+    def snapshot(self):
+        return {
+            "reloads": self.reloads.value,
+            "failures": self.failures.value,
+            "duration_seconds": self.duration_histogram.snapshot(),
+            "last_reload": self.last_reload
+        }
+
+
+class ArtifactWatcher:
+    """Polls artifact directories and calls on_change once their contents have settled
+
+    With a marker, only a change of that file counts: train_model.py replaces it
+    after the last artifact is written, so a half-written bundle (new model, old
+    labels) is never picked up. Either way a change is only reported once the
+    fingerprint is the same on two consecutive polls.
+    """
+
+    def __init__(self, directories, on_change, interval=5.0, marker=None):
+        self.directories = tuple(directories)
+        self.on_change = on_change
+        self.interval = interval
+        self.marker = Path(marker) if marker is not None else None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, fingerprint=None):
+        """Start polling, changes are measured against fingerprint (default: the current contents)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        baseline = fingerprint if fingerprint is not None else self.fingerprint()
+        self._thread = threading.Thread(target=self._run, args=(baseline,), name='artifact-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def fingerprint(self):
+        """What a change is measured on: the marker's size and mtime, or every file in the directories"""
+        if self.marker is None:
+            return artifacts_fingerprint(*self.directories)
+        if not self.marker.exists():
+            return ()
+        stat = self.marker.stat()
+        return ((str(self.marker), stat.st_size, stat.st_mtime_ns),)
+
+    def _run(self, current):
+        pending = None
+        while not self._stop.wait(self.interval):
+            fingerprint = self.fingerprint()
+            if fingerprint == current:
+                pending = None
+            elif fingerprint != pending:
+                pending = fingerprint
+            else:
+                logger.info("Artifact change detected, reloading model bundle")
+                try:
+                    self.on_change()
+                except Exception as e:
+                    logger.error(f"Reload after artifact change failed: {e}")
+                current, pending = fingerprint, None
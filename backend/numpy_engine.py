@@ -0,0 +1,375 @@
+"""
+Pure-NumPy inference engine for the serving models
+Runs the architectures built by FixedSignLanguageTrainer (stacked (Bi)LSTMs,
+BatchNormalization, Dense layers and softmax-attention pooling) without TensorFlow.
+
+export_numpy_weights(model, path) flattens a Keras model into a single .npz with:
+  - BatchNormalization folded into the next linear op (Dense / LSTM input kernel / attention score)
+  - Dropout removed
+  - a JSON op spec stored under '__spec__' (no pickle needed to load)
+NumpyEngine.load(path).predict(batch) then runs batched forward passes.
+Causal models (--model_type streaming) can also be advanced one frame at a time
+with initial_state() / step(), carrying the LSTM state between calls.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+SPEC_KEY = '__spec__'
+
+# Layers that only matter during training
+_SKIPPED_LAYERS = {'InputLayer', 'Dropout', 'SpatialDropout1D', 'GaussianNoise', 'GaussianDropout'}
+# Layers that make up the softmax-attention pooling block in build_advanced_model
+_ATTENTION_LAYERS = {'Flatten', 'Activation', 'RepeatVector', 'Permute', 'Multiply', 'Lambda'}
+
+
+def _activation(name, x):
+    if name in (None, 'linear'):
+        return x
+    if name == 'relu':
+        return np.maximum(x, 0.0)
+    if name == 'tanh':
+        return np.tanh(x)
+    if name == 'sigmoid':
+        return 1.0 / (1.0 + np.exp(-x))
+    if name == 'hard_sigmoid':
+        return np.clip(0.2 * x + 0.5, 0.0, 1.0)
+    if name == 'softmax':
+        shifted = np.exp(x - np.max(x, axis=-1, keepdims=True))
+        return shifted / np.sum(shifted, axis=-1, keepdims=True)
+    raise ValueError(f"Unsupported activation '{name}'")
+
+
+def _lstm_params(lstm_layer):
+    config = lstm_layer.get_config()
+    kernel, recurrent_kernel, bias = lstm_layer.get_weights()
+    return {
+        'kernel': kernel.astype(np.float64),
+        'recurrent_kernel': recurrent_kernel.astype(np.float64),
+        'bias': bias.astype(np.float64),
+        'activation': config.get('activation', 'tanh'),
+        'recurrent_activation': config.get('recurrent_activation', 'sigmoid'),
+    }
+
+
+def _batchnorm_affine(layer):
+    config = layer.get_config()
+    weights = list(layer.get_weights())
+    gamma = weights.pop(0) if config.get('scale', True) else None
+    beta = weights.pop(0) if config.get('center', True) else None
+    moving_mean, moving_variance = weights
+
+    scale = 1.0 / np.sqrt(moving_variance.astype(np.float64) + config.get('epsilon', 1e-3))
+    if gamma is not None:
+        scale = scale * gamma
+    shift = -moving_mean * scale
+    if beta is not None:
+        shift = shift + beta
+    return scale, shift
+
+
+def keras_to_ops(model):
+    """Translate a Keras model into a list of engine ops (BatchNorm not yet folded)"""
+    ops = []
+    sequence_output = True
+    in_attention = False
+
+    for layer in model.layers:
+        kind = type(layer).__name__
+
+        if in_attention and kind in _ATTENTION_LAYERS:
+            continue
+        in_attention = False
+
+        if kind in _SKIPPED_LAYERS:
+            continue
+
+        if kind == 'Bidirectional':
+            if layer.merge_mode != 'concat':
+                raise ValueError(f"Unsupported Bidirectional merge_mode '{layer.merge_mode}'")
+            return_sequences = layer.forward_layer.return_sequences
+            ops.append({
+                'type': 'bilstm',
+                'return_sequences': return_sequences,
+                'forward': _lstm_params(layer.forward_layer),
+                'backward': _lstm_params(layer.backward_layer),
+            })
+            sequence_output = return_sequences
+
+        elif kind == 'LSTM':
+            ops.append({
+                'type': 'lstm',
+                'return_sequences': layer.return_sequences,
+                'forward': _lstm_params(layer),
+            })
+            sequence_output = layer.return_sequences
+
+        elif kind == 'BatchNormalization':
+            scale, shift = _batchnorm_affine(layer)
+            ops.append({'type': 'affine', 'scale': scale, 'shift': shift})
+
+        elif kind == 'Dense' and sequence_output and layer.units == 1:
+            # Attention score: Dense(1, tanh) -> softmax over time -> weighted sum of the sequence
+            kernel, bias = layer.get_weights()
+            ops.append({
+                'type': 'attention',
+                'kernel': kernel[:, 0].astype(np.float64),
+                'bias': bias.astype(np.float64),
+                'activation': layer.get_config().get('activation', 'tanh'),
+            })
+            sequence_output = False
+            in_attention = True
+
+        elif kind == 'Dense':
+            kernel, bias = layer.get_weights()
+            ops.append({
+                'type': 'dense',
+                'kernel': kernel.astype(np.float64),
+                'bias': bias.astype(np.float64),
+                'activation': layer.get_config().get('activation', 'linear'),
+            })
+
+        else:
+            raise ValueError(f"Unsupported layer for the NumPy engine: {kind} ({layer.name})")
+
+    return ops
+
+
+def _fold_into_kernel(kernel, bias, scale, shift):
+    """Fold y = x * scale + shift into a following x @ kernel + bias"""
+    return kernel * scale[:, None], bias + shift @ kernel
+
+
+def fold_batchnorm(ops):
+    """Fold every affine (BatchNorm) op into the next linear op"""
+    folded = []
+    pending = None
+
+    for op in ops:
+        if op['type'] == 'affine':
+            if pending is None:
+                pending = (op['scale'], op['shift'])
+            else:
+                scale, shift = pending
+                pending = (scale * op['scale'], shift * op['scale'] + op['shift'])
+            continue
+
+        if pending is not None:
+            scale, shift = pending
+            if op['type'] == 'dense':
+                op = dict(op)
+                op['kernel'], op['bias'] = _fold_into_kernel(op['kernel'], op['bias'], scale, shift)
+                pending = None
+            elif op['type'] in ('lstm', 'bilstm'):
+                op = dict(op)
+                for direction in ('forward', 'backward'):
+                    if direction in op:
+                        params = dict(op[direction])
+                        params['kernel'], params['bias'] = _fold_into_kernel(
+                            params['kernel'], params['bias'], scale, shift)
+                        op[direction] = params
+                pending = None
+            elif op['type'] == 'attention':
+                # The score sees the normalized sequence; since attention weights sum to 1
+                # the pooled output is scale * pooled + shift, so the affine moves past the pooling
+                op = dict(op)
+                op['bias'] = op['bias'] + shift @ op['kernel']
+                op['kernel'] = op['kernel'] * scale
+            else:
+                folded.append({'type': 'affine', 'scale': scale, 'shift': shift})
+                pending = None
+
+        folded.append(op)
+
+    if pending is not None:
+        folded.append({'type': 'affine', 'scale': pending[0], 'shift': pending[1]})
+
+    return folded
+
+
+def save_ops(ops, path, input_shape):
+    """Write ops to a flat .npz: arrays under 'op<i>.<name>' plus a JSON spec"""
+    arrays = {}
+    spec = {'input_shape': list(input_shape), 'ops': []}
+
+    for i, op in enumerate(ops):
+        entry = {}
+        for key, value in op.items():
+            if isinstance(value, dict):
+                entry[key] = {}
+                for sub_key, sub_value in value.items():
+                    if isinstance(sub_value, np.ndarray):
+                        array_key = f"op{i}.{key}.{sub_key}"
+                        arrays[array_key] = sub_value.astype(np.float32)
+                        entry[key][sub_key] = {'array': array_key}
+                    else:
+                        entry[key][sub_key] = sub_value
+            elif isinstance(value, np.ndarray):
+                array_key = f"op{i}.{key}"
+                arrays[array_key] = value.astype(np.float32)
+                entry[key] = {'array': array_key}
+            else:
+                entry[key] = value
+        spec['ops'].append(entry)
+
+    arrays[SPEC_KEY] = np.array(json.dumps(spec))
+    np.savez(path, **arrays)
+    return Path(path)
+
+
+def export_numpy_weights(model, path):
+    """Export a trained Keras model to a NumPy engine .npz file"""
+    ops = fold_batchnorm(keras_to_ops(model))
+    return save_ops(ops, path, model.input_shape[1:])
+
+
+def _resolve(entry, arrays):
+    resolved = {}
+    for key, value in entry.items():
+        if isinstance(value, dict) and 'array' in value:
+            resolved[key] = arrays[value['array']]
+        elif isinstance(value, dict):
+            resolved[key] = _resolve(value, arrays)
+        else:
+            resolved[key] = value
+    return resolved
+
+
+class NumpyEngine:
+    """Batched forward pass over an exported op list"""
+
+    def __init__(self, ops, input_shape, dtype=np.float32):
+        self.dtype = dtype
+        self.ops = [self._cast(op) for op in ops]
+        self.sequence_length, self.feature_dim = input_shape
+        self.num_classes = self._output_dim()
+
+    @classmethod
+    def load(cls, path, dtype=np.float32):
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        spec = json.loads(str(arrays.pop(SPEC_KEY)))
+        ops = [_resolve(entry, arrays) for entry in spec['ops']]
+        return cls(ops, spec['input_shape'], dtype=dtype)
+
+    def _cast(self, op):
+        cast = {}
+        for key, value in op.items():
+            if isinstance(value, np.ndarray):
+                cast[key] = value.astype(self.dtype)
+            elif isinstance(value, dict):
+                cast[key] = self._cast(value)
+            else:
+                cast[key] = value
+        return cast
+
+    def _output_dim(self):
+        for op in reversed(self.ops):
+            if op['type'] == 'dense':
+                return op['kernel'].shape[1]
+        raise ValueError("Exported model has no Dense output layer")
+
+    @property
+    def is_causal(self):
+        """True when no op looks at future frames, so the model can be advanced with step()"""
+        return all(op['type'] in ('lstm', 'dense', 'affine') for op in self.ops)
+
+    def _lstm_cell(self, projected, h, c, params):
+        """One LSTM timestep given the already-projected input x_t @ kernel + bias"""
+        activation = params['activation']
+        recurrent_activation = params['recurrent_activation']
+        units = params['recurrent_kernel'].shape[0]
+
+        z = projected + h @ params['recurrent_kernel']
+        i = _activation(recurrent_activation, z[:, :units])
+        f = _activation(recurrent_activation, z[:, units:2 * units])
+        g = _activation(activation, z[:, 2 * units:3 * units])
+        o = _activation(recurrent_activation, z[:, 3 * units:])
+        c = f * c + i * g
+        h = o * _activation(activation, c)
+        return h, c
+
+    def _lstm(self, x, params, return_sequences, reverse=False):
+        units = params['recurrent_kernel'].shape[0]
+        batch_size, timesteps, _ = x.shape
+
+        # Input projection for all timesteps at once, only the recurrent matmul stays in the loop
+        projected = x @ params['kernel'] + params['bias']
+        h = np.zeros((batch_size, units), dtype=self.dtype)
+        c = np.zeros((batch_size, units), dtype=self.dtype)
+        outputs = np.empty((batch_size, timesteps, units), dtype=self.dtype) if return_sequences else None
+
+        steps = range(timesteps - 1, -1, -1) if reverse else range(timesteps)
+        for t in steps:
+            h, c = self._lstm_cell(projected[:, t], h, c, params)
+            if return_sequences:
+                outputs[:, t] = h
+
+        return outputs if return_sequences else h
+
+    def initial_state(self, batch_size=1):
+        """Zero (h, c) pair for every LSTM op, the state before the first frame"""
+        state = []
+        for op in self.ops:
+            if op['type'] == 'lstm':
+                units = op['forward']['recurrent_kernel'].shape[0]
+                state.append((np.zeros((batch_size, units), dtype=self.dtype),
+                              np.zeros((batch_size, units), dtype=self.dtype)))
+        return state
+
+    def step(self, frames, state):
+        """Advance a causal model by one frame
+
+        frames is (B, feature_dim), state comes from initial_state() or a previous step().
+        Returns ((B, num_classes) outputs, new_state). Stepping through a window from the
+        initial state gives the same outputs as predict() on that window.
+        """
+        if not self.is_causal:
+            raise ValueError("step() needs a causal model (unidirectional LSTMs, no attention pooling)")
+
+        x = np.asarray(frames, dtype=self.dtype)
+        new_state = []
+        layer = 0
+
+        for op in self.ops:
+            kind = op['type']
+            if kind == 'lstm':
+                params = op['forward']
+                h, c = state[layer]
+                h, c = self._lstm_cell(x @ params['kernel'] + params['bias'], h, c, params)
+                new_state.append((h, c))
+                layer += 1
+                x = h
+            elif kind == 'dense':
+                x = _activation(op['activation'], x @ op['kernel'] + op['bias'])
+            elif kind == 'affine':
+                x = x * op['scale'] + op['shift']
+
+        return x, new_state
+
+    def predict(self, batch):
+        """Return (B, num_classes) outputs for a (B, sequence_length, feature_dim) batch"""
+        x = np.asarray(batch, dtype=self.dtype)
+
+        for op in self.ops:
+            kind = op['type']
+            if kind == 'lstm':
+                x = self._lstm(x, op['forward'], op['return_sequences'])
+            elif kind == 'bilstm':
+                forward = self._lstm(x, op['forward'], op['return_sequences'])
+                backward = self._lstm(x, op['backward'], op['return_sequences'], reverse=True)
+                x = np.concatenate([forward, backward], axis=-1)
+            elif kind == 'attention':
+                scores = _activation(op['activation'], x @ op['kernel'] + op['bias'])
+                weights = _activation('softmax', scores)
+                x = np.einsum('bt,btf->bf', weights, x)
+            elif kind == 'dense':
+                x = _activation(op['activation'], x @ op['kernel'] + op['bias'])
+            elif kind == 'affine':
+                x = x * op['scale'] + op['shift']
+            else:
+                raise ValueError(f"Unknown op type '{kind}'")
+
+        return x
@@ -0,0 +1,41 @@
+"""
+Pre-rendered JSON responses for endpoints whose body only changes with the model
+The body is serialised and gzipped once, when a bundle is loaded, and served
+with a weak ETag so clients can revalidate with If-None-Match and get a 304.
+A reload builds new responses with the new bundle, which changes the ETags.
+"""
+
+import gzip
+import hashlib
+import json
+
+from flask import Response
+
+GZIP_MIN_BYTES = 512  # Smaller bodies are served uncompressed
+GZIP_LEVEL = 6
+
+
+class PrecomputedResponse:
+    """A JSON body, its gzip encoding (when worth it) and an ETag"""
+
+    def __init__(self, payload, dumps=json.dumps):
+        self.body = dumps(payload).encode('utf-8')
+        self.etag = hashlib.blake2b(self.body, digest_size=8).hexdigest()
+        self.gzip_body = None
+        if len(self.body) >= GZIP_MIN_BYTES:
+            compressed = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+            if len(compressed) < len(self.body):
+                self.gzip_body = compressed
+
+    def to_response(self, request, cache_control='no-cache'):
+        """Response for request: gzip when accepted, 304 when its If-None-Match matches"""
+        use_gzip = self.gzip_body is not None and request.accept_encodings['gzip'] > 0
+        response = Response(self.gzip_body if use_gzip else self.body, mimetype='application/json')
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = cache_control
+        # Weak, both encodings carry the same JSON
+        response.set_etag(self.etag, weak=True)
+        response.make_conditional(request)
+        return response
@@ -0,0 +1,51 @@
+"""
+Bounded read-ahead for in-order frame pipelines
+Decoding a frame (cv2.imdecode, cv2.resize) releases the GIL, landmark
+extraction must see frames in order to keep its tracking state. Prefetcher
+runs the decode step of the next few frames on a thread pool while the
+caller extracts the current one, and hands results back strictly in input
+order. At most `depth` frames are decoded ahead, so memory stays bounded
+whatever the number of frames in a request.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Prefetcher:
+    """Thread pool of num_threads running fn up to depth items ahead of the consumer"""
+
+    def __init__(self, num_threads, depth):
+        self.num_threads = max(1, int(num_threads))
+        self.depth = max(1, int(depth))
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def map(self, fn, items):
+        """Yield a Future of fn(item) per item, in order; only depth of them are submitted ahead
+
+        Call result() on each before advancing. Closing the generator early
+        cancels the frames that were queued but not started.
+        """
+        executor = self._get_executor()
+        items = iter(items)
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(fn, item))
+                if len(pending) > self.depth:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_executor(self):
+        # Threads start on the first request, never in a gunicorn master before the fork
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.num_threads, thread_name_prefix='frame-decode')
+        return self._executor
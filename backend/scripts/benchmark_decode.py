@@ -0,0 +1,86 @@
+"""
+Per-frame cost of turning an uploaded JPEG into the 640x480 RGB extractor input.
+
+Usage (from backend/):
+  python scripts/benchmark_decode.py --sizes 640x480,1280x720,1920x1080,3840x2160
+
+Options:
+  --sizes LIST       comma separated WxH source resolutions (default 640x480,1280x720,1920x1080,3840x2160)
+  --quality Q        JPEG quality of the synthetic frames (default 90)
+  --repeats N        decodes per size and path (default 50)
+
+For every size a synthetic camera-like frame is JPEG-encoded once, then decoded
+by three paths: the old imdecode + resize + cvtColor chain, FrameDecoder with a
+fresh output array (the server) and FrameDecoder into a reused buffer (the data
+scripts). Reported: median and p90 ms per frame, the libjpeg reduction used,
+and the mean absolute pixel difference of the fast path against the old one.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from frame_decode import FrameDecoder, TARGET_SIZE, decode_scale  # noqa: E402
+
+
+def synthetic_jpeg(width, height, quality):
+    # Smooth gradients plus noise compress like a webcam frame, pure noise would not
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1).astype(np.int16)
+    frame += rng.integers(-12, 13, frame.shape, dtype=np.int16)
+    frame = cv2.GaussianBlur(np.clip(frame, 0, 255).astype(np.uint8), (5, 5), 0)
+    _, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return encoded
+
+
+def baseline(encoded):
+    frame = cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+    frame = cv2.resize(frame, TARGET_SIZE)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+def time_ms(fn, repeats):
+    fn()  # First call allocates scratch buffers
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return np.percentile(samples, 50), np.percentile(samples, 90)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='640x480,1280x720,1920x1080,3840x2160')
+    parser.add_argument('--quality', type=int, default=90)
+    parser.add_argument('--repeats', type=int, default=50)
+    args = parser.parse_args()
+
+    decoder = FrameDecoder()
+    buffer = decoder.new_buffer()
+    print(f"{'source':>10} {'KiB':>6} {'scale':>5}  {'old p50/p90 ms':>15}  {'fresh p50/p90 ms':>16}  "
+          f"{'reused p50/p90 ms':>17}  {'speedup':>7}  {'mean |diff|':>11}")
+
+    for size in [s for s in args.sizes.split(',') if s]:
+        width, height = (int(v) for v in size.split('x'))
+        encoded = synthetic_jpeg(width, height, args.quality)
+
+        old = time_ms(lambda: baseline(encoded), args.repeats)
+        fresh = time_ms(lambda: decoder.decode(encoded), args.repeats)
+        reused = time_ms(lambda: decoder.decode(encoded, out=buffer), args.repeats)
+        diff = np.abs(baseline(encoded).astype(np.int16) - decoder.decode(encoded).astype(np.int16)).mean()
+
+        print(f"{size:>10} {len(encoded) / 1024:6.0f} {'1/' + str(decode_scale((width, height))):>5}  "
+              f"{old[0]:7.2f}/{old[1]:7.2f}  {fresh[0]:8.2f}/{fresh[1]:7.2f}  {reused[0]:9.2f}/{reused[1]:7.2f}  "
+              f"{old[0] / reused[0]:6.2f}x  {diff:11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Per-frame latency and landmark deviation of hand-ROI tracking against full-frame detection.
+
+Usage (from backend/):
+  python scripts/benchmark_hand_roi.py --video path/to/practice.mp4
+
+Options:
+  --video PATH           video to replay (any format cv2.VideoCapture reads)
+  --redetect-interval N  tracked frames between full palm-detection passes (HAND_ROI_REDETECT_INTERVAL, default 15)
+  --max-frames N         stop after N frames (default: whole video)
+
+Every frame is run through two extractors, one on the full frame and one with a
+HandRoiTracker; pose runs on every frame in both so only the hands path differs.
+Reported: p50/p99 extraction latency and hands-graph time per frame, share of
+frames that skipped palm detection, tracks started, full-frame re-detections
+and track losses, hands-detected agreement, and the deviation of the 126-dim
+landmark vector.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from landmark_extractor import EnhancedLandmarkExtractor  # noqa: E402
+from hand_roi import HandRoiTracker  # noqa: E402
+
+
+def timed_extract(extractor, frame, hand_roi=None):
+    """(vector, hands detected, total ms, ms spent in the hands graph incl. a full-frame fallback)"""
+    extractor.stage_timer.start_profile()
+    start = time.perf_counter()
+    vector, hands, _ = extractor.extract_hand_landmarks(frame, hand_roi=hand_roi)
+    total_ms = (time.perf_counter() - start) * 1000.0
+    profile = extractor.stage_timer.end_profile()
+    return vector, hands, total_ms, profile.stages['hands'][0] * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--video', required=True)
+    parser.add_argument('--redetect-interval', type=int, default=15)
+    parser.add_argument('--max-frames', type=int, default=None)
+    args = parser.parse_args()
+
+    cap = cv2.VideoCapture(args.video)
+    if not cap.isOpened():
+        raise SystemExit(f"Cannot open {args.video}")
+
+    full_frame = EnhancedLandmarkExtractor()
+    tracked = EnhancedLandmarkExtractor()
+    hand_roi = HandRoiTracker(redetect_interval=args.redetect_interval)
+
+    full_ms, roi_ms = [], []
+    full_hands_ms, roi_hands_ms = [], []
+    agree = 0
+    deviations = []
+
+    while args.max_frames is None or len(full_ms) < args.max_frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frame = cv2.resize(frame, (640, 480))
+
+        full_vector, full_hands, total_ms, hands_ms = timed_extract(full_frame, frame)
+        full_ms.append(total_ms)
+        full_hands_ms.append(hands_ms)
+
+        roi_vector, roi_hands, total_ms, hands_ms = timed_extract(tracked, frame, hand_roi)
+        roi_ms.append(total_ms)
+        roi_hands_ms.append(hands_ms)
+
+        agree += int(full_hands == roi_hands)
+        present = (full_vector != 0) & (roi_vector != 0)
+        if full_hands and roi_hands and np.any(present):
+            deviations.append(np.abs(roi_vector[present] - full_vector[present]))
+
+    cap.release()
+    if not full_ms:
+        raise SystemExit("No frames read")
+
+    frames = len(full_ms)
+    stats = hand_roi.stats.snapshot()
+    print(f"Frames: {frames}  re-detection interval {args.redetect_interval}")
+    print(f"Extraction latency: full frame p50 {np.percentile(full_ms, 50):.2f} ms / p99 {np.percentile(full_ms, 99):.2f} ms, "
+          f"ROI p50 {np.percentile(roi_ms, 50):.2f} ms / p99 {np.percentile(roi_ms, 99):.2f} ms")
+    print(f"Hands graph: full frame p50 {np.percentile(full_hands_ms, 50):.2f} ms / mean {np.mean(full_hands_ms):.2f} ms, "
+          f"ROI p50 {np.percentile(roi_hands_ms, 50):.2f} ms / mean {np.mean(roi_hands_ms):.2f} ms")
+    print(f"Frames without palm detection: {stats['roi_frames']}/{stats['frames']} ({stats['roi_ratio']:.0%}), tracks: {stats['tracks']}, "
+          f"full-frame re-detections: {stats['redetections']}, track losses: {stats['track_losses']}")
+    print(f"Hands-detected agreement: {agree}/{frames}")
+
+    if deviations:
+        deviations = np.concatenate(deviations)
+        print(f"Landmark deviation on {len(deviations)} values: mean {deviations.mean():.4f}, "
+              f"p95 {np.percentile(deviations, 95):.4f}, max {deviations.max():.4f}")
+    else:
+        print("No frames with hands detected by both paths, deviation not measured")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare per-request inference latency of Keras Model.predict against the traced serving callable.
+
+Usage (from backend/):
+  python scripts/benchmark_inference.py --model models/model.h5 --iterations 500
+
+Options:
+  --model PATH        Keras model file (default: first of models/best_model.h5, model.h5, model.keras)
+  --iterations N      timed calls per path (default 500)
+  --warmup N          untimed calls per path before timing (default 20)
+  --batch-sizes LIST  comma separated batch sizes to time (default 1)
+
+Prints p50 / p99 / mean latency in milliseconds for each path and batch size.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from inference import KerasInferenceBackend  # noqa: E402
+
+
+def find_model(models_dir: Path):
+    for name in ['best_model.h5', 'model.h5', 'model.keras']:
+        if (models_dir / name).exists():
+            return models_dir / name
+    return None
+
+
+def time_calls(fn, batch, iterations, warmup):
+    for _ in range(warmup):
+        fn(batch)
+    samples = np.empty(iterations, dtype=np.float64)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(batch)
+        samples[i] = time.perf_counter() - start
+    return samples * 1000.0
+
+
+def summarize(samples_ms):
+    return {
+        'p50': float(np.percentile(samples_ms, 50)),
+        'p99': float(np.percentile(samples_ms, 99)),
+        'mean': float(np.mean(samples_ms)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default=None, help='Keras model file')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--batch-sizes', default='1')
+    args = parser.parse_args()
+
+    model_path = Path(args.model) if args.model else find_model(Path('models'))
+    if model_path is None or not model_path.exists():
+        raise SystemExit("No model found. Pass --model or run from backend/ after training.")
+
+    backend = KerasInferenceBackend.load(model_path)
+    model = backend.model
+    _, sequence_length, feature_dim = model.input_shape
+
+    paths = {
+        'Model.predict': lambda batch: model.predict(batch, verbose=0),
+        'traced callable': backend.predict,
+    }
+
+    print(f"Model: {model_path}  input: (B, {sequence_length}, {feature_dim})  iterations: {args.iterations}")
+    print(f"{'path':<18}{'batch':>6}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+
+    rng = np.random.default_rng(0)
+    for batch_size in [int(b) for b in args.batch_sizes.split(',') if b]:
+        batch = rng.standard_normal((batch_size, sequence_length, feature_dim)).astype(np.float32)
+
+        reference = paths['Model.predict'](batch)
+        traced = paths['traced callable'](batch)
+        max_diff = float(np.max(np.abs(reference - traced)))
+
+        for name, fn in paths.items():
+            stats = summarize(time_calls(fn, batch, args.iterations, args.warmup))
+            print(f"{name:<18}{batch_size:>6}{stats['p50']:>10.3f}{stats['p99']:>10.3f}{stats['mean']:>10.3f}")
+        print(f"{'':<18}{'':>6}  max |predict - traced| = {max_diff:.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Throughput of the gunicorn deployment at 1, 2, 4 and 8 worker processes.
+
+Usage (from backend/):
+  INFERENCE_BACKEND=numpy python scripts/benchmark_workers.py --workers 1,2,4,8 --duration 20
+
+Options:
+  --workers LIST     comma separated worker counts (default 1,2,4,8)
+  --clients N        concurrent client threads (default: 4 per worker)
+  --duration S       seconds of load per worker count (default 20)
+  --frames N         JPEG frames per /api/predict request (default 10)
+  --mode MODE        frames: synthetic JPEGs, decode + MediaPipe + model (default)
+                     landmarks: precomputed landmark rows, model only
+  --port P           port the server is started on (default 5055)
+
+For every worker count a server is started with `gunicorn -c gunicorn.conf.py
+app:app` (WEB_CONCURRENCY set accordingly), /ready is polled until warmup has
+finished in a worker, then the clients POST /api/predict back to back. Reported:
+requests/s, frames/s, p50/p99 latency and errors. Model and server settings
+(INFERENCE_BACKEND, MODELS_DIR, ...) come from the environment.
+"""
+
+import argparse
+import base64
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+SEQUENCE_LENGTH = 30
+FEATURE_DIM = 126
+
+
+def build_payload(mode, frames):
+    rng = np.random.default_rng(0)
+    if mode == 'landmarks':
+        landmarks = rng.uniform(-1, 1, (SEQUENCE_LENGTH, FEATURE_DIM)).round(4).tolist()
+        return json.dumps({"landmarks": landmarks, "target_word": "hello"}).encode('utf-8')
+
+    encoded = []
+    for _ in range(frames):
+        frame = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        frame = cv2.GaussianBlur(frame, (15, 15), 0)
+        _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        encoded.append('data:image/jpeg;base64,' + base64.b64encode(jpeg.tobytes()).decode('ascii'))
+    return json.dumps({"frames": encoded, "target_word": "hello"}).encode('utf-8')
+
+
+def wait_ready(base_url, process, timeout=300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"gunicorn exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"{base_url}/ready", timeout=2) as response:
+                if response.status == 200:
+                    return
+        except OSError:  # Refused, or accepted by the master before a worker is up
+            pass
+        time.sleep(0.5)
+    raise SystemExit("Server did not become ready")
+
+
+def run_load(base_url, payload, clients, duration):
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+    first_error = []
+    stop_at = time.perf_counter() + duration
+
+    def client(index):
+        while time.perf_counter() < stop_at:
+            request = urllib.request.Request(f"{base_url}/api/predict", data=payload,
+                                             headers={'Content-Type': 'application/json'})
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    response.read()
+                latencies[index].append(time.perf_counter() - start)
+            except OSError as e:
+                errors[index] += 1
+                first_error.append(repr(e))
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if first_error:
+        print(f"  first error: {first_error[0]}")
+    return np.array([latency for per_client in latencies for latency in per_client]) * 1000.0, sum(errors), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', default='1,2,4,8')
+    parser.add_argument('--clients', type=int, default=None)
+    parser.add_argument('--duration', type=float, default=20.0)
+    parser.add_argument('--frames', type=int, default=10)
+    parser.add_argument('--mode', choices=('frames', 'landmarks'), default='frames')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    payload = build_payload(args.mode, args.frames)
+    frames_per_request = SEQUENCE_LENGTH if args.mode == 'landmarks' else args.frames
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"Cores: {os.cpu_count()}  mode {args.mode}  payload {len(payload) / 1024:.0f} KiB  "
+          f"{args.duration:.0f}s per run")
+
+    for workers in [int(w) for w in args.workers.split(',') if w]:
+        clients = args.clients or 4 * workers
+        env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(args.port))
+        process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+                                   cwd=BACKEND_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_ready(base_url, process)
+            # /ready is answered by whichever worker got the request, give the others time to warm up
+            time.sleep(2.0 * workers)
+            latencies, errors, elapsed = run_load(base_url, payload, clients, args.duration)
+        finally:
+            process.terminate()
+            process.wait(timeout=60)
+
+        if not len(latencies):
+            print(f"workers {workers}: no successful requests ({errors} errors)")
+            continue
+        print(f"workers {workers:2d}  clients {clients:3d}: {len(latencies) / elapsed:7.1f} req/s  "
+              f"{len(latencies) * frames_per_request / elapsed:8.1f} frames/s  "
+              f"p50 {np.percentile(latencies, 50):7.1f} ms  p99 {np.percentile(latencies, 99):7.1f} ms  errors {errors}")
+
+
+if __name__ == '__main__':
+    main()
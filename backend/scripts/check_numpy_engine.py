@@ -0,0 +1,106 @@
+"""
+Check that the NumPy engine reproduces Keras outputs, and export the weights file it serves from.
+
+Usage (from backend/):
+  python scripts/check_numpy_engine.py --model models/best_model.h5 --output models/model_numpy.npz
+  python scripts/check_numpy_engine.py --architecture advanced --num-classes 300
+
+Options:
+  --model PATH          trained Keras model to export and compare
+  --architecture NAME   instead of --model, build a randomly initialised 'simple' or 'advanced'
+                        model from train_model.py (BatchNorm statistics are randomised so folding is exercised)
+  --num-classes N       classes for --architecture (default 300)
+  --output PATH         where to write the .npz (default: temporary file for --architecture, models/model_numpy.npz otherwise)
+  --data PATH           .npy inputs to compare on (default: data/processed/X_test.npy if present, else random)
+  --samples N           random samples when no data file is used (default 64)
+  --tolerance T         max allowed absolute difference (default 1e-5)
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tensorflow as tf  # noqa: E402
+
+from numpy_engine import NumpyEngine, export_numpy_weights  # noqa: E402
+
+
+def build_random_model(architecture, num_classes):
+    from train_model import FixedSignLanguageTrainer
+
+    trainer = FixedSignLanguageTrainer({'models_dir': tempfile.mkdtemp(), 'experiments_dir': tempfile.mkdtemp()})
+    if architecture == 'advanced':
+        model = trainer.build_advanced_model(num_classes)
+    else:
+        model = trainer.build_simple_model(num_classes)
+
+    rng = np.random.default_rng(0)
+    for layer in model.layers:
+        if isinstance(layer, tf.keras.layers.BatchNormalization):
+            gamma, beta, mean, variance = layer.get_weights()
+            layer.set_weights([
+                rng.uniform(0.5, 1.5, gamma.shape).astype(np.float32),
+                rng.normal(0, 0.1, beta.shape).astype(np.float32),
+                rng.normal(0, 0.2, mean.shape).astype(np.float32),
+                rng.uniform(0.5, 2.0, variance.shape).astype(np.float32),
+            ])
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--model')
+    source.add_argument('--architecture', choices=['simple', 'advanced'])
+    parser.add_argument('--num-classes', type=int, default=300)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--data', default=None)
+    parser.add_argument('--samples', type=int, default=64)
+    parser.add_argument('--tolerance', type=float, default=1e-5)
+    args = parser.parse_args()
+
+    if args.model:
+        model = tf.keras.models.load_model(args.model)
+        output = Path(args.output or 'models/model_numpy.npz')
+    else:
+        model = build_random_model(args.architecture, args.num_classes)
+        output = Path(args.output or Path(tempfile.mkdtemp()) / 'model_numpy.npz')
+
+    export_numpy_weights(model, output)
+    engine = NumpyEngine.load(output)
+
+    data_path = Path(args.data) if args.data else Path('data/processed/X_test.npy')
+    if data_path.exists():
+        inputs = np.load(data_path).astype(np.float32)
+    else:
+        _, sequence_length, feature_dim = model.input_shape
+        inputs = np.random.default_rng(1).standard_normal((args.samples, sequence_length, feature_dim)).astype(np.float32)
+
+    start = time.perf_counter()
+    expected = model(inputs, training=False).numpy()
+    keras_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = engine.predict(inputs)
+    numpy_seconds = time.perf_counter() - start
+
+    max_diff = float(np.max(np.abs(expected - actual)))
+    agreement = float(np.mean(np.argmax(expected, axis=1) == np.argmax(actual, axis=1)))
+
+    print(f"Exported {output} ({output.stat().st_size / 1024:.0f} KB), {len(engine.ops)} ops")
+    print(f"Samples: {len(inputs)}  max |keras - numpy| = {max_diff:.2e}  top-1 agreement = {agreement:.4f}")
+    print(f"Batch forward pass: keras {keras_seconds * 1000:.1f} ms, numpy {numpy_seconds * 1000:.1f} ms")
+
+    if max_diff > args.tolerance:
+        raise SystemExit(f"FAILED: difference {max_diff:.2e} exceeds tolerance {args.tolerance:.0e}")
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
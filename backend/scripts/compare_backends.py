@@ -0,0 +1,129 @@
+"""
+Accuracy-parity, latency and memory comparison of the serving inference backends.
+
+Usage (from backend/):
+  python scripts/compare_backends.py --data-dir data/processed --models-dir models
+
+Options:
+  --data-dir PATH    directory with X_test.npy / y_test.npy from preprocess.py (default data/processed)
+  --models-dir PATH  directory with the exported models (default models)
+  --backends LIST    comma separated backend specs (default: keras,tflite:float32,tflite:float16,tflite:dynamic_int8,numpy)
+  --iterations N     batch-1 calls timed per backend (default 300)
+  --threads N        TFLite interpreter threads (default 1)
+
+Each backend runs in its own spawned process so the reported RSS reflects only
+that backend (interpreter + model + runtime imports). Parity is reported against
+the first backend in the list: top-1 agreement and max absolute probability difference.
+"""
+
+import argparse
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BACKENDS = 'keras,tflite:float32,tflite:float16,tflite:dynamic_int8,numpy'
+
+
+def rss_mb():
+    """Current resident set size in MB (Linux /proc, falls back to peak RSS)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_backend(spec, models_dir, X_test, iterations, threads, results):
+    sys.path.insert(0, str(BACKEND_ROOT))
+    from inference import load_inference_backend
+
+    name, _, variant = spec.partition(':')
+    rss_before = rss_mb()
+    load_start = time.perf_counter()
+    backend = load_inference_backend(name, models_dir, tflite_variant=variant or 'float32', tflite_num_threads=threads)
+    if backend is None:
+        results[spec] = {'error': f'model files for {spec} not found in {models_dir}'}
+        return
+    backend.warmup((1,))
+    load_seconds = time.perf_counter() - load_start
+
+    probs = backend.predict(X_test)
+
+    latencies = np.empty(iterations)
+    for i in range(iterations):
+        sample = X_test[i % len(X_test)][None]
+        start = time.perf_counter()
+        backend.predict(sample)
+        latencies[i] = (time.perf_counter() - start) * 1000.0
+
+    results[spec] = {
+        'probs': probs,
+        'load_seconds': load_seconds,
+        'rss_mb': rss_mb(),
+        'rss_delta_mb': rss_mb() - rss_before,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+    }
+
+
+def topk_accuracy(probs, y_true, k):
+    topk = np.argsort(probs, axis=1)[:, ::-1][:, :k]
+    return float(np.mean([y in row for y, row in zip(y_true, topk)]))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--data-dir', default='data/processed')
+    parser.add_argument('--models-dir', default='models')
+    parser.add_argument('--backends', default=DEFAULT_BACKENDS)
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--threads', type=int, default=1)
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    if not (data_dir / 'X_test.npy').exists():
+        raise SystemExit(f"{data_dir / 'X_test.npy'} not found. Run preprocess.py first.")
+
+    X_test = np.load(data_dir / 'X_test.npy').astype(np.float32)
+    y_test = np.load(data_dir / 'y_test.npy')
+    specs = [s for s in args.backends.split(',') if s]
+
+    ctx = mp.get_context('spawn')
+    manager = ctx.Manager()
+    results = manager.dict()
+    for spec in specs:
+        proc = ctx.Process(target=run_backend, args=(spec, args.models_dir, X_test, args.iterations, args.threads, results))
+        proc.start()
+        proc.join()
+        if spec not in results:
+            results[spec] = {'error': f'process exited with code {proc.exitcode}'}
+
+    reference = results[specs[0]].get('probs')
+
+    print(f"Test samples: {len(X_test)}  reference: {specs[0]}")
+    print(f"{'backend':<22}{'top1':>8}{'top3':>8}{'agree':>8}{'max|dp|':>10}{'p50 ms':>9}{'p99 ms':>9}{'RSS MB':>9}{'+RSS MB':>9}{'load s':>8}")
+    for spec in specs:
+        res = results[spec]
+        if 'error' in res:
+            print(f"{spec:<22}  {res['error']}")
+            continue
+        probs = res['probs']
+        agree = max_diff = float('nan')
+        if reference is not None:
+            agree = float(np.mean(np.argmax(probs, axis=1) == np.argmax(reference, axis=1)))
+            max_diff = float(np.max(np.abs(probs - reference)))
+        print(f"{spec:<22}{topk_accuracy(probs, y_test, 1):>8.4f}{topk_accuracy(probs, y_test, 3):>8.4f}"
+              f"{agree:>8.4f}{max_diff:>10.2e}{res['p50_ms']:>9.3f}{res['p99_ms']:>9.3f}"
+              f"{res['rss_mb']:>9.1f}{res['rss_delta_mb']:>9.1f}{res['load_seconds']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
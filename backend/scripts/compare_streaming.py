@@ -0,0 +1,127 @@
+"""
+Accuracy and per-frame cost of the streaming (causal) model against the bidirectional baseline.
+
+Usage (from backend/):
+  python train_model.py --model_type streaming --models_dir models_streaming
+  python scripts/compare_streaming.py --baseline models/model_numpy.npz --streaming models_streaming/model_numpy.npz
+
+Options:
+  --data-dir PATH    directory with X_test.npy / y_test.npy from preprocess.py (default data/processed)
+  --baseline PATH    bidirectional model: NumPy engine .npz or Keras .h5/.keras file
+  --streaming PATH   causal model exported by a --model_type streaming run (.npz)
+  --iterations N     timed calls for the per-frame cost (default 300)
+
+Reported on the test split:
+  - top-1 / top-3 of both models on full 30-frame windows
+  - the streaming model stepped frame by frame from a fresh state (must match its full-window output)
+  - streaming top-1 after 10 and 20 frames, i.e. how early a usable prediction is emitted
+  - streaming top-1 when the state is carried across consecutive test sequences instead of
+    being reset, which is what a long-lived session sees
+  - per-frame latency: baseline window re-run vs one streaming step
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from numpy_engine import NumpyEngine  # noqa: E402
+
+
+def load_predictor(path):
+    path = Path(path)
+    if path.suffix == '.npz':
+        return NumpyEngine.load(path).predict
+    from inference import KerasInferenceBackend
+    return KerasInferenceBackend.load(path).predict
+
+
+def topk_accuracy(probs, y_true, k):
+    topk = np.argsort(probs, axis=1)[:, ::-1][:, :k]
+    return float(np.mean([y in row for y, row in zip(y_true, topk)]))
+
+
+def step_through(engine, X, carry_state=False):
+    """Step every sequence frame by frame, returns (N, T, num_classes) per-frame outputs"""
+    num_samples, timesteps, _ = X.shape
+    outputs = np.empty((num_samples, timesteps, engine.num_classes), dtype=np.float32)
+
+    if carry_state:
+        # One long stream: each sequence starts with the state left by the previous one
+        state = engine.initial_state(batch_size=1)
+        for n in range(num_samples):
+            for t in range(timesteps):
+                out, state = engine.step(X[n:n + 1, t], state)
+                outputs[n, t] = out[0]
+    else:
+        # Independent sequences, stepped together as a batch
+        state = engine.initial_state(batch_size=num_samples)
+        for t in range(timesteps):
+            outputs[:, t], state = engine.step(X[:, t], state)
+
+    return outputs
+
+
+def time_calls(fn, iterations):
+    latencies = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn()
+        latencies[i] = (time.perf_counter() - start) * 1000.0
+    return float(np.percentile(latencies, 50)), float(np.percentile(latencies, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--data-dir', default='data/processed')
+    parser.add_argument('--baseline', default='models/model_numpy.npz')
+    parser.add_argument('--streaming', default='models_streaming/model_numpy.npz')
+    parser.add_argument('--iterations', type=int, default=300)
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    if not (data_dir / 'X_test.npy').exists():
+        raise SystemExit(f"{data_dir / 'X_test.npy'} not found. Run preprocess.py first.")
+
+    X_test = np.load(data_dir / 'X_test.npy').astype(np.float32)
+    y_test = np.load(data_dir / 'y_test.npy')
+    _, timesteps, _ = X_test.shape
+
+    baseline_predict = load_predictor(args.baseline)
+    streaming = NumpyEngine.load(args.streaming)
+    if not streaming.is_causal:
+        raise SystemExit(f"{args.streaming} is not a causal model, train it with --model_type streaming")
+
+    baseline_probs = baseline_predict(X_test)
+    window_probs = streaming.predict(X_test)
+    stepped = step_through(streaming, X_test)
+    carried = step_through(streaming, X_test, carry_state=True)
+
+    step_diff = float(np.max(np.abs(stepped[:, -1] - window_probs)))
+
+    print(f"Test samples: {len(X_test)}  window: {timesteps} frames")
+    print(f"{'':<38}{'top1':>8}{'top3':>8}")
+    print(f"{'baseline (bidirectional, window)':<38}{topk_accuracy(baseline_probs, y_test, 1):>8.4f}{topk_accuracy(baseline_probs, y_test, 3):>8.4f}")
+    print(f"{'streaming (window)':<38}{topk_accuracy(window_probs, y_test, 1):>8.4f}{topk_accuracy(window_probs, y_test, 3):>8.4f}")
+    print(f"{'streaming (stepped, fresh state)':<38}{topk_accuracy(stepped[:, -1], y_test, 1):>8.4f}{topk_accuracy(stepped[:, -1], y_test, 3):>8.4f}")
+    for frames in (timesteps // 3, 2 * timesteps // 3):
+        probs = stepped[:, frames - 1]
+        print(f"{f'streaming (after {frames} frames)':<38}{topk_accuracy(probs, y_test, 1):>8.4f}{topk_accuracy(probs, y_test, 3):>8.4f}")
+    print(f"{'streaming (state carried across)':<38}{topk_accuracy(carried[:, -1], y_test, 1):>8.4f}{topk_accuracy(carried[:, -1], y_test, 3):>8.4f}")
+    print(f"max |stepped - window| = {step_diff:.2e}")
+
+    sample = X_test[:1]
+    frame = X_test[0, :1]
+    state = streaming.initial_state(batch_size=1)
+    window_p50, window_p99 = time_calls(lambda: baseline_predict(sample), args.iterations)
+    step_p50, step_p99 = time_calls(lambda: streaming.step(frame, state), args.iterations)
+    print(f"Per-frame cost: baseline window re-run p50 {window_p50:.3f} ms / p99 {window_p99:.3f} ms, "
+          f"streaming step p50 {step_p50:.3f} ms / p99 {step_p99:.3f} ms ({window_p50 / step_p50:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
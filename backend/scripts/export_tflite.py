@@ -0,0 +1,51 @@
+"""
+Export an already-trained Keras model (simple or advanced architecture) to TFLite.
+
+Usage (from backend/):
+  python scripts/export_tflite.py --model models/best_model.h5 --output-dir models
+
+Options:
+  --model PATH       Keras model file (.h5 or .keras)
+  --output-dir PATH  where model_<variant>.tflite files are written (default: models)
+  --variants LIST    comma separated subset of float32,float16,dynamic_int8 (default: all)
+
+New training runs export these automatically from train_model.py (disable with --skip_tflite).
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tensorflow as tf  # noqa: E402
+
+from train_model import TFLITE_VARIANTS, export_tflite_models  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', required=True, help='Keras model file')
+    parser.add_argument('--output-dir', default='models', help='Output directory')
+    parser.add_argument('--variants', default=','.join(TFLITE_VARIANTS), help='Variants to export')
+    args = parser.parse_args()
+
+    variants = [v for v in args.variants.split(',') if v]
+    unknown = set(variants) - set(TFLITE_VARIANTS)
+    if unknown:
+        raise SystemExit(f"Unknown variants: {sorted(unknown)}. Expected a subset of {TFLITE_VARIANTS}")
+
+    model = tf.keras.models.load_model(args.model)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    exported = export_tflite_models(model, output_dir, variants=variants)
+    for variant, path in exported.items():
+        print(f"{variant:<14} {path}  {path.stat().st_size / 1024:.0f} KB")
+
+    if len(exported) != len(variants):
+        raise SystemExit("Some variants failed to export, see log above")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Measure the cost saving and the feature drift of pose-detection decimation on a recorded video.
+
+Usage (from backend/):
+  python scripts/measure_pose_decimation.py --video path/to/practice.mp4 --every 5
+
+Options:
+  --video PATH       video to replay (any format cv2.VideoCapture reads)
+  --every N          run pose every N frames (POSE_EVERY_N_FRAMES, default 5)
+  --motion T         hand-centroid motion that forces a pose run (POSE_MOTION_THRESHOLD, default 0.1)
+  --smoothing S      weight of a new shoulder measurement (POSE_SMOOTHING, default 0.5)
+  --max-frames N     stop after N frames (default: whole video)
+
+Every frame is run through two extractors: the reference one runs pose on every frame,
+the decimated one uses a ShoulderTracker. Reported:
+  - mean per-frame extraction time of both
+  - fraction of frames on which the decimated extractor ran pose
+  - shoulder-center drift measured by the tracker whenever pose re-ran
+  - landmark feature error (decimated vs reference) on frames with hands
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from landmark_extractor import EnhancedLandmarkExtractor  # noqa: E402
+from shoulder_tracking import ShoulderTracker  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--video', required=True)
+    parser.add_argument('--every', type=int, default=5)
+    parser.add_argument('--motion', type=float, default=0.1)
+    parser.add_argument('--smoothing', type=float, default=0.5)
+    parser.add_argument('--max-frames', type=int, default=None)
+    args = parser.parse_args()
+
+    cap = cv2.VideoCapture(args.video)
+    if not cap.isOpened():
+        raise SystemExit(f"Cannot open {args.video}")
+
+    reference = EnhancedLandmarkExtractor()
+    decimated = EnhancedLandmarkExtractor()
+    tracker = ShoulderTracker(every_n_frames=args.every, motion_threshold=args.motion, smoothing=args.smoothing)
+
+    reference_seconds = decimated_seconds = 0.0
+    errors = []
+    frames = 0
+
+    while args.max_frames is None or frames < args.max_frames:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frame = cv2.resize(frame, (640, 480))
+        frames += 1
+
+        start = time.perf_counter()
+        reference_vector, reference_hands, _ = reference.extract_hand_landmarks(frame)
+        reference_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        decimated_vector, decimated_hands, _ = decimated.extract_hand_landmarks(frame, shoulder_tracker=tracker)
+        decimated_seconds += time.perf_counter() - start
+
+        if reference_hands and decimated_hands:
+            # Only x/y move with the shoulder center, z is passed through
+            xy = np.ones(len(reference_vector), dtype=bool)
+            xy[2::3] = False
+            present = xy & (reference_vector != 0) & (decimated_vector != 0)
+            if np.any(present):
+                errors.append(np.abs(decimated_vector[present] - reference_vector[present]))
+
+    cap.release()
+    if not frames:
+        raise SystemExit("No frames read")
+
+    stats = tracker.stats.snapshot()
+    print(f"Frames: {frames}  pose every {args.every} frames, motion threshold {args.motion}")
+    print(f"Extraction per frame: reference {reference_seconds / frames * 1000:.2f} ms, "
+          f"decimated {decimated_seconds / frames * 1000:.2f} ms "
+          f"({1 - decimated_seconds / reference_seconds:.0%} saved)")
+    print(f"Pose ran on {stats['pose_runs']}/{stats['frames']} frames ({stats['pose_run_ratio']:.0%})")
+
+    drift = stats['drift']
+    print(f"Tracked-center drift at re-measurement: mean {drift['mean']:.4f}, "
+          f"{drift['count']} samples, cumulative buckets {drift['buckets']}")
+
+    if errors:
+        errors = np.concatenate(errors)
+        print(f"Landmark x/y feature error on {len(errors)} values: mean {errors.mean():.4f}, "
+              f"p95 {np.percentile(errors, 95):.4f}, max {errors.max():.4f}")
+    else:
+        print("No frames with hands detected by both extractors, feature error not measured")
+
+
+if __name__ == '__main__':
+    main()
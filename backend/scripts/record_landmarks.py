@@ -13,7 +13,7 @@ Options:
   --auto               auto-record samples with countdown (no keypress)
   --camera IDX         camera index for cv2.VideoCapture (default 0)
 
-This script imports the `EnhancedLandmarkExtractor` from `backend/app.py` to ensure landmarks are extracted the same way the server does.
+This script imports the `EnhancedLandmarkExtractor` from `backend/landmark_extractor.py` to ensure landmarks are extracted the same way the server does.
 """
 
 import argparse
@@ -23,12 +23,12 @@ import numpy as np
 import cv2
 from pathlib import Path
 
-# Import the landmark extractor implemented in app.py
+# Import the landmark extractor the server uses (landmark_extractor.py)
 # Run this script from backend/ (or ensure backend is on PYTHONPATH)
 try:
-    from app import EnhancedLandmarkExtractor, FEATURE_DIM
+    from landmark_extractor import EnhancedLandmarkExtractor, FEATURE_DIM
 except Exception as e:
-    raise SystemExit("Failed to import EnhancedLandmarkExtractor from app.py. Run this script from the backend directory. Error: %s" % e)
+    raise SystemExit("Failed to import EnhancedLandmarkExtractor from landmark_extractor.py. Run this script from the backend directory. Error: %s" % e)
 
 
 def next_index_for_label(folder: Path, label: str):
@@ -0,0 +1,104 @@
+"""
+Cold-start report for the serving process: import time per module and time to first prediction.
+
+Usage (from backend/):
+  python scripts/startup_report.py
+  INFERENCE_BACKEND=numpy python scripts/startup_report.py --top 15 --load
+
+Options:
+  --module NAME   module whose import is measured (default: app)
+  --top N         number of top-level modules listed (default 20)
+  --load          also time load_mlops_artifacts() and the first landmark extractor
+
+Imports are measured with `python -X importtime` in a fresh interpreter, so the
+numbers are a real cold start. Per-module times are cumulative (they include the
+module's own imports) and are listed for modules imported directly by the
+measured module or its first-party dependencies.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_imports(module):
+    """Run `import module` under -X importtime, returns ([(name, depth, cumulative_seconds)], wall_seconds)"""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BACKEND_ROOT, capture_output=True, text=True, env=os.environ.copy()
+    )
+    wall_seconds = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            _, cumulative_us, indent, name = match.groups()
+            entries.append((name, (len(indent) - 1) // 2, int(cumulative_us) / 1e6))
+    return entries, wall_seconds
+
+
+def first_party_modules():
+    return {path.stem for path in BACKEND_ROOT.glob('*.py')}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--load', action='store_true')
+    args = parser.parse_args()
+
+    entries, wall_seconds = measure_imports(args.module)
+    local = first_party_modules()
+
+    # -X importtime prints children before their parent; keep the modules imported
+    # by first-party code, i.e. whose parent line (next shallower entry) is first-party
+    imported_by_local = {}
+    for i, (name, depth, cumulative) in enumerate(entries):
+        parent = next((entry for entry in entries[i + 1:] if entry[1] < depth), None)
+        if depth == 0 or (parent is not None and parent[0] in local):
+            top_name = name.split('.')[0]
+            imported_by_local[top_name] = max(imported_by_local.get(top_name, 0.0), cumulative)
+
+    total = next((cumulative for name, depth, cumulative in entries if name == args.module and depth == 0), 0.0)
+    print(f"import {args.module}: {total:.2f} s (interpreter wall time {wall_seconds:.2f} s)")
+    print(f"{'module':<32}{'cumulative s':>14}")
+    for name, seconds in sorted(imported_by_local.items(), key=lambda item: -item[1])[:args.top]:
+        if name != args.module:
+            print(f"{name:<32}{seconds:>14.3f}")
+
+    if args.load:
+        sys.path.insert(0, str(BACKEND_ROOT))
+        os.chdir(BACKEND_ROOT)
+        import importlib
+
+        start = time.perf_counter()
+        app = importlib.import_module(args.module)
+        import_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded = app.load_mlops_artifacts()
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        app.get_landmark_extractor()
+        extractor_seconds = time.perf_counter() - start
+
+        print(f"In-process: import {import_seconds:.2f} s, load_mlops_artifacts {load_seconds:.2f} s "
+              f"({'ok' if loaded else 'failed'}), first landmark extractor {extractor_seconds:.2f} s, "
+              f"total {import_seconds + load_seconds + extractor_seconds:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
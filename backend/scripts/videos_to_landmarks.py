@@ -12,7 +12,7 @@ Options:
   --camera IDX       (not used) kept for parity with other scripts
 
 Notes:
-- This script imports `EnhancedLandmarkExtractor` from `app.py` to ensure exact same extraction logic.
+- This script imports `EnhancedLandmarkExtractor` from `landmark_extractor.py` (the module the server uses) to ensure exact same extraction logic.
 - For each video, it samples `frames` frames uniformly across the video and saves a single .npy array of shape (frames, FEATURE_DIM) in `output-dir/<label>/`.
 - Filenames are saved as `<label> (1).npy`, `<label> (2).npy` etc.
 """
@@ -25,9 +25,10 @@ import math
 import sys
 
 try:
-    from app import EnhancedLandmarkExtractor, FEATURE_DIM
+    from frame_decode import FrameDecoder
+    from landmark_extractor import EnhancedLandmarkExtractor, FEATURE_DIM
 except Exception as e:
-    raise SystemExit("Failed to import EnhancedLandmarkExtractor from app.py. Run this from the backend directory. Error: %s" % e)
+    raise SystemExit("Failed to import EnhancedLandmarkExtractor from landmark_extractor.py. Run this from the backend directory. Error: %s" % e)
 
 
 VIDEO_EXTS = ['.mp4', '.mov', '.avi', '.mkv', '.MP4', '.MOV', '.AVI', '.MKV']
@@ -66,6 +67,9 @@ def sample_frame_indices(total_frames: int, desired: int):
 
 
 def process_video(video_path: Path, extractor: EnhancedLandmarkExtractor, frames_needed: int):
+    # Sampled frames are extracted one at a time, so they share one RGB buffer
+    decoder = FrameDecoder()
+    rgb_frame = decoder.new_buffer()
     cap = cv2.VideoCapture(str(video_path))
     if not cap.isOpened():
         print(f"Failed to open video: {video_path}")
@@ -88,8 +92,8 @@ def process_video(video_path: Path, extractor: EnhancedLandmarkExtractor, frames
         sampled = []
         for idx in indices:
             frame = frames[idx]
-            frame = cv2.resize(frame, (640, 480))
-            landmark_vector, _, _ = extractor.extract_hand_landmarks(frame)
+            frame = decoder.convert(frame, out=rgb_frame)
+            landmark_vector, _, _ = extractor.extract_hand_landmarks(frame, rgb=True)
             if landmark_vector is None or landmark_vector.shape[0] != FEATURE_DIM:
                 landmark_vector = np.zeros(FEATURE_DIM, dtype=np.float32)
             sampled.append(landmark_vector.astype(np.float32))
@@ -105,8 +109,8 @@ def process_video(video_path: Path, extractor: EnhancedLandmarkExtractor, frames
             # pad with zeros
             sampled.append(np.zeros(FEATURE_DIM, dtype=np.float32))
             continue
-        frame = cv2.resize(frame, (640, 480))
-        landmark_vector, _, _ = extractor.extract_hand_landmarks(frame)
+        frame = decoder.convert(frame, out=rgb_frame)
+        landmark_vector, _, _ = extractor.extract_hand_landmarks(frame, rgb=True)
         if landmark_vector is None or landmark_vector.shape[0] != FEATURE_DIM:
             landmark_vector = np.zeros(FEATURE_DIM, dtype=np.float32)
         sampled.append(landmark_vector.astype(np.float32))
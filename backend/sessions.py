@@ -0,0 +1,168 @@
+"""
+Per-session frame buffers for real-time sign recognition
+Each client session owns a preallocated float32 ring of landmark vectors
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+
+class SessionBuffer:
+    """Preallocated (sequence_length, feature_dim) ring buffer for one client session"""
+
+    def __init__(self, session_id, sequence_length, feature_dim, prediction_history=5):
+        self.session_id = session_id
+        self.sequence_length = sequence_length
+        self.feature_dim = feature_dim
+
+        self.frames = np.zeros((sequence_length, feature_dim), dtype=np.float32)
+        self.window = np.zeros((sequence_length, feature_dim), dtype=np.float32)
+        self.cursor = 0
+        self.count = 0
+
+        self.predictions = deque(maxlen=prediction_history)
+
+        # Recurrent state and latest output for streaming (causal) models, owned by the app
+        self.stream_state = None
+        self.stream_probs = None
+        self.stream_version = None  # Model version stream_state was built with
+        self.stream_steps = 0  # Frames stream_state has seen since it was built
+
+        # Per-session ShoulderTracker / HandRoiTracker / FrameCache when those modes are on, created by the app
+        self.shoulder_tracker = None
+        self.hand_roi = None
+        self.frame_cache = None
+        self.extraction_stream = None  # Key of this session's trackers in the extraction processes
+
+        self.last_access = time.monotonic()
+
+        # Serialises requests from the same session (buffer writes + scaler input)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def ready(self):
+        return self.count == self.sequence_length
+
+    @property
+    def nbytes(self):
+        return self.frames.nbytes + self.window.nbytes
+
+    def append(self, landmark_vector=None):
+        """Write one frame at the cursor, a missing vector is stored as zeros"""
+        if landmark_vector is None:
+            self.frames[self.cursor] = 0.0
+        else:
+            self.frames[self.cursor] = landmark_vector
+
+        self.cursor = (self.cursor + 1) % self.sequence_length
+        if self.count < self.sequence_length:
+            self.count += 1
+
+    def ordered(self):
+        """Return the buffered frames oldest-first
+
+        The result is an internal array that is overwritten on the next call,
+        callers must copy it if they need to keep it.
+        """
+        split = self.sequence_length - self.cursor
+        self.window[:split] = self.frames[self.cursor:]
+        self.window[split:] = self.frames[:self.cursor]
+        return self.window
+
+    def reset(self):
+        self.frames.fill(0.0)
+        self.cursor = 0
+        self.count = 0
+        self.predictions.clear()
+        self.stream_state = None
+        self.stream_probs = None
+        self.stream_version = None
+        self.stream_steps = 0
+        self.shoulder_tracker = None
+        self.hand_roi = None
+        self.frame_cache = None
+        self.extraction_stream = None
+
+
+class SessionStore:
+    """Thread-safe LRU store of SessionBuffers with idle TTL and a memory cap"""
+
+    def __init__(self, sequence_length, feature_dim, idle_ttl=300.0, max_bytes=64 * 1024 * 1024):
+        self.sequence_length = sequence_length
+        self.feature_dim = feature_dim
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+
+        probe = SessionBuffer(None, sequence_length, feature_dim)
+        self.session_nbytes = probe.nbytes
+        self.max_sessions = max(1, max_bytes // self.session_nbytes)
+
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted_idle = 0
+        self.evicted_lru = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    @property
+    def memory_bytes(self):
+        return len(self._sessions) * self.session_nbytes
+
+    def get(self, session_id):
+        """Return the buffer for session_id, creating it (and evicting others) if needed"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+
+            session = self._sessions.get(session_id)
+            if session is None:
+                while len(self._sessions) >= self.max_sessions:
+                    self._sessions.popitem(last=False)
+                    self.evicted_lru += 1
+                session = SessionBuffer(session_id, self.sequence_length, self.feature_dim)
+                self._sessions[session_id] = session
+            else:
+                self._sessions.move_to_end(session_id)
+
+            session.last_access = now
+            return session
+
+    def peek(self, session_id):
+        """Return the buffer for session_id without creating it or touching its LRU position"""
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def discard(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def reset(self, session_id):
+        session = self.peek(session_id)
+        if session is None:
+            return False
+        with session.lock:
+            session.reset()
+        return True
+
+    def evict_idle(self):
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def _evict_idle(self, now):
+        # Sessions are kept in access order, so idle ones are always at the front
+        evicted = 0
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest.last_access < self.idle_ttl:
+                break
+            self._sessions.popitem(last=False)
+            evicted += 1
+        self.evicted_idle += evicted
+        return evicted
@@ -0,0 +1,81 @@
+"""
+Shoulder-center tracking for pose-detection decimation
+Hand landmarks are normalized around the shoulder center, which barely moves during
+a practice session. ShoulderTracker keeps a smoothed per-session center and only asks
+for a new pose measurement every N frames, or when the hands moved far enough that
+the body probably moved too. Centers are in normalized image coordinates, the same
+units as the x/y landmark features, so the measured drift is the feature error.
+"""
+
+import numpy as np
+
+from metrics import Counter, Histogram
+
+DRIFT_BUCKETS = (0.0025, 0.005, 0.01, 0.02, 0.03, 0.05, 0.1, 0.2)
+
+
+class PoseDecimationStats:
+    """Counters shared by all trackers: frames seen, pose runs and measured drift"""
+
+    def __init__(self):
+        self.frames = Counter()
+        self.pose_runs = Counter()
+        # Distance between the cached center and a fresh measurement, observed every time pose runs
+        self.drift_histogram = Histogram(DRIFT_BUCKETS)
+
+    def snapshot(self):
+        frames = self.frames.value
+        return {
+            "frames": frames,
+            "pose_runs": self.pose_runs.value,
+            "pose_run_ratio": self.pose_runs.value / frames if frames else 0.0,
+            "drift": self.drift_histogram.snapshot()
+        }
+
+
+class ShoulderTracker:
+    """Smoothed shoulder center for one session, re-measured every N frames or on large hand motion"""
+
+    def __init__(self, every_n_frames=5, motion_threshold=0.1, smoothing=0.5, stats=None):
+        self.every_n_frames = max(1, every_n_frames)
+        self.motion_threshold = motion_threshold
+        self.smoothing = smoothing
+        self.stats = stats or PoseDecimationStats()
+
+        self.center = None  # None until pose has found a body, callers fall back to their default
+        self.anchor = None  # Hand centroid when pose last ran
+        self.frames_since_pose = None  # None until pose has run once
+
+    def needs_pose(self, hand_centroid=None):
+        """Whether the current frame should run pose detection"""
+        self.stats.frames.inc()
+
+        if self.frames_since_pose is None or self.frames_since_pose + 1 >= self.every_n_frames:
+            return True
+        if hand_centroid is None:
+            return False
+        if self.anchor is None:
+            # Hands just came into view, the body may have moved while they were out
+            return True
+        return float(np.hypot(*(hand_centroid - self.anchor))) > self.motion_threshold
+
+    def update(self, measured_center, hand_centroid=None):
+        """Record a pose result (None when no body was found), returns the center to use"""
+        self.stats.pose_runs.inc()
+        self.frames_since_pose = 0
+        self.anchor = hand_centroid
+
+        if measured_center is not None:
+            measured_center = np.asarray(measured_center, dtype=np.float64)
+            if self.center is None:
+                self.center = measured_center
+            else:
+                self.stats.drift_histogram.observe(float(np.hypot(*(measured_center - self.center))))
+                self.center = self.smoothing * measured_center + (1.0 - self.smoothing) * self.center
+
+        return self.center
+
+    def skip(self):
+        """Reuse the cached center for a frame without pose detection"""
+        self.frames_since_pose += 1
+        return self.center
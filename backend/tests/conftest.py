@@ -0,0 +1,72 @@
+"""
+Shared fixtures: a small NumPy-engine model bundle in a temporary directory and the app serving it
+"""
+
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+WORDS = ['hello', 'thanks', 'yes']
+SEQUENCE_LENGTH = 30
+FEATURE_DIM = 126
+
+
+@pytest.fixture(scope='session')
+def artifact_dirs(tmp_path_factory):
+    """models/ and artifacts/ with an attention-pooling model, a fitted scaler and word mappings"""
+    from sklearn.preprocessing import StandardScaler
+
+    from numpy_engine import save_ops
+
+    root = tmp_path_factory.mktemp('bundle')
+    models_dir, artifacts_dir = root / 'models', root / 'artifacts'
+    models_dir.mkdir()
+    artifacts_dir.mkdir()
+
+    rng = np.random.default_rng(0)
+    ops = [
+        {'type': 'attention', 'kernel': rng.normal(size=FEATURE_DIM), 'bias': np.zeros(1), 'activation': 'tanh'},
+        {'type': 'dense', 'kernel': rng.normal(size=(FEATURE_DIM, len(WORDS))), 'bias': np.zeros(len(WORDS)),
+         'activation': 'softmax'},
+    ]
+    save_ops(ops, models_dir / 'model_numpy.npz', (SEQUENCE_LENGTH, FEATURE_DIM))
+
+    with open(artifacts_dir / 'scaler.pkl', 'wb') as f:
+        pickle.dump(StandardScaler().fit(rng.normal(size=(64, FEATURE_DIM))), f)
+    with open(artifacts_dir / 'word_mappings.json', 'w') as f:
+        json.dump({'class_names': WORDS}, f)
+    return models_dir, artifacts_dir
+
+
+@pytest.fixture(scope='session')
+def app_module(artifact_dirs):
+    """The app module with the test bundle loaded (app reads its settings from the environment at import)"""
+    models_dir, artifacts_dir = artifact_dirs
+    os.environ.update(
+        INFERENCE_BACKEND='numpy',
+        MODELS_DIR=str(models_dir),
+        ARTIFACTS_DIR=str(artifacts_dir),
+        WARMUP='0',
+        MODEL_WATCH_INTERVAL='0',
+    )
+    import app
+    assert app.load_mlops_artifacts()
+    return app
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def landmark_rows():
+    return np.random.default_rng(1).uniform(-1, 1, (SEQUENCE_LENGTH, FEATURE_DIM)).round(4).tolist()
@@ -0,0 +1,51 @@
+"""BatchScheduler failure handling (short model outputs, predict() timeouts) and dispatch of lone requests"""
+
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import numpy as np
+import pytest
+
+from batching import BatchScheduler
+
+
+def test_short_output_fails_every_future_in_the_batch():
+    scheduler = BatchScheduler(max_batch=4, max_wait_ms=50)
+
+    def drop_last_row(inputs):
+        return np.zeros((len(inputs) - 1, 3))
+
+    futures = [scheduler.submit(np.zeros((30, 126)), drop_last_row) for _ in range(3)]
+
+    for future in futures:
+        with pytest.raises(ValueError, match='rows for a batch of'):
+            future.result(timeout=5)
+
+
+def test_predict_times_out_when_the_model_hangs():
+    scheduler = BatchScheduler(max_batch=1, max_wait_ms=0, timeout=0.2)
+    release = threading.Event()
+
+    def hang(inputs):
+        release.wait(5)
+        return np.zeros((len(inputs), 3))
+
+    try:
+        with pytest.raises(FutureTimeoutError):
+            scheduler.predict(np.zeros((30, 126)), hang)
+    finally:
+        release.set()
+
+
+def test_lone_request_is_not_held_for_max_wait():
+    scheduler = BatchScheduler(max_batch=8, max_wait_ms=1000)
+
+    def zero_rows(inputs):
+        return np.zeros((len(inputs), 3))
+
+    started = time.perf_counter()
+    scheduler.predict(np.zeros((30, 126)), zero_rows)
+
+    assert time.perf_counter() - started < 0.5
+    assert scheduler.batch_size_histogram.snapshot()['count'] == 1
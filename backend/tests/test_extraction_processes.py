@@ -0,0 +1,63 @@
+"""ExtractionProcessPool recovery from workers that die or hang"""
+
+import os
+import signal
+import time
+
+import numpy as np
+import pytest
+
+from extraction_processes import FRAME_SHAPE, ExtractionProcessPool
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionProcessPool(1, slots_per_process=1, timeout=5.0)
+    pool.warmup(np.zeros(FRAME_SHAPE, dtype=np.uint8))
+    yield pool
+    pool.close()
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+
+def test_dead_worker_is_replaced_without_a_new_frame(pool):
+    pool._processes[0].kill()
+
+    assert wait_for(lambda: pool.stats.restarts.value == 1 and pool._processes[0].is_alive())
+
+
+def test_hung_worker_is_restarted_and_its_slot_returned(pool):
+    frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+    os.kill(pool._processes[0].pid, signal.SIGSTOP)
+
+    with pytest.raises(TimeoutError):
+        pool.extract(frame)
+
+    assert pool.snapshot()['slots_in_use'] == 0
+    assert pool.stats.restarts.value == 1
+    _, hands_detected = pool.extract(frame)
+    assert hands_detected == 0
+
+
+def test_collector_survives_an_error_while_handling_a_result(pool, monkeypatch):
+    frame = np.zeros(FRAME_SHAPE, dtype=np.uint8)
+    complete = pool._complete
+    failures = []
+
+    def complete_then_fail(*args):
+        complete(*args)
+        if not failures:
+            failures.append(args)
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(pool, '_complete', complete_then_fail)
+
+    pool.extract(frame)
+    assert failures
+    _, hands_detected = pool.extract(frame)
+    assert hands_detected == 0
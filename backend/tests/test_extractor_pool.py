@@ -0,0 +1,84 @@
+"""ExtractorPool checkout, pinning and growth under concurrency"""
+
+import threading
+import time
+
+import pytest
+
+from extractor_pool import ExtractorPool
+
+
+class SlowFactory:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.built = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        with self._lock:
+            self.built += 1
+            return object()
+
+
+def run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        results[index] = target(index)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def hold(pool, key, seconds=0.05):
+    with pool.checkout(key) as extractor:
+        time.sleep(seconds)
+        return extractor
+
+
+def test_unkeyed_checkouts_run_in_parallel():
+    pool = ExtractorPool(SlowFactory(), max_size=2)
+    extractors = run_concurrently(2, lambda _: hold(pool, None, 0.1))
+    assert extractors[0] is not extractors[1]
+    assert pool.snapshot()['pinned_sessions'] == 0
+
+
+def test_concurrent_first_checkouts_of_a_key_build_one_extractor():
+    factory = SlowFactory()
+    pool = ExtractorPool(factory, max_size=4)
+    extractors = run_concurrently(4, lambda _: hold(pool, 'session-a'))
+    assert factory.built == 1
+    assert len({id(extractor) for extractor in extractors}) == 1
+    assert sum(slot.sessions for slot in pool._slots) == 1
+
+
+def test_session_counts_match_pins():
+    pool = ExtractorPool(SlowFactory(delay=0.01), max_size=2)
+    run_concurrently(6, lambda i: hold(pool, f'session-{i % 3}', 0.01))
+    assert sum(slot.sessions for slot in pool._slots) == len(pool._pins) == 3
+    for i in range(3):
+        pool.forget(f'session-{i}')
+    assert all(slot.sessions == 0 for slot in pool._slots)
+
+
+def test_failed_build_releases_the_pin():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("graph init failed")
+        return object()
+
+    pool = ExtractorPool(factory, max_size=1)
+    with pytest.raises(RuntimeError):
+        hold(pool, 'session-a', 0)
+    assert hold(pool, 'session-a', 0) is not None
+    assert pool.snapshot()['size'] == 1
@@ -0,0 +1,32 @@
+"""Artifact fingerprints and the hot-reload watcher"""
+
+import threading
+
+from model_bundle import ARTIFACTS_COMPLETE, ArtifactWatcher, artifacts_fingerprint, mark_artifacts_complete
+
+
+def test_fingerprint_skips_transient_export_directory(tmp_path):
+    (tmp_path / 'model.keras').write_bytes(b'model')
+    before = artifacts_fingerprint(tmp_path)
+
+    (tmp_path / 'tflite_export').mkdir()
+    (tmp_path / 'tflite_export' / 'saved_model.pb').write_bytes(b'scratch')
+
+    assert artifacts_fingerprint(tmp_path) == before
+
+
+def test_watcher_reloads_only_when_the_marker_changes(tmp_path):
+    mark_artifacts_complete(tmp_path, [])
+    reloaded = threading.Event()
+    watcher = ArtifactWatcher([tmp_path], reloaded.set, interval=0.02, marker=tmp_path / ARTIFACTS_COMPLETE)
+    watcher.start()
+    try:
+        # A half-written bundle: new model, labels not written yet
+        (tmp_path / 'model.keras').write_bytes(b'new model')
+        assert not reloaded.wait(0.3)
+
+        (tmp_path / 'labels.json').write_text('{}')
+        mark_artifacts_complete(tmp_path, ['labels.json', 'model.keras'])
+        assert reloaded.wait(2)
+    finally:
+        watcher.stop()
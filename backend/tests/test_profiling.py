@@ -0,0 +1,33 @@
+"""Per-request stage profile (?profile=1) of /api/predict"""
+
+import base64
+
+import cv2
+import numpy as np
+
+DECODE_STAGES = ('frame_digest', 'imdecode', 'resize', 'color_convert')
+
+
+def jpeg_frames(count, size=(1280, 720)):
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        image = cv2.GaussianBlur(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8), (9, 9), 0)
+        frames.append(base64.b64encode(cv2.imencode('.jpg', image)[1].tobytes()).decode('ascii'))
+    return frames
+
+
+def test_profile_keeps_decode_stages_with_prefetch(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, 'REQUEST_PROFILING', True)
+    assert app_module.DECODE_PREFETCHER is not None
+
+    response = client.post('/api/predict?profile=1', json={'frames': jpeg_frames(3), 'target_word': 'hello'})
+    assert response.status_code == 200
+    timings = response.get_json()['timings']
+
+    for stage in DECODE_STAGES + ('decode_wait', 'hands'):
+        assert stage in timings['stages_ms'], stage
+    assert timings['stages_ms']['imdecode']['calls'] == 3
+    for frame in timings['frames']:
+        assert set(DECODE_STAGES) <= set(frame)
+        assert frame['input_size'] == '1280x720'
@@ -0,0 +1,20 @@
+"""Access control of POST /api/reload"""
+
+
+def test_reload_is_disabled_without_a_token(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, 'RELOAD_TOKEN', '')
+
+    response = client.post('/api/reload')
+    assert response.status_code == 403
+    assert 'disabled' in response.get_json()['error']
+
+
+def test_reload_requires_the_configured_token(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, 'RELOAD_TOKEN', 'secret')
+
+    assert client.post('/api/reload').status_code == 403
+    assert client.post('/api/reload', headers={'X-Reload-Token': 'wrong'}).status_code == 403
+
+    response = client.post('/api/reload', headers={'X-Reload-Token': 'secret'})
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
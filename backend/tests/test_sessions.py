@@ -0,0 +1,37 @@
+"""Per-client session buffers on /api/predict/sign"""
+
+
+def post_row(client, row, **kwargs):
+    response = client.post('/api/predict/sign', json={'landmarks': row, 'render_mode': 'none'}, **kwargs)
+    assert response.status_code == 200
+    return response
+
+
+def test_clients_without_session_id_get_separate_buffers(app_module, landmark_rows):
+    # Both test clients come from the same address, like browsers behind the nginx proxy
+    first = app_module.app.test_client()
+    second = app_module.app.test_client()
+
+    issued = post_row(first, landmark_rows[0]).headers.get('Set-Cookie', '')
+    assert issued.startswith('session_id=')
+    for row in landmark_rows[1:3]:
+        post_row(first, row)
+
+    response = post_row(second, landmark_rows[0])
+    assert response.get_json()['buffer_status']['current_size'] == 1
+    assert first.get_cookie('session_id').value != second.get_cookie('session_id').value
+
+
+def test_cookie_keeps_the_session(client, landmark_rows):
+    post_row(client, landmark_rows[0])
+    response = post_row(client, landmark_rows[1])
+    assert 'Set-Cookie' not in response.headers
+    assert response.get_json()['buffer_status']['current_size'] == 2
+
+
+def test_session_header_is_used_as_given(app_module, client, landmark_rows):
+    post_row(client, landmark_rows[0], headers={'X-Session-ID': 'tab-1'})
+    other = app_module.app.test_client()
+    response = post_row(other, landmark_rows[1], headers={'X-Session-ID': 'tab-1'})
+    assert 'Set-Cookie' not in response.headers
+    assert response.get_json()['buffer_status']['current_size'] == 2
@@ -0,0 +1,49 @@
+"""Streaming inference: per-session recurrent state against windowed prediction"""
+
+import numpy as np
+import pytest
+
+from conftest import FEATURE_DIM, SEQUENCE_LENGTH, WORDS
+from inference import NumpyInferenceBackend
+from numpy_engine import save_ops
+from sessions import SessionBuffer
+
+UNITS = 8
+
+
+@pytest.fixture
+def streaming_bundle(app_module, tmp_path):
+    rng = np.random.default_rng(2)
+    ops = [
+        {'type': 'lstm', 'return_sequences': False, 'forward': {
+            'kernel': rng.normal(scale=0.3, size=(FEATURE_DIM, 4 * UNITS)),
+            'recurrent_kernel': rng.normal(scale=0.3, size=(UNITS, 4 * UNITS)),
+            'bias': np.zeros(4 * UNITS),
+            'activation': 'tanh',
+            'recurrent_activation': 'sigmoid',
+        }},
+        {'type': 'dense', 'kernel': rng.normal(size=(UNITS, len(WORDS))), 'bias': np.zeros(len(WORDS)),
+         'activation': 'softmax'},
+    ]
+    model = NumpyInferenceBackend(save_ops(ops, tmp_path / 'model_numpy.npz', (SEQUENCE_LENGTH, FEATURE_DIM)))
+    return app_module.BUNDLE._replace(model=model, streaming=True)
+
+
+def windowed(bundle, session):
+    sequence = bundle.scaler.transform(session.ordered()).reshape(1, SEQUENCE_LENGTH, FEATURE_DIM)
+    return bundle.model.predict(sequence)[0]
+
+
+def test_stream_state_is_rebuilt_every_window_and_matches_windowed_output(app_module, streaming_bundle):
+    session = SessionBuffer('stream', SEQUENCE_LENGTH, FEATURE_DIM)
+    frames = np.random.default_rng(3).uniform(-1, 1, (4 * SEQUENCE_LENGTH, FEATURE_DIM))
+
+    rebuilds = 0
+    for i, frame in enumerate(frames, start=1):
+        app_module.buffer_landmark_vector(session, streaming_bundle, frame, hands_detected=1)
+        assert session.stream_steps <= 2 * SEQUENCE_LENGTH - 1
+        if i == SEQUENCE_LENGTH or (i > SEQUENCE_LENGTH and session.stream_steps == SEQUENCE_LENGTH):
+            rebuilds += i > SEQUENCE_LENGTH
+            np.testing.assert_allclose(session.stream_probs, windowed(streaming_bundle, session), rtol=1e-4, atol=1e-6)
+
+    assert rebuilds == 3
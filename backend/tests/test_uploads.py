@@ -0,0 +1,21 @@
+"""Frame limits of multipart /api/predict uploads"""
+
+import io
+
+
+def multipart_frames(count):
+    return [(io.BytesIO(b'\xff\xd8not-a-real-jpeg'), f'frame{i}.jpg') for i in range(count)]
+
+
+def test_multipart_upload_over_frame_limit_is_rejected(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, 'MAX_UPLOAD_FRAMES', 2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("frames over the limit must not be extracted")
+
+    monkeypatch.setattr(app_module, 'extract_landmarks_from_encoded', fail)
+
+    response = client.post('/api/predict', data={'target_word': 'hello', 'frames': multipart_frames(3)},
+                           content_type='multipart/form-data')
+    assert response.status_code == 400
+    assert 'At most 2 frames' in response.get_json()['message']
@@ -0,0 +1,34 @@
+"""Message validation of the /ws/predict WebSocket"""
+
+import json
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+simple_websocket = pytest.importorskip('simple_websocket')
+
+
+@pytest.fixture
+def ws_url(app_module):
+    server = make_server('127.0.0.1', 0, app_module.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"ws://127.0.0.1:{server.server_port}/ws/predict"
+    server.shutdown()
+    thread.join()
+
+
+def test_non_string_frame_is_rejected_without_closing_the_socket(ws_url, landmark_rows):
+    ws = simple_websocket.Client.connect(ws_url)
+    try:
+        ws.send(json.dumps({'frame_base64': 12345}))
+        error = json.loads(ws.receive(timeout=5))
+        assert error == {"type": "error", "error": "'frame_base64' must be a string"}
+
+        ws.send(json.dumps({'landmarks': landmark_rows[0]}))
+        reply = json.loads(ws.receive(timeout=5))
+        assert reply['type'] == 'buffering'
+        assert reply['buffer_status']['current_size'] == 1
+    finally:
+        ws.close()
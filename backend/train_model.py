@@ -18,9 +18,14 @@ from pathlib import Path
 import argparse
 from datetime import datetime
 import os
+import shutil
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from inference import NUMPY_MODEL_FILE, TFLITE_VARIANTS, tflite_model_path
+from model_bundle import ARTIFACTS_COMPLETE, mark_artifacts_complete
+from numpy_engine import export_numpy_weights
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -103,6 +108,62 @@ class FixedSignLanguageTrainer:
         logger.info(f"✅ Simple model built with {model.count_params():,} parameters")
         return model
     
+    def build_streaming_model(self, num_classes):
+        """Build a causal (unidirectional) model that can be served one frame at a time
+
+        Every layer before the head only looks at past frames, so the LSTM state after
+        frame t is the same whether the window is run in one pass or stepped frame by frame.
+        The server carries that state per session (INFERENCE_BACKEND=numpy).
+        """
+        logger.info(f"🏗️ Building streaming (causal) model for {num_classes} classes...")
+        
+        model = models.Sequential([
+            # Input
+            layers.Input(shape=(SEQUENCE_LENGTH, FEATURE_DIM)),
+            
+            # Unidirectional LSTM layers, wider to make up for the missing backward pass
+            layers.LSTM(
+                192, return_sequences=True,
+                dropout=0.3, recurrent_dropout=0.2
+            ),
+            layers.BatchNormalization(),
+            
+            layers.LSTM(
+                128, return_sequences=False,
+                dropout=0.3, recurrent_dropout=0.2
+            ),
+            layers.BatchNormalization(),
+            
+            # Same dense head as the simple model
+            layers.Dense(256, activation='relu'),
+            layers.BatchNormalization(),
+            layers.Dropout(0.5),
+            
+            layers.Dense(128, activation='relu'),
+            layers.Dropout(0.4),
+            
+            layers.Dense(64, activation='relu'),
+            layers.Dropout(0.3),
+            
+            # Output layer
+            layers.Dense(num_classes, activation='softmax')
+        ])
+        
+        # Compile
+        model.compile(
+            optimizer=optimizers.Adam(learning_rate=LEARNING_RATE),
+            loss='categorical_crossentropy',
+            metrics=[
+                'accuracy',
+                tf.keras.metrics.TopKCategoricalAccuracy(k=3, name='top3_accuracy'),
+                tf.keras.metrics.TopKCategoricalAccuracy(k=5, name='top5_accuracy')
+            ]
+        )
+        
+        self.model = model
+        logger.info(f"✅ Streaming model built with {model.count_params():,} parameters")
+        return model
+    
     def build_advanced_model(self, num_classes):
         """Build advanced model with proper attention using Functional API"""
         logger.info(f"🏗️ Building advanced model for {num_classes} classes...")
@@ -332,6 +393,18 @@ class FixedSignLanguageTrainer:
         # Save model in H5 format for compatibility
         self.model.save(str(self.models_dir / 'model.h5'))
         
+        # Export TFLite variants for CPU serving (INFERENCE_BACKEND=tflite)
+        if self.config.get('export_tflite', True):
+            export_tflite_models(self.model, self.models_dir)
+        
+        # Export BatchNorm-folded weights for the TensorFlow-free engine (INFERENCE_BACKEND=numpy)
+        try:
+            export_numpy_weights(self.model, self.models_dir / NUMPY_MODEL_FILE)
+        except Exception as e:
+            logger.error(f"NumPy weights export failed, INFERENCE_BACKEND=numpy will not be available: {e}")
+            # A file left by an earlier run would pair the old weights with the new labels
+            (self.models_dir / NUMPY_MODEL_FILE).unlink(missing_ok=True)
+        
         # Save labels mapping
         labels_data = {
             'classes': label_encoder.classes_.tolist(),
@@ -343,9 +416,63 @@ class FixedSignLanguageTrainer:
         with open(self.models_dir / 'labels.json', 'w') as f:
             json.dump(labels_data, f, indent=2)
         
+        # Written last: a running server's artifact watcher reloads only when this marker changes
+        mark_artifacts_complete(self.models_dir, [
+            path.name for path in self.models_dir.iterdir() if path.is_file() and path.name != ARTIFACTS_COMPLETE
+        ])
+        
         logger.info("✅ Model artifacts saved")
 
 
+def export_tflite_models(model, output_dir, variants=TFLITE_VARIANTS):
+    """Export TFLite float32 / float16 / dynamic-range int8 models to output_dir/model_<variant>.tflite"""
+    output_dir = Path(output_dir)
+    exported = {}
+    
+    # Export a SavedModel with a fixed batch of 1 so the LSTMs lower to TFLite's fused builtin
+    # kernels (a dynamic batch dimension leaves TensorList ops that need the Flex delegate)
+    saved_model_dir = output_dir / 'tflite_export'
+    try:
+        archive = tf.keras.export.ExportArchive()
+        archive.track(model)
+        archive.add_endpoint(
+            'serve',
+            lambda inputs: model(inputs, training=False),
+            input_signature=[tf.TensorSpec([1, SEQUENCE_LENGTH, FEATURE_DIM], tf.float32)]
+        )
+        archive.write_out(str(saved_model_dir))
+    except Exception as e:
+        logger.error(f"TFLite SavedModel export failed, no TFLite models written: {e}")
+        shutil.rmtree(saved_model_dir, ignore_errors=True)
+        return exported
+    
+    for variant in variants:
+        try:
+            converter = tf.lite.TFLiteConverter.from_saved_model(str(saved_model_dir))
+            
+            if variant == 'float16':
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+                converter.target_spec.supported_types = [tf.float16]
+            elif variant == 'dynamic_int8':
+                # Dynamic-range quantization: int8 weights, float activations, no calibration data needed
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            
+            tflite_model = converter.convert()
+            
+            output_path = tflite_model_path(output_dir, variant)
+            with open(output_path, 'wb') as f:
+                f.write(tflite_model)
+            
+            exported[variant] = output_path
+            logger.info(f"✅ TFLite {variant} model saved ({len(tflite_model) / 1024:.0f} KB)")
+        
+        except Exception as e:
+            logger.error(f"TFLite {variant} export failed: {e}")
+    
+    shutil.rmtree(saved_model_dir, ignore_errors=True)
+    return exported
+
+
 def load_data(data_dir):
     """Load preprocessed data"""
     data_path = Path(data_dir)
@@ -375,10 +502,11 @@ def main():
     parser.add_argument('--artifacts_dir', type=str, default='artifacts')
     parser.add_argument('--models_dir', type=str, default='models')
     parser.add_argument('--experiments_dir', type=str, default='experiments')
-    parser.add_argument('--model_type', type=str, default='simple', choices=['simple', 'advanced'])
+    parser.add_argument('--model_type', type=str, default='simple', choices=['simple', 'advanced', 'streaming'])
     parser.add_argument('--epochs', type=int, default=MAX_EPOCHS)
     parser.add_argument('--batch_size', type=int, default=BATCH_SIZE)
     parser.add_argument('--learning_rate', type=float, default=LEARNING_RATE)
+    parser.add_argument('--skip_tflite', action='store_true', help='Do not export TFLite models')
     
     args = parser.parse_args()
     
@@ -396,6 +524,7 @@ def main():
         'epochs': args.epochs,
         'batch_size': args.batch_size,
         'learning_rate': args.learning_rate,
+        'export_tflite': not args.skip_tflite,
         'seed': SEED
     }
     
@@ -424,6 +553,8 @@ def main():
         # Build model
         if config['model_type'] == 'advanced':
             trainer.build_advanced_model(num_classes)
+        elif config['model_type'] == 'streaming':
+            trainer.build_streaming_model(num_classes)
         else:
             trainer.build_simple_model(num_classes)
         
@@ -0,0 +1,108 @@
+"""
+Word search index for the sign vocabulary
+Built once per label set: lowercase entries, a prefix trie for starts-with
+matches, an n-gram index for substring matches and a trie walk for typo
+(bounded edit distance) matches. Results keep the vocabulary order inside each
+bucket, the same ranking the linear scan in /api/search produced.
+"""
+
+NGRAM_MAX = 3  # Grams of 1..NGRAM_MAX characters are indexed
+
+
+class _TrieNode:
+    __slots__ = ('children', 'ids', 'word_ids')
+
+    def __init__(self):
+        self.children = {}
+        self.ids = []  # Words under this prefix, in vocabulary order
+        self.word_ids = []  # Words ending exactly here
+
+
+class WordSearchIndex:
+    """Exact / prefix / substring / fuzzy lookups over a fixed word list"""
+
+    def __init__(self, words):
+        self.words = list(words)
+        self.lowered = [word.lower() for word in self.words]
+        self.sorted_words = sorted(self.words)
+
+        self._root = _TrieNode()
+        self._ngrams = {}
+        for word_id, lowered in enumerate(self.lowered):
+            node = self._root
+            node.ids.append(word_id)
+            for char in lowered:
+                node = node.children.setdefault(char, _TrieNode())
+                node.ids.append(word_id)
+            node.word_ids.append(word_id)
+
+            grams = {lowered[i:i + n] for n in range(1, NGRAM_MAX + 1) for i in range(len(lowered) - n + 1)}
+            for gram in grams:
+                self._ngrams.setdefault(gram, []).append(word_id)
+
+    def __len__(self):
+        return len(self.words)
+
+    def _prefix_node(self, query):
+        node = self._root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _containing(self, query):
+        """Ids of words containing query, in vocabulary order"""
+        if len(query) <= NGRAM_MAX:
+            return self._ngrams.get(query, [])
+
+        postings = []
+        for i in range(len(query) - NGRAM_MAX + 1):
+            ids = self._ngrams.get(query[i:i + NGRAM_MAX])
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [word_id for word_id in sorted(candidates) if query in self.lowered[word_id]]
+
+    def search(self, query):
+        """(exact, starts_with, contains) word lists for a lowercase query
+
+        exact: word == query, starts_with: the other words with that prefix,
+        contains: words containing query anywhere but not at the start.
+        """
+        node = self._prefix_node(query)
+        exact_ids = set(node.word_ids) if node is not None else set()
+        prefix_ids = node.ids if node is not None else []
+
+        exact = [self.words[word_id] for word_id in prefix_ids if word_id in exact_ids]
+        starts_with = [self.words[word_id] for word_id in prefix_ids if word_id not in exact_ids]
+        contains = [self.words[word_id] for word_id in self._containing(query) if not self.lowered[word_id].startswith(query)]
+        return exact, starts_with, contains
+
+    def fuzzy(self, query, max_distance, exclude=()):
+        """Words within max_distance edits (Levenshtein) of query, closest first then vocabulary order
+
+        Walks the trie keeping one edit-distance row per node and prunes a branch
+        once every entry of its row exceeds max_distance.
+        """
+        matches = []
+        first_row = list(range(len(query) + 1))
+        stack = [(child, char, first_row) for char, child in self._root.children.items()]
+        while stack:
+            node, char, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(query) + 1):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous_row[column] + 1,
+                    previous_row[column - 1] + (query[column - 1] != char)
+                ))
+            if node.word_ids and row[-1] <= max_distance:
+                matches.extend((row[-1], word_id) for word_id in node.word_ids)
+            if min(row) <= max_distance:
+                stack.extend((child, next_char, row) for next_char, child in node.children.items())
+
+        excluded = set(exclude)
+        return [self.words[word_id] for _, word_id in sorted(matches) if self.words[word_id] not in excluded]
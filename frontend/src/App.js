@@ -503,9 +503,13 @@ const PracticePage = ({ word, onBack }) => {
       if (capturedFrames >= totalFrames) {
         clearInterval(captureInterval);
         setIsRecording(false);
-        setRecordedFrames(frames);
-        // Auto-analyze after recording
-        analyzeGesture(frames);
+        // JPEG encoding is async, wait for every frame before analyzing
+        Promise.all(frames).then(blobs => {
+          const jpegFrames = blobs.filter(Boolean);
+          setRecordedFrames(jpegFrames);
+          // Auto-analyze after recording
+          analyzeGesture(jpegFrames);
+        });
       }
     }, frameInterval);
   };
@@ -518,7 +522,8 @@ const PracticePage = ({ word, onBack }) => {
     canvasRef.current.height = 480;
     ctx.drawImage(videoRef.current, 0, 0, 640, 480);
     
-    return canvasRef.current.toDataURL('image/jpeg', 0.9);
+    // Raw JPEG blob, uploaded as multipart instead of a base64 data URL (33% smaller)
+    return new Promise(resolve => canvasRef.current.toBlob(resolve, 'image/jpeg', 0.9));
   };
 
   const analyzeGesture = async (frames) => {
@@ -534,18 +539,17 @@ const PracticePage = ({ word, onBack }) => {
     setIsAnalyzing(true);
 
     try {
+      const formData = new FormData();
+      formData.append('target_word', word);
+      frames.forEach((frame, i) => formData.append('frames', frame, `frame_${i}.jpg`));
+
+      // No Content-Type header: the browser sets the multipart boundary
       const response = await fetch(`${API}/predict`, {
         method: 'POST',
         headers: {
-          'Content-Type': 'application/json',
           'Authorization': `Bearer ${token}`
         },
-        body: JSON.stringify({
-          frames: frames,
-          target_word: word,
-          real_hand_detection: true,
-          enhanced_processing: true
-        })
+        body: formData
       });
 
       if (!response.ok) {